@@ -7,6 +7,11 @@ __version__ = "0.1.0"
 from . import core
 from . import waveforms
 from . import utils
+from . import io
+from . import receiver
+from . import analysis
+from . import channel_models
+from . import simulation
 from .core.signal_builder import NRSignalBuilder
 
 # Recommended usage in documentation
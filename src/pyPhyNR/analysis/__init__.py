@@ -0,0 +1,12 @@
+"""
+Measurements on generated and captured 5G NR signals
+"""
+
+from .evm import EVMReport, measure_evm, group_labels, modulation_plane
+
+__all__ = [
+    'EVMReport',
+    'measure_evm',
+    'group_labels',
+    'modulation_plane',
+]
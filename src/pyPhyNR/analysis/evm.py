@@ -0,0 +1,239 @@
+"""
+EVM and power measurements per channel type
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.channel_types import ChannelType
+from ..core.definitions import N_SYMBOLS_PER_SLOT
+
+def modulation_plane(channels: Sequence, shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Get the modulation (ModulationType.value) of every RE of modulated channels
+
+    Args:
+        channels: Physical channels placed on the grid (e.g. NRSignalBuilder.channels)
+        shape: Grid shape (subcarriers x symbols)
+
+    Returns:
+        int8 plane, 0 where no channel with a modulation is mapped
+    """
+    plane = np.zeros(shape, dtype=np.int8)
+    for channel in channels:
+        modulation = getattr(channel, 'modulation', None)
+        if modulation is None:
+            continue
+        subcarriers, _ = channel._subcarrier_index()
+        for time_indices in channel.time_indices.values():
+            plane[subcarriers, time_indices.start:time_indices.stop] = modulation.value
+    return plane
+
+def group_labels(channel_types: np.ndarray,
+                 modulations: Optional[np.ndarray] = None,
+                 split_modulation: Sequence[ChannelType] = (ChannelType.PDSCH,)) -> Tuple[np.ndarray, List[str]]:
+    """
+    Partition the grid REs into measurement groups
+
+    Every occupied RE gets exactly one group: its channel type, or for the
+    channel types in split_modulation, channel type plus modulation
+    (e.g. 'PDSCH_QAM256'). Empty REs get label 0.
+
+    Args:
+        channel_types: ChannelType.value plane (subcarriers x symbols)
+        modulations: Optional ModulationType.value plane (see modulation_plane)
+        split_modulation: Channel types measured separately per modulation
+
+    Returns:
+        Tuple of (int label plane with 1..n_groups, list of group names)
+    """
+    from ..core.modulation import ModulationType
+
+    keys = channel_types.astype(np.int32) * 256
+    if modulations is not None:
+        split = np.isin(channel_types, [ch.value for ch in split_modulation])
+        keys += np.where(split, modulations, 0)
+    keys[channel_types == ChannelType.EMPTY.value] = 0
+
+    # Keys are small, so a lookup table replaces a sort-based np.unique
+    present = np.flatnonzero(np.bincount(keys.reshape(-1)))
+    unique_keys = present[present != 0]
+    lookup = np.zeros(present[-1] + 1, dtype=np.intp)
+    lookup[unique_keys] = np.arange(1, unique_keys.size + 1)  # Label 0 is reserved for empty REs
+    labels = lookup[keys]
+
+    names = []
+    for key in unique_keys.tolist():
+        name = ChannelType(key // 256).name
+        if key % 256:
+            name += f"_{ModulationType(key % 256).name}"
+        names.append(name)
+
+    return labels, names
+
+@dataclass
+class EVMReport:
+    """
+    EVM and power measurements per RE group
+
+    Batched quantities have the capture dimensions of the measured grid in
+    front (none for a single capture). EVM values are ratios (not percent);
+    groups or symbols without REs hold NaN.
+    """
+    groups: List[str]             # Group names
+    n_re: np.ndarray              # (groups,) number of REs per group
+    rms_evm: np.ndarray           # (..., groups)
+    peak_evm: np.ndarray          # (..., groups)
+    epre_db: np.ndarray           # (..., groups) measured energy per RE
+    ref_epre_db: np.ndarray       # (groups,) reference energy per RE
+    symbol_evm: np.ndarray        # (..., groups, symbols)
+    slot_evm: np.ndarray          # (..., groups, slots)
+    error: np.ndarray = field(repr=False)  # (..., subcarriers, symbols) per-RE error vector
+    gain: Optional[np.ndarray] = None      # (...) removed common complex gain, if normalized
+
+    @property
+    def rms_evm_percent(self) -> np.ndarray:
+        return 100 * self.rms_evm
+
+    @property
+    def rms_evm_db(self) -> np.ndarray:
+        return 20 * np.log10(self.rms_evm)
+
+    def summary(self, capture: tuple = ()) -> Dict[str, dict]:
+        """
+        Get the per-group results of one capture
+
+        Args:
+            capture: Index of the capture in the batch (() for a single capture)
+
+        Returns:
+            Dictionary of group name -> measurements
+        """
+        return {
+            name: {
+                'n_re': int(self.n_re[g]),
+                'rms_evm_percent': float(100 * self.rms_evm[capture][g]),
+                'rms_evm_db': float(20 * np.log10(self.rms_evm[capture][g])),
+                'peak_evm_percent': float(100 * self.peak_evm[capture][g]),
+                'epre_db': float(self.epre_db[capture][g]),
+                'ref_epre_db': float(self.ref_epre_db[g]),
+            }
+            for g, name in enumerate(self.groups)
+        }
+
+def _group_sums(values: np.ndarray, labels: np.ndarray, n_labels: int) -> np.ndarray:
+    """
+    Sum values per (capture, label, symbol) with a single bincount
+
+    Args:
+        values: (captures, subcarriers, symbols) real values
+        labels: (subcarriers, symbols) labels in 0..n_labels-1
+        n_labels: Number of labels
+
+    Returns:
+        Sums of shape (captures, n_labels, symbols)
+    """
+    n_captures, _, n_symbols = values.shape
+    index = labels * n_symbols + np.arange(n_symbols)                  # (sc, sym)
+    index = index + (np.arange(n_captures) * n_labels * n_symbols)[:, None, None]
+    sums = np.bincount(index.reshape(-1), weights=values.reshape(-1),
+                       minlength=n_captures * n_labels * n_symbols)
+    return sums.reshape(n_captures, n_labels, n_symbols)
+
+def measure_evm(measured: np.ndarray,
+                reference,
+                channel_types: Optional[np.ndarray] = None,
+                modulations: Optional[np.ndarray] = None,
+                normalize: bool = False) -> EVMReport:
+    """
+    Measure EVM and EPRE of demodulated grids against a reference grid
+
+    All groups, symbols and slots are reduced together: the RE labels from
+    the channel-type plane index one bincount per quantity, so the cost does
+    not grow with the number of groups.
+
+    Args:
+        measured: Demodulated grid (subcarriers x symbols), or a batch of
+                  captures (... x subcarriers x symbols)
+        reference: Reference ResourceGrid, or its value plane
+        channel_types: ChannelType.value plane (required if reference is an array)
+        modulations: Optional ModulationType.value plane to split PDSCH per modulation
+        normalize: If True, remove the least-squares common complex gain of
+                   every capture before measuring (for captured signals)
+
+    Returns:
+        EVMReport
+    """
+    if hasattr(reference, 'values') and hasattr(reference, 'channel_types'):
+        channel_types = reference.channel_types if channel_types is None else channel_types
+        reference = reference.values
+    if channel_types is None:
+        raise ValueError("channel_types is required when reference is an array")
+
+    reference = np.asarray(reference)
+    measured = np.asarray(measured)
+    if measured.shape[-2:] != reference.shape:
+        raise ValueError(f"Measured grid shape {measured.shape} does not match reference {reference.shape}")
+    batch_shape = measured.shape[:-2]
+    n_subcarriers, n_symbols = reference.shape
+    measured = measured.reshape((-1, n_subcarriers, n_symbols))
+
+    labels, groups = group_labels(np.asarray(channel_types), modulations)
+    n_labels = len(groups) + 1
+    occupied = labels > 0
+
+    gain = None
+    if normalize:
+        correlation = np.sum(measured * np.conj(reference), axis=(1, 2), where=occupied)
+        gain = correlation / np.sum(np.abs(reference)**2, where=occupied)
+        measured = measured / gain[:, None, None]
+
+    error = measured - reference
+    error_power = np.abs(error)**2
+    ref_power = np.abs(reference)**2
+
+    # Per (capture, group, symbol) sums; label 0 (empty REs) is dropped
+    error_sums = _group_sums(error_power, labels, n_labels)[:, 1:]
+    measured_sums = _group_sums(np.abs(measured)**2, labels, n_labels)[:, 1:]
+    ref_sums = _group_sums(ref_power[None], labels, n_labels)[0, 1:]
+    re_counts = _group_sums(np.ones((1, n_subcarriers, n_symbols)), labels, n_labels)[0, 1:]
+
+    n_re = re_counts.sum(axis=-1)
+    ref_total = ref_sums.sum(axis=-1)
+    ref_mean = ref_total / np.maximum(n_re, 1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rms_evm = np.sqrt(error_sums.sum(axis=-1) / ref_total)
+        symbol_evm = np.sqrt(error_sums / ref_sums)
+
+        n_slots = -(-n_symbols // N_SYMBOLS_PER_SLOT)
+        pad = n_slots * N_SYMBOLS_PER_SLOT - n_symbols
+        slot_error = np.pad(error_sums, ((0, 0), (0, 0), (0, pad))).reshape(
+            error_sums.shape[:2] + (n_slots, N_SYMBOLS_PER_SLOT)).sum(axis=-1)
+        slot_ref = np.pad(ref_sums, ((0, 0), (0, pad))).reshape(
+            ref_sums.shape[0], n_slots, N_SYMBOLS_PER_SLOT).sum(axis=-1)
+        slot_evm = np.sqrt(slot_error / slot_ref)
+
+        epre_db = 10 * np.log10(measured_sums.sum(axis=-1) / n_re)
+        ref_epre_db = 10 * np.log10(ref_mean)
+
+    # Peak EVM: largest error of each group relative to the group's RMS reference level
+    peak_error = np.full((measured.shape[0], len(groups)), np.nan)
+    for g in range(len(groups)):
+        mask = labels == g + 1
+        peak_error[:, g] = error_power[:, mask].max(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        peak_evm = np.sqrt(peak_error / ref_mean)
+
+    return EVMReport(
+        groups=groups,
+        n_re=n_re.astype(int),
+        rms_evm=rms_evm.reshape(batch_shape + rms_evm.shape[1:]),
+        peak_evm=peak_evm.reshape(batch_shape + peak_evm.shape[1:]),
+        epre_db=epre_db.reshape(batch_shape + epre_db.shape[1:]),
+        ref_epre_db=ref_epre_db,
+        symbol_evm=symbol_evm.reshape(batch_shape + symbol_evm.shape[1:]),
+        slot_evm=slot_evm.reshape(batch_shape + slot_evm.shape[1:]),
+        error=error.reshape(batch_shape + error.shape[1:]),
+        gain=None if gain is None else gain.reshape(batch_shape),
+    )
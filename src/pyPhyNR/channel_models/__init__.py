@@ -0,0 +1,38 @@
+"""
+Propagation channel models (AWGN, multipath and 3GPP TDL fading)
+"""
+
+from .profiles import (
+    DelayProfile,
+    TDL_A,
+    TDL_B,
+    TDL_C,
+    TDL_D,
+    TDL_E,
+    TDL_PROFILES,
+    get_delay_profile,
+)
+from .fading import (
+    AWGNChannel,
+    MultipathChannel,
+    TDLChannel,
+    fractional_delay_basis,
+)
+from .frequency_domain import FrequencyDomainChannel, grid_sampling_points
+
+__all__ = [
+    'DelayProfile',
+    'TDL_A',
+    'TDL_B',
+    'TDL_C',
+    'TDL_D',
+    'TDL_E',
+    'TDL_PROFILES',
+    'get_delay_profile',
+    'AWGNChannel',
+    'MultipathChannel',
+    'TDLChannel',
+    'fractional_delay_basis',
+    'FrequencyDomainChannel',
+    'grid_sampling_points',
+]
@@ -0,0 +1,341 @@
+"""
+AWGN and multipath fading channels applied with overlap-save block convolution
+"""
+
+from typing import Iterable, Iterator, Optional, Sequence, Union
+import numpy as np
+from ..waveforms.fft import FFTBackend, get_fft_backend
+from .profiles import DelayProfile, get_delay_profile
+
+DEFAULT_SINC_HALF_WIDTH = 8  # Samples on either side of a fractional delay
+DEFAULT_N_SINUSOIDS = 16     # Sinusoids per fading process
+
+def fractional_delay_basis(sample_delays: np.ndarray,
+                           half_width: int = DEFAULT_SINC_HALF_WIDTH) -> np.ndarray:
+    """
+    Sampled impulse responses of (fractional) delays
+
+    Each delay becomes a Hann-windowed sinc; integer delays are exact unit
+    impulses. Samples before time zero are dropped so the channel adds no
+    bulk delay.
+
+    Args:
+        sample_delays: Tap delays in samples
+        half_width: Half length of the windowed sinc in samples
+
+    Returns:
+        FIR basis of shape (filter length, taps)
+    """
+    sample_delays = np.asarray(sample_delays, dtype=float)
+    length = int(np.ceil(sample_delays.max())) + half_width + 1
+    offset = np.arange(length)[:, None] - sample_delays[None, :]
+    window = np.where(np.abs(offset) < half_width + 1,
+                      0.5 * (1 + np.cos(np.pi * offset / (half_width + 1))), 0.0)
+    return np.sinc(offset) * window
+
+class AWGNChannel:
+    """
+    Additive white Gaussian noise
+
+    Noise is added independently to every sample (and every antenna of
+    multi-antenna input) in the precision of the input.
+    """
+
+    def __init__(self, snr_db: float, signal_power: Optional[float] = None,
+                 seed: Union[int, np.random.Generator, None] = None):
+        """
+        Initialize AWGN channel
+
+        Args:
+            snr_db: Signal-to-noise ratio in dB
+            signal_power: Signal power the SNR refers to (None: measured on each call;
+                          set it when streaming so all chunks get the same noise level)
+            seed: Seed or Generator for the noise
+        """
+        self.snr_db = snr_db
+        self.signal_power = signal_power
+        self.rng = np.random.default_rng(seed)
+        self.noise_var = None  # Noise variance of the last call
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Add noise to samples
+
+        Args:
+            samples: Complex samples of any shape
+
+        Returns:
+            Noisy samples
+        """
+        samples = np.asarray(samples)
+        power = self.signal_power if self.signal_power is not None else np.mean(np.abs(samples)**2)
+        self.noise_var = power / 10**(self.snr_db / 10)
+
+        real_dtype = np.float32 if samples.dtype == np.complex64 else np.float64
+        noise = self.rng.standard_normal((2,) + samples.shape, dtype=real_dtype)
+        noise *= np.sqrt(self.noise_var / 2)
+        return samples + (noise[0] + 1j * noise[1]).astype(samples.dtype, copy=False)
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Add noise to a stream of chunks"""
+        for chunk in chunks:
+            yield self.process(chunk)
+
+class MultipathChannel:
+    """
+    Static multipath channel with one or more receive antennas
+
+    The input is filtered by overlap-save block convolution: the signal is
+    cut into blocks at fixed absolute sample positions, every block is
+    transformed with one batched FFT, multiplied by the channel frequency
+    response of each receive antenna and transformed back. The last
+    filter_length - 1 input samples are carried between calls, so a signal
+    processed chunk by chunk gives the same output as in one call.
+
+    Subclasses with time-varying taps (TDLChannel) keep the taps constant
+    within a block (hop samples), evaluated at the block center.
+    """
+
+    def __init__(self,
+                 delays: Sequence[float],
+                 gains: Union[Sequence[complex], np.ndarray],
+                 sample_rate: float,
+                 n_rx: int = 1,
+                 fft_size: Optional[int] = None,
+                 fft_backend: Union[str, FFTBackend, None] = None,
+                 sinc_half_width: int = DEFAULT_SINC_HALF_WIDTH):
+        """
+        Initialize multipath channel
+
+        Args:
+            delays: Tap delays in seconds
+            gains: Complex tap gains, (taps,) or per antenna (n_rx, taps)
+            sample_rate: Sample rate in Hz
+            n_rx: Number of receive antennas
+            fft_size: Overlap-save block FFT size (default: 8 filter lengths, at least 4096)
+            fft_backend: FFT backend name or instance (None: the process-wide default)
+            sinc_half_width: Half length of the fractional delay interpolator
+        """
+        self.delays = np.atleast_1d(np.asarray(delays, dtype=float))
+        self.sample_rate = sample_rate
+        self.n_rx = n_rx
+        self._fft_backend = None if fft_backend is None else get_fft_backend(fft_backend)
+
+        gains = np.asarray(gains, dtype=complex)
+        if gains.shape[-1] != self.delays.size:
+            raise ValueError(f"{gains.shape[-1]} gains given for {self.delays.size} delays")
+        self.gains = np.broadcast_to(gains, (n_rx, self.delays.size)).copy()
+
+        self.fir_basis = fractional_delay_basis(self.delays * sample_rate, sinc_half_width)
+        self.filter_length = self.fir_basis.shape[0]
+        if fft_size is None:
+            fft_size = max(4096, 1 << int(np.ceil(np.log2(8 * self.filter_length))))
+        if fft_size < 2 * self.filter_length:
+            raise ValueError(f"fft_size {fft_size} is too small for a {self.filter_length}-sample filter")
+        self.fft_size = fft_size
+        self.hop = fft_size - self.filter_length + 1
+
+        self._static_response = None
+        self.reset()
+
+    @property
+    def fft_backend(self) -> FFTBackend:
+        """FFT backend used for the block convolution"""
+        return get_fft_backend(self._fft_backend)
+
+    @property
+    def time_varying(self) -> bool:
+        """True if the taps change over time"""
+        return False
+
+    def reset(self):
+        """Clear the filter state (start of a new stream)"""
+        self._history = np.zeros(self.filter_length - 1, dtype=complex)
+        self._position = 0
+
+    def tap_gains(self, times: np.ndarray) -> np.ndarray:
+        """
+        Get the tap gains at given times
+
+        Args:
+            times: Times in seconds since the start of the stream
+
+        Returns:
+            Complex gains of shape (times, n_rx, taps)
+        """
+        return np.broadcast_to(self.gains, (len(times),) + self.gains.shape)
+
+    def impulse_response(self, times: np.ndarray) -> np.ndarray:
+        """
+        Get the sampled impulse response at given times
+
+        Args:
+            times: Times in seconds since the start of the stream
+
+        Returns:
+            Impulse responses of shape (times, n_rx, filter_length)
+        """
+        return self.tap_gains(times) @ self.fir_basis.T
+
+    def frequency_response(self, frequencies: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """
+        Get the channel frequency response in closed form
+
+        H(f, t) = sum over taps of gain(t) * exp(-j 2 pi f delay), with the
+        exact tap delays (no fractional delay interpolation).
+
+        Args:
+            frequencies: Baseband frequencies in Hz
+            times: Times in seconds since the start of the stream
+
+        Returns:
+            Complex response of shape (n_rx, frequencies, times)
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        steering = np.exp(-2j * np.pi * self.delays[:, None] * frequencies[None, :])  # (taps, frequencies)
+        gains = np.ascontiguousarray(self.tap_gains(times).transpose(1, 0, 2))     # (n_rx, times, taps)
+        return (gains @ steering).transpose(0, 2, 1)
+
+    def _frequency_response(self, times: np.ndarray) -> np.ndarray:
+        """Frequency responses (times, n_rx, fft_size) of the blocks at given times"""
+        padded = np.zeros((len(times), self.n_rx, self.fft_size), dtype=complex)
+        padded[:, :, :self.filter_length] = self.impulse_response(times)
+        return self.fft_backend.fft(padded, axis=-1)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Pass the next chunk of a stream through the channel
+
+        Args:
+            samples: Transmitted samples (1-D), any chunk size
+
+        Returns:
+            Received samples of shape (n_rx, len(samples)), in the precision of samples
+        """
+        samples = np.asarray(samples).reshape(-1)
+        n = samples.size
+        n_history = self.filter_length - 1
+        if n == 0:
+            return np.zeros((self.n_rx, 0), dtype=np.result_type(samples.dtype, np.complex64))
+
+        # Cut the chunk into segments at absolute multiples of the hop
+        first = self._position
+        boundaries = np.arange((first // self.hop + 1) * self.hop, first + n, self.hop) - first
+        starts = np.concatenate([[0], boundaries])
+        lengths = np.concatenate([boundaries, [n]]) - starts
+
+        # Every segment with its n_history preceding samples, zero-padded to fft_size;
+        # only the first and last segment can be shorter than a hop
+        extended = np.concatenate([self._history, samples, np.zeros(self.fft_size, dtype=complex)])
+        frames = np.lib.stride_tricks.sliding_window_view(extended, self.fft_size)[starts]
+        for block in np.flatnonzero(lengths < self.hop):
+            frames[block, n_history + lengths[block]:] = 0
+
+        if self.time_varying:
+            block_index = (first + starts) // self.hop
+            response = self._frequency_response((block_index + 0.5) * self.hop / self.sample_rate)
+        else:
+            if self._static_response is None:
+                self._static_response = self._frequency_response(np.zeros(1))
+            response = self._static_response
+
+        # All blocks and antennas in one FFT / IFFT pair: (n_rx, blocks, fft_size)
+        spectrum = self.fft_backend.fft(frames, axis=-1)
+        filtered = self.fft_backend.ifft(spectrum * response.transpose(1, 0, 2), axis=-1)
+        filtered = filtered[:, :, n_history:n_history + self.hop].reshape(self.n_rx, -1)
+
+        # Segments are contiguous in the output; only the first one can leave a gap
+        output = np.concatenate([filtered[:, :lengths[0]],
+                                 filtered[:, self.hop:self.hop + n - lengths[0]]], axis=1)
+
+        if n_history:
+            self._history = np.concatenate([self._history, samples])[-n_history:]
+        self._position += n
+        return output.astype(np.result_type(samples.dtype, np.complex64), copy=False)
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Pass a stream of chunks through the channel
+
+        Args:
+            chunks: Iterable of sample chunks
+
+        Yields:
+            Received chunks of shape (n_rx, chunk length)
+        """
+        for chunk in chunks:
+            yield self.process(chunk)
+
+class TDLChannel(MultipathChannel):
+    """
+    3GPP TR 38.901 tapped delay line channel (TDL-A to TDL-E) with Doppler
+
+    Every tap of every receive antenna fades independently, generated as a
+    sum of sinusoids with random arrival angles and phases (Rayleigh
+    fading with a Jakes spectrum). The specular part of the first tap of
+    the LOS profiles (TDL-D, TDL-E) arrives head-on, at the maximum
+    Doppler shift. With max_doppler=0 the channel is a static random
+    realization of the profile.
+    """
+
+    def __init__(self,
+                 profile: Union[str, DelayProfile],
+                 delay_spread: float,
+                 max_doppler: float,
+                 sample_rate: float,
+                 n_rx: int = 1,
+                 seed: Union[int, np.random.Generator, None] = None,
+                 n_sinusoids: int = DEFAULT_N_SINUSOIDS,
+                 fft_size: Optional[int] = None,
+                 fft_backend: Union[str, FFTBackend, None] = None,
+                 sinc_half_width: int = DEFAULT_SINC_HALF_WIDTH):
+        """
+        Initialize TDL channel
+
+        Args:
+            profile: Profile name ('TDL-A' to 'TDL-E') or DelayProfile
+            delay_spread: RMS delay spread in seconds
+            max_doppler: Maximum Doppler shift in Hz
+            sample_rate: Sample rate in Hz
+            n_rx: Number of receive antennas
+            seed: Seed or Generator for the fading processes
+            n_sinusoids: Number of sinusoids per fading process
+            fft_size: Overlap-save block FFT size
+            fft_backend: FFT backend name or instance
+            sinc_half_width: Half length of the fractional delay interpolator
+        """
+        self.profile = get_delay_profile(profile) if isinstance(profile, str) else profile
+        self.delay_spread = delay_spread
+        self.max_doppler = max_doppler
+        self.rng = np.random.default_rng(seed)
+
+        delays, powers, los_power = self.profile.scaled(delay_spread)
+        self.tap_powers = powers
+        self.los_power = los_power
+
+        shape = (n_rx, delays.size, n_sinusoids)
+        self._doppler = max_doppler * np.cos(self.rng.uniform(0, 2 * np.pi, shape))
+        self._phase = self.rng.uniform(0, 2 * np.pi, shape)
+        self._los_phase = self.rng.uniform(0, 2 * np.pi, n_rx)
+
+        super().__init__(delays, np.zeros(delays.size), sample_rate, n_rx,
+                         fft_size, fft_backend, sinc_half_width)
+
+    @property
+    def time_varying(self) -> bool:
+        return self.max_doppler > 0
+
+    def tap_gains(self, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times, dtype=float)[:, None, None, None]
+        n_sinusoids = self._phase.shape[-1]
+
+        # Sum of sinusoids: (times, n_rx, taps)
+        scatter = np.exp(1j * (2 * np.pi * self._doppler * times + self._phase)).sum(axis=-1)
+        gains = scatter * np.sqrt(self.tap_powers / n_sinusoids)
+
+        if self.los_power > 0:
+            los_phase = 2 * np.pi * self.max_doppler * times[:, :, 0, 0] + self._los_phase
+            gains[:, :, 0] += np.sqrt(self.los_power) * np.exp(1j * los_phase)
+
+        return gains
@@ -6,7 +6,7 @@ from .channel_types import ChannelType
 from .channels import PhysicalChannel, PDSCH, PDCCH
 from .channels import CORESET, REGMappingType
 from .numerology import NRNumerology, get_numerology
-from .modulation import ModulationType
+from .modulation import ModulationType, modulate
 from .definitions import (
     N_SC_PER_RB,
     N_SYMBOLS_PER_SLOT,
@@ -14,8 +14,8 @@ from .definitions import (
     get_frequency_range
 )
 from .carrier import CarrierConfig
-from .resources import ResourceElement, ResourceGrid
-from .waveform import WaveformGenerator
+from .resources import ResourceElement, ResourceGrid, LazyResourceGrid
+from .waveform import WaveformGenerator, SymbolCache
 
 __all__ = [
     'ChannelType',
@@ -24,12 +24,16 @@ __all__ = [
     'PDCCH',
     'NRNumerology',
     'get_numerology',
+    'ModulationType',
+    'modulate',
     'CarrierConfig',
     'ResourceGrid',
+    'LazyResourceGrid',
     'ResourceElement',
     'N_SC_PER_RB',
     'N_SYMBOLS_PER_SLOT',
     'get_rb_count',
     'get_frequency_range',
-    'WaveformGenerator'
+    'WaveformGenerator',
+    'SymbolCache'
 ]
\ No newline at end of file
@@ -3,11 +3,14 @@
 """
 
 from dataclasses import dataclass, field
+import numpy as np
 from .numerology import NRNumerology, get_numerology
 from .definitions import get_rb_count, N_SC_PER_RB, N_SYMBOLS_PER_SLOT
-from .resources import ResourceElement, ResourceGrid
+from .resources import ResourceElement, ResourceGrid, LazyResourceGrid
 from .channel_types import ChannelType
 
+# Sample dtypes supported through grid, modulator and writers
+SUPPORTED_DTYPES = (np.complex64, np.complex128)
 
 @dataclass
 class CarrierConfig:
@@ -20,12 +23,14 @@ class CarrierConfig:
     fft_size: int = None  # None means use standard calculation
     tdd_pattern: list[int] = None
     special_slot_pattern: list[int] = None
+    dtype: type = np.complex128  # Grid and IQ sample dtype
 
     def __post_init__(self):
         if self.cyclic_prefix not in ['normal', 'extended']:
             raise ValueError("Cyclic prefix must be 'normal' or 'extended'")
         if not 0 <= self.n_cell_id <= 1007:
             raise ValueError("Cell ID must be between 0 and 1007")
+        self.set_dtype(self.dtype)
 
     @classmethod
     def from_bandwidth(cls, bandwidth_mhz: float, mu: int) -> 'CarrierConfig':
@@ -39,16 +44,30 @@ class CarrierConfig:
         """Get subcarrier spacing in kHz"""
         return self.numerology.subcarrier_spacing
 
-    def get_resource_grid(self) -> ResourceGrid:
-        """Create and return a resource grid based on this carrier config"""
+    def get_resource_grid(self, lazy: bool = False, shared: bool = False) -> ResourceGrid:
+        """
+        Create and return a resource grid based on this carrier config
+
+        Args:
+            lazy: If True, return a LazyResourceGrid that renders slots on demand
+            shared: If True, allocate the value plane of a (non-lazy) grid in shared memory
+        """
         slots_per_subframe = self.numerology.slots_per_subframe
         total_slots = 10 * slots_per_subframe  # 10ms frame
         total_symbols = N_SYMBOLS_PER_SLOT * total_slots
         total_subcarriers = self.n_resource_blocks * N_SC_PER_RB
 
+        if lazy:
+            return LazyResourceGrid(
+                n_subcarriers=total_subcarriers,
+                n_symbols=total_symbols,
+                dtype=self.dtype,
+            )
         return ResourceGrid(
             n_subcarriers=total_subcarriers,
             n_symbols=total_symbols,
+            dtype=self.dtype,
+            shared=shared,
         )
 
     def set_sample_rate(self, sample_rate: float):
@@ -61,6 +80,13 @@ class CarrierConfig:
             raise ValueError("FFT size must be positive or None")
         self.fft_size = fft_size
 
+    def set_dtype(self, dtype):
+        """Set sample dtype (complex64 or complex128) for grid and waveform"""
+        dtype = np.dtype(dtype).type
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype {np.dtype(dtype)}. Use complex64 or complex128")
+        self.dtype = dtype
+
     def set_tdd_pattern(self, tdd_pattern: list[int]):
         """Set TDD pattern for the carrier"""
         self.tdd_pattern = tdd_pattern
@@ -33,4 +33,7 @@ class ChannelType(Enum):
     ## Uplink Reference Signals
     UL_DMRS = auto()  # Uplink Demodulation Reference Signal
     UL_PTRS = auto()  # Uplink Phase Tracking Reference Signal
-    SRS = auto()      # Sounding Reference Signal
\ No newline at end of file
+    SRS = auto()      # Sounding Reference Signal
+
+    # Added after the original members, so existing values stay unchanged
+    PBCH_DMRS = auto()  # PBCH Demodulation Reference Signal
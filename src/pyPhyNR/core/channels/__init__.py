@@ -5,12 +5,13 @@
 from .base import PhysicalChannel
 from .pdsch import PDSCH
 from .pdcch import PDCCH
-from .dmrs import DMRS, PDSCH_DMRS, ReferenceSignal
+from .dmrs import DMRS, PDSCH_DMRS, PBCH_DMRS, ReferenceSignal
 from .coreset import CORESET, REGMappingType
 from .pss import PSS
 from .sss import SSS
 from .pbch import PBCH
 from .ssblock import SSBlock
+from .sequence_cache import SequenceCache, SequenceTable, build_dmrs_table, get_sequence_cache
 
 __all__ = [
     'PhysicalChannel',
@@ -18,11 +19,16 @@ __all__ = [
     'PDCCH',
     'DMRS',
     'PDSCH_DMRS',
+    'PBCH_DMRS',
     'ReferenceSignal',
     'CORESET',
     'REGMappingType',
     'PSS',
     'SSS',
     'PBCH',
-    'SSBlock'
+    'SSBlock',
+    'SequenceCache',
+    'SequenceTable',
+    'build_dmrs_table',
+    'get_sequence_cache'
 ] 
\ No newline at end of file
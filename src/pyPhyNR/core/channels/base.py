@@ -2,11 +2,11 @@
 
 from dataclasses import dataclass, field
 import numpy as np
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Union
 from ..channel_types import ChannelType
 from ..definitions import N_SC_PER_RB, N_SYMBOLS_PER_SLOT
 from .dmrs import ReferenceSignal
-from ..re_mapping import REMapping
+from ..re_mapping import REMapping, SlotMapping
 
 @dataclass
 class PhysicalChannel:
@@ -21,7 +21,10 @@ class PhysicalChannel:
     power: float = 0.0  # Power scaling in dB
     rnti: int = 0  # Radio Network Temporary Identifier
     payload_pattern: str = "0"  # Payload pattern
+    dtype: type = np.complex128  # Complex dtype of the generated data
+    seed: Union[int, np.random.SeedSequence, np.random.Generator, None] = None  # Payload seed (None: global np.random state)
     data: np.ndarray = field(init=False)
+    slot_data: Dict[int, np.ndarray] = field(init=False, default_factory=dict)  # Per-slot data (seeded channels)
 
     def __post_init__(self):
         """Initialize and validate channel parameters"""
@@ -50,13 +53,60 @@ class PhysicalChannel:
     def _generate_reference_signal(self) -> np.ndarray:
         """Generate reference signal if present"""
         if self.reference_signal:
-            return self.reference_signal.generate_symbols(self.num_rb, self.num_symbols)
+            rng = None if self.seed is None else np.random.default_rng(self.seed)
+            return self.reference_signal.generate_symbols(self.num_rb, self.num_symbols, rng)
         return None
+
+    def _slot_generators(self) -> Optional[Dict[int, np.random.Generator]]:
+        """
+        Get the random generator of each slot
+
+        Slot streams are derived from the channel seed by slot number, so the
+        data of a slot does not depend on the other slots and slots can be
+        generated in any order or concurrently. A Generator seed is shared by
+        all slots (drawn from in slot_pattern order).
+
+        Returns:
+            Dictionary mapping slot number to its Generator, or None for an
+            unseeded channel (global np.random state)
+        """
+        if self.seed is None:
+            return None
+        if isinstance(self.seed, np.random.Generator):
+            return {slot: self.seed for slot in self.slot_pattern}
+        root = self.seed if isinstance(self.seed, np.random.SeedSequence) else np.random.SeedSequence(self.seed)
+        return {slot: np.random.default_rng(np.random.SeedSequence(
+                    root.entropy, spawn_key=tuple(root.spawn_key) + (slot,)))
+                for slot in self.slot_pattern}
+
+    def _generate_slot_data(self, generate: Callable[[Optional[np.random.Generator]], np.ndarray]):
+        """
+        Generate random channel data, per slot for seeded channels
+
+        Unseeded channels draw one block from the global np.random state that
+        is repeated in every slot. Seeded channels get a block per slot in
+        slot_data; data is the block of the first slot.
+
+        Args:
+            generate: Function rng -> data block (rng None: global np.random state)
+        """
+        generators = self._slot_generators()
+        if generators is None:
+            self.slot_data = {}
+            self.data = generate(None)
+        else:
+            self.slot_data = {slot: generate(rng) for slot, rng in generators.items()}
+            self.data = self.slot_data[self.slot_pattern[0]]
+
+    def _data_blocks(self) -> List[np.ndarray]:
+        """Get the distinct data blocks (one per slot for seeded channels)"""
+        return list(self.slot_data.values()) if self.slot_data else [self.data]
         
     def apply_power_scaling(self):
         """Apply power scaling to channel data"""
         if self.power != 0.0:
-            self.data *= 10**(self.power/20)  # Convert dB to linear scale
+            for data in self._data_blocks():
+                data *= 10**(self.power/20)  # Convert dB to linear scale
             
     def apply_scrambling(self):
         """Apply RNTI-based scrambling if RNTI is non-zero"""
@@ -64,35 +114,59 @@ class PhysicalChannel:
             # TODO: Implement RNTI-based scrambling
             pass
             
-    def get_re_mapping(self) -> Dict[int, List[REMapping]]:
+    def _subcarrier_index(self):
         """
-        Get mapping of Resource Elements for this channel
-        
+        Get absolute subcarrier index and matching data rows for freq_indices
+
         Returns:
-            Dictionary mapping slot number to list of RE mappings
+            Tuple of (grid index, data row index); slices for contiguous
+            allocations, integer arrays otherwise
+        """
+        freq = self.freq_indices
+        if isinstance(freq, range) and freq.step == 1:
+            return slice(freq.start, freq.stop), slice(0, len(freq))
+        freq = np.asarray(freq, dtype=np.intp)
+        if freq.size and np.all(np.diff(freq) == 1):
+            return slice(int(freq[0]), int(freq[-1]) + 1), slice(0, freq.size)
+        return freq, freq - freq.min()
+
+    def _channel_type_block(self, shape) -> np.ndarray:
+        """Get channel type block (ChannelType.value) for the mapped data"""
+        return np.broadcast_to(np.uint8(self.channel_type.value), shape)
+
+    def get_slot_mappings(self) -> Dict[int, SlotMapping]:
         """
+        Get block mapping of this channel onto the grid
+
+        Returns:
+            Dictionary mapping slot number to its SlotMapping
+        """
+        subcarriers, data_rows = self._subcarrier_index()
+        data = self.data[data_rows, :]
+        channel_types = self._channel_type_block(data.shape)
+
         mappings = {}
-        
         for slot in self.slot_pattern:
-            slot_mappings = []
             time_indices = self.time_indices[slot]
-            
-            # Map all REs in this slot
-            for i in self.freq_indices:
-                for j in time_indices:
-                    # Convert to local indices for data array
-                    local_i = i - min(self.freq_indices)
-                    local_j = j - min(time_indices)
-                    
-                    # Create mapping using data array values
-                    mapping = REMapping(
-                        subcarrier=i,
-                        symbol=j,
-                        data=self.data[local_i, local_j],
-                        channel_type=self.channel_type
-                    )
-                    slot_mappings.append(mapping)
-            
-            mappings[slot] = slot_mappings
-        
-        return mappings
\ No newline at end of file
+            slot_data = self.slot_data[slot][data_rows, :] if self.slot_data else data
+            mappings[slot] = SlotMapping(
+                subcarriers=subcarriers,
+                symbols=slice(time_indices.start, time_indices.stop),
+                data=slot_data,
+                channel_types=channel_types
+            )
+
+        return mappings
+
+    def get_re_mapping(self) -> Dict[int, List[REMapping]]:
+        """
+        Get mapping of Resource Elements for this channel
+
+        Compatibility wrapper around get_slot_mappings(); per-RE objects are
+        only built when this is called.
+
+        Returns:
+            Dictionary mapping slot number to list of RE mappings
+        """
+        return {slot: mapping.to_re_mappings()
+                for slot, mapping in self.get_slot_mappings().items()}
@@ -32,7 +32,8 @@ class CORESET(PhysicalChannel):
                  reg_bundle_size: int = 6,
                  power: float = 0.0,
                  rnti: int = 0,
-                 payload_pattern: str = "0"):
+                 payload_pattern: str = "0",
+                 dtype: type = np.complex128):
 
         if num_rb % 6 != 0:
             raise ValueError("CORESET must be configured with a number of RBs that is a multiple of 6")
@@ -52,14 +53,15 @@ class CORESET(PhysicalChannel):
             slot_pattern=slot_pattern,
             power=power,
             rnti=rnti,
-            payload_pattern=payload_pattern
+            payload_pattern=payload_pattern,
+            dtype=dtype
         )
 
         self._validate_params()
 
         # Initialize data array
         n_sc = self.num_rb * N_SC_PER_RB
-        self.data = np.zeros((n_sc, self.num_symbols), dtype=complex)
+        self.data = np.zeros((n_sc, self.num_symbols), dtype=self.dtype)
 
     def _validate_params(self):
         """Validate CORESET configuration parameters"""
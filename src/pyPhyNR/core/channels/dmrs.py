@@ -4,65 +4,120 @@ Demodulation Reference Signals (DMRS) and Reference Signal Base Classes
 
 from dataclasses import dataclass
 import numpy as np
-from typing import List
+from typing import List, Optional, Union
 from ..channel_types import ChannelType
 from ..modulation import ModulationType, generate_random_symbols
 from ..definitions import MAX_DMRS_RE
 
-def generate_gold_sequence(c_init: int) -> np.ndarray:
+# Gold sequence (TS 38.211 5.2.1) parameters
+GOLD_NC = 1600  # Output offset N_c
+GOLD_MPN = (2**16) - 1  # Length of the generated m-sequences
+GOLD_DEFAULT_LENGTH = GOLD_MPN - GOLD_NC  # Output length of generate_gold_sequence by default
+
+# x(n+31) depends only on x(n)..x(n+3), so 28 new bits can be computed per step
+# from a 31-bit state word
+_LFSR_STEP = 28
+_LFSR_STEP_MASK = (1 << _LFSR_STEP) - 1
+_X1_TAPS = (0, 3)        # x1(n+31) = x1(n+3) + x1(n)
+_X2_TAPS = (0, 1, 2, 3)  # x2(n+31) = x2(n+3) + x2(n+2) + x2(n+1) + x2(n)
+
+_x1_bits = np.zeros(0, dtype=np.uint8)  # Cached x1 sequence (identical for all c_init)
+
+def _m_sequence_bits(init_states: np.ndarray, taps: tuple, n_bits: int) -> np.ndarray:
+    """
+    Generate length-31 LFSR m-sequences, 28 bits per step for a batch of states
+
+    Args:
+        init_states: 31-bit initial states, bit i holding x(i)
+        taps: Feedback taps t in x(n+31) = sum x(n+t) mod 2
+        n_bits: Number of sequence bits to generate
+
+    Returns:
+        uint8 array of shape (len(init_states), n_bits)
+    """
+    states = np.asarray(init_states, dtype=np.uint64)
+    n_steps = -(-max(n_bits - 31, 0) // _LFSR_STEP)
+    words = np.empty((states.size, n_steps), dtype=np.uint64)
+
+    for step in range(n_steps):
+        feedback = states
+        for tap in taps[1:]:
+            feedback = feedback ^ (states >> tap)
+        feedback &= _LFSR_STEP_MASK
+        words[:, step] = feedback
+        states = (states >> _LFSR_STEP) | (feedback << 3)
+
+    init_bits = (np.asarray(init_states, dtype=np.uint64)[:, None] >> np.arange(31, dtype=np.uint64)) & 1
+    step_bits = (words[:, :, None] >> np.arange(_LFSR_STEP, dtype=np.uint64)) & 1
+    bits = np.concatenate([init_bits, step_bits.reshape(states.size, -1)], axis=1)
+    return bits[:, :n_bits].astype(np.uint8)
+
+def _get_x1_bits(n_bits: int) -> np.ndarray:
+    """Get the first n_bits of the x1 sequence (x1 initialized with 1, 0, ..., 0)"""
+    global _x1_bits
+    if _x1_bits.size < n_bits:
+        _x1_bits = _m_sequence_bits(np.array([1]), _X1_TAPS, n_bits)[0]
+    return _x1_bits[:n_bits]
+
+def generate_gold_sequences(c_inits, length: int = GOLD_DEFAULT_LENGTH) -> np.ndarray:
+    """
+    Generate Gold sequences for many initialization values at once
+
+    Args:
+        c_inits: Sequence of 31-bit initialization values
+        length: Number of output bits per sequence
+
+    Returns:
+        Binary sequences (0s and 1s), shape (len(c_inits), length)
+    """
+    c_inits = np.asarray(c_inits, dtype=np.uint64).reshape(-1)
+    n_bits = GOLD_NC + length
+    x1 = _get_x1_bits(n_bits)
+    x2 = _m_sequence_bits(c_inits & ((1 << 31) - 1), _X2_TAPS, n_bits)
+    return (x1[GOLD_NC:] ^ x2[:, GOLD_NC:]).astype(int)
+
+def generate_gold_sequence(c_init: int, length: int = GOLD_DEFAULT_LENGTH) -> np.ndarray:
     """
     Generate Gold sequence
     
     Args:
         c_init: 31-bit initialization value
+        length: Number of output bits (DMRS needs only 2 bits per RE)
         
     Returns:
         Binary sequence (0s and 1s)
     """
-    # Initialize x1 sequence
-    x1_init = np.array([1] + [0]*30)
-    x1 = x1_init.copy()
-    
-    # Initialize x2 sequence from c_init
-    x2_init = np.zeros(31)
-    for ii in range(31):
-        x2_init[ii] = (c_init >> ii) & 1
-    x2 = x2_init.copy()
-    
-    # Generate sequences (optimized with pre-allocation)
-    MPN = (2**16) - 1
-    x1 = np.zeros(31 + MPN, dtype=int)
-    x2 = np.zeros(31 + MPN, dtype=int)
-    
-    # Copy initial values
-    x1[:31] = x1_init
-    x2[:31] = x2_init
-    
-    # Generate sequences using vectorized operations where possible
-    for n in range(MPN):
-        x1[n + 31] = (x1[n + 3] + x1[n]) % 2
-        x2[n + 31] = (x2[n + 3] + x2[n + 2] + x2[n + 1] + x2[n]) % 2
-    
-    # Generate c sequence with NC offset
-    NC = 1600
-    c = (x1[NC:NC + MPN - NC] + x2[NC:NC + MPN - NC]) % 2
-    
-    return c
+    return generate_gold_sequences([c_init], length)[0]
+
+def dmrs_c_init(cell_id: int, slot_idx: int, symbol_idx: int) -> int:
+    """
+    Get DMRS scrambling initialization value c_init
+
+    Args:
+        cell_id: Cell ID
+        slot_idx: Slot index
+        symbol_idx: Symbol index within slot
+
+    Returns:
+        31-bit initialization value
+    """
+    return ((2**17) * (14*slot_idx + symbol_idx + 1) *
+            (2*cell_id + 1) + 2*cell_id) % (2**31)
 
 def map_to_qpsk(c: np.ndarray, n_symbols: int) -> np.ndarray:
     """
     Map binary sequence to QPSK symbols (optimized)
     
     Args:
-        c: Binary sequence (0s and 1s)
+        c: Binary sequence (0s and 1s), or a batch of sequences along the last axis
         n_symbols: Number of QPSK symbols to generate
         
     Returns:
         Complex QPSK symbols
     """
 
-    real_bits = c[0:2*n_symbols:2]
-    imag_bits = c[1:2*n_symbols:2]
+    real_bits = c[..., 0:2*n_symbols:2]
+    imag_bits = c[..., 1:2*n_symbols:2]
     
     real_part = (1 - 2*real_bits) / np.sqrt(2)
     imag_part = (1 - 2*imag_bits) / np.sqrt(2)
@@ -75,11 +130,12 @@ class ReferenceSignal:
     positions: List[int]
     channel_type: ChannelType
     
-    def generate_symbols(self, num_rb: int, num_symbols: int) -> np.ndarray:
-        """Generate reference signal symbols"""
+    def generate_symbols(self, num_rb: int, num_symbols: int,
+                         rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Generate reference signal symbols (rng None: global np.random state)"""
         n_positions = len(self.positions)
         n_sc = num_rb * n_positions
-        return generate_random_symbols(n_sc, num_symbols, ModulationType.QPSK)
+        return generate_random_symbols(n_sc, num_symbols, ModulationType.QPSK, rng=rng)
 
 @dataclass
 class DMRS(ReferenceSignal):
@@ -117,16 +173,177 @@ class PDSCH_DMRS(ReferenceSignal):
         Returns:
             Complex DMRS symbols
         """
+        from .sequence_cache import get_sequence_cache
+
         # Calculate c_init
-        c_init = ((2**17) * (14*slot_idx + symbol_idx + 1) * 
-                  (2*cell_id + 1) + 2*cell_id) % (2**31)
-        
-        c = generate_gold_sequence(c_init)
+        c_init = dmrs_c_init(cell_id, slot_idx, symbol_idx)
 
         # Map to QPSK symbols: NoDMRSRE = 3276//2 = 1638
         NoDMRSRE = 3276 // 2  # Max number of DMRS REs in one symbol
+        c = get_sequence_cache().get(c_init, 2 * NoDMRSRE)
+
         dmrs_symbols = map_to_qpsk(c, NoDMRSRE)
 
         # Return as column vector (n_sc, 1)
         return dmrs_symbols.reshape(-1, 1)
 
+# Maximum number of SS/PBCH blocks per half frame (TS 38.213 4.1)
+SSB_L_MAX_VALUES = (4, 8, 64)
+
+def pbch_dmrs_c_init(cell_id: int, ssb_index: int, half_frame: int, l_max: int = 4) -> int:
+    """
+    Get PBCH DMRS scrambling initialization value c_init (TS 38.211 7.4.1.4.1)
+
+    Args:
+        cell_id: Cell ID
+        ssb_index: SSB index
+        half_frame: Half frame index (only used for L_max = 4)
+        l_max: Maximum number of SS/PBCH blocks per half frame (4, 8 or 64)
+
+    Returns:
+        31-bit initialization value
+    """
+    if l_max not in SSB_L_MAX_VALUES:
+        raise ValueError(f"Invalid l_max: {l_max}. Use one of {SSB_L_MAX_VALUES}")
+    if not 0 <= ssb_index < l_max:
+        raise ValueError(f"SSB index {ssb_index} out of range for l_max={l_max}")
+    i_ssb = ssb_index + 4 * half_frame if l_max == 4 else ssb_index % 8
+    return ((2**11) * (i_ssb + 1) * (cell_id // 4 + 1) +
+            (2**6) * (i_ssb + 1) + cell_id % 4)
+
+@dataclass
+class PBCH_DMRS(ReferenceSignal):
+    """PBCH Demodulation Reference Signal, on every 4th subcarrier offset by cell_id mod 4"""
+    cell_id: int = 0
+
+    def __init__(self, cell_id: int):
+        v = cell_id % 4
+        super().__init__(
+            positions=[v, v + 4, v + 8],
+            channel_type=ChannelType.PBCH_DMRS
+        )
+        self.cell_id = cell_id
+
+    def generate_symbols(self, num_rb: int, num_symbols: int,
+                         ssb_index: int = 0, half_frame: int = 0, l_max: int = 4) -> np.ndarray:
+        """
+        Generate PBCH DMRS symbols
+
+        The sequence is deterministic (no payload randomness) and is mapped
+        symbol by symbol, frequency first.
+
+        Args:
+            num_rb: Number of resource blocks
+            num_symbols: Number of PBCH symbols
+            ssb_index: SSB index
+            half_frame: Half frame index
+            l_max: Maximum number of SS/PBCH blocks per half frame
+
+        Returns:
+            Complex DMRS symbols, RB-major (num_rb * 3, num_symbols)
+        """
+        from .sequence_cache import get_sequence_cache
+
+        n_per_symbol = num_rb * len(self.positions)
+        c_init = pbch_dmrs_c_init(self.cell_id, ssb_index, half_frame, l_max)
+        c = get_sequence_cache().get(c_init, 2 * n_per_symbol * num_symbols)
+        return map_to_qpsk(c, n_per_symbol * num_symbols).reshape(num_symbols, n_per_symbol).T
+
+def dmrs_subcarrier_indices(subcarrier_pattern: Union[str, List[int]], n_subcarriers: int) -> np.ndarray:
+    """
+    Get DMRS subcarrier indices for a subcarrier pattern
+
+    Args:
+        subcarrier_pattern: "even", "odd", "all", or custom list of subcarriers
+        n_subcarriers: Number of subcarriers in the grid
+
+    Returns:
+        Array of subcarrier indices, in DMRS sequence order
+    """
+    if subcarrier_pattern == "even":
+        return np.arange(0, n_subcarriers, 2)  # [0, 2, 4, 6, ...]
+    elif subcarrier_pattern == "odd":
+        return np.arange(1, n_subcarriers, 2)  # [1, 3, 5, 7, ...]
+    elif subcarrier_pattern == "all":
+        return np.arange(n_subcarriers)  # [0, 1, 2, 3, ...]
+    elif isinstance(subcarrier_pattern, list):
+        indices = np.asarray(subcarrier_pattern, dtype=int)
+        return indices[(indices >= 0) & (indices < n_subcarriers)]
+    raise ValueError(f"Invalid subcarrier_pattern: {subcarrier_pattern}. Use 'even', 'odd', 'all', or custom list")
+
+@dataclass
+class DMRSInsertion:
+    """
+    DMRS insertion into the PDSCH slots of a resource grid
+
+    Applied to the grid planes after the PDSCH has been mapped. The DMRS
+    spans the whole carrier on the selected subcarriers of each DMRS symbol.
+    """
+    slot_pattern: List[int]   # Slots of the PDSCH
+    positions: List[int]      # DMRS symbol positions within slot
+    cell_id: int              # Cell ID for the scrambling sequence
+    subcarrier_pattern: Union[str, List[int]] = "even"  # "even", "odd", "all", or custom list
+    clear_full_symbol: bool = True  # Clear entire symbol before inserting DMRS
+    amplitude: float = 1.0    # Linear DMRS amplitude
+
+    def __post_init__(self):
+        # Validate the pattern up front, before anything is written
+        dmrs_subcarrier_indices(self.subcarrier_pattern, 0)
+
+    @property
+    def slots(self) -> List[int]:
+        """Slots touched by this insertion"""
+        return list(self.slot_pattern)
+
+    def get_symbol_indices(self) -> np.ndarray:
+        """Get absolute DMRS symbol indices, in insertion order"""
+        return np.array([slot_idx * 14 + dmrs_sym
+                         for slot_idx in self.slot_pattern
+                         for dmrs_sym in self.positions], dtype=int)
+
+    def apply(self, values: np.ndarray, channel_types: np.ndarray, first_symbol: int = 0):
+        """
+        Insert DMRS into grid planes in place
+
+        Args:
+            values: Complex value plane (subcarriers x symbols)
+            channel_types: ChannelType.value plane of the same shape
+            first_symbol: Absolute symbol index of the first column of the planes
+        """
+        from .sequence_cache import get_sequence_cache
+
+        n_sc, n_sym = values.shape
+
+        # Keep only DMRS symbols inside the planes
+        slot_sym_pairs = [(slot_idx, dmrs_sym)
+                          for slot_idx in self.slot_pattern
+                          for dmrs_sym in self.positions
+                          # Absolute symbol index: iSmb = slot_idx * 14 + dmrs_sym
+                          if first_symbol <= slot_idx * 14 + dmrs_sym < first_symbol + n_sym]
+        if not slot_sym_pairs:
+            return
+        local_sym_indices = np.array([slot_idx * 14 + dmrs_sym - first_symbol
+                                      for slot_idx, dmrs_sym in slot_sym_pairs])
+
+        # Generate DMRS sequences, one row per (slot, symbol); scaling makes a
+        # new array so cached sequences are never modified
+        c_inits = [dmrs_c_init(self.cell_id, slot_idx, dmrs_sym)
+                   for slot_idx, dmrs_sym in slot_sym_pairs]
+        sequences = get_sequence_cache().get_many(c_inits, 2 * MAX_DMRS_RE)
+        dmrs_symbols = map_to_qpsk(sequences, MAX_DMRS_RE) * self.amplitude
+
+        # Only as many subcarriers as there are DMRS symbols; a subcarrier listed
+        # more than once takes the DMRS symbol of its first occurrence
+        subcarrier_indices = dmrs_subcarrier_indices(self.subcarrier_pattern, n_sc)
+        dmrs_length = min(dmrs_symbols.shape[1], len(subcarrier_indices))
+        dmrs_sc, dmrs_idx = np.unique(subcarrier_indices[:dmrs_length], return_index=True)
+
+        # 1. Clear symbols if requested
+        if self.clear_full_symbol:
+            values[:, local_sym_indices] = 0
+            channel_types[:, local_sym_indices] = ChannelType.EMPTY.value
+
+        # 2. Insert DMRS on selected subcarriers of all DMRS symbols at once
+        block = np.ix_(dmrs_sc, local_sym_indices)
+        values[block] = dmrs_symbols[:, dmrs_idx].T
+        channel_types[block] = ChannelType.DL_DMRS.value
@@ -4,7 +4,7 @@ Physical Downlink Control Channel (PDCCH)
 
 from dataclasses import dataclass
 import numpy as np
-from typing import List
+from typing import List, Union
 from ..channel_types import ChannelType
 from .base import PhysicalChannel
 from .dmrs import PDSCH_DMRS
@@ -33,7 +33,9 @@ class PDCCH(PhysicalChannel):
                  cell_id: int = 0,
                  power: float = 0.0,
                  rnti: int = 0,
-                 payload_pattern: str = "0"):
+                 payload_pattern: str = "0",
+                 dtype: type = np.complex128,
+                 seed: Union[int, np.random.SeedSequence, np.random.Generator, None] = None):
         
         super().__init__(
             channel_type=ChannelType.PDCCH,
@@ -45,7 +47,9 @@ class PDCCH(PhysicalChannel):
             reference_signal=PDSCH_DMRS(positions=DMRS_POSITIONS),
             power=power,
             rnti=rnti,
-            payload_pattern=payload_pattern
+            payload_pattern=payload_pattern,
+            dtype=dtype,
+            seed=seed
         )
         
         self.modulation = modulation
@@ -56,11 +60,7 @@ class PDCCH(PhysicalChannel):
     
     def _generate_data(self):
         """Generate PDCCH data with DMRS integration"""
-        n_sc = self.num_rb * N_SC_PER_RB
-        # Initialize full data array
-        self.data = np.zeros((n_sc, self.num_symbols), dtype=complex)
-        
-        # Generate and place DMRS if present
+        # Generate DMRS if present
         if self.reference_signal:
             # Calculate slot and symbol indices for DMRS generation
             slot_idx = self.slot_pattern[0]  # Use first slot for now
@@ -76,29 +76,36 @@ class PDCCH(PhysicalChannel):
         else:
             dmrs_data = None
         
-        # Generate and place PDCCH data
-        n_data = self.num_rb * len(DATA_POSITIONS)
-        pdcch_data = generate_random_symbols(n_data, self.num_symbols, self.modulation)
-        
-        # Place data in correct positions
-        for rb in range(self.num_rb):
-            rb_start = rb * N_SC_PER_RB
-            
-            # Place DMRS
-            if dmrs_data is not None and self.reference_signal:
-                for i, pos in enumerate(self.reference_signal.positions):
-                    dmrs_idx = rb * len(self.reference_signal.positions) + i
-                    for sym in range(self.num_symbols):
-                        self.data[rb_start + pos, sym] = dmrs_data[dmrs_idx, sym]
-            
-            # Place PDCCH data (excluding DMRS positions)
-            dmrs_positions = set(self.reference_signal.positions) if self.reference_signal else set()
-            data_positions = [pos for pos in range(N_SC_PER_RB) if pos not in dmrs_positions]
-            
-            for i, pos in enumerate(data_positions):
-                data_idx = rb * len(data_positions) + i
-                for sym in range(self.num_symbols):
-                    self.data[rb_start + pos, sym] = pdcch_data[data_idx, sym]
+        # Generate PDCCH data (one block per slot if seeded) around the DMRS
+        n_data = self.num_rb * len(self._data_positions())
+        self._generate_slot_data(lambda rng: self._assemble(
+            dmrs_data, generate_random_symbols(n_data, self.num_symbols, self.modulation, self.dtype, rng)))
+
+    def _data_positions(self) -> List[int]:
+        """Get the data subcarriers within an RB (all but the DMRS positions)"""
+        dmrs_positions = set(self.reference_signal.positions) if self.reference_signal else set()
+        return [pos for pos in range(N_SC_PER_RB) if pos not in dmrs_positions]
+
+    def _assemble(self, dmrs_data: np.ndarray, pdcch_data: np.ndarray) -> np.ndarray:
+        """
+        Place DMRS and PDCCH data symbols in their subcarriers
+
+        Args:
+            dmrs_data: DMRS symbols, RB-major (None if there is no DMRS)
+            pdcch_data: PDCCH data symbols, RB-major
+
+        Returns:
+            Channel data block (subcarriers x symbols)
+        """
+        data = np.zeros((self.num_rb * N_SC_PER_RB, self.num_symbols), dtype=self.dtype)
+        rb_starts = np.arange(self.num_rb)[:, None] * N_SC_PER_RB
+
+        if dmrs_data is not None and self.reference_signal:
+            positions = np.asarray(self.reference_signal.positions)
+            data[(rb_starts + positions).ravel()] = dmrs_data[:self.num_rb * len(positions)]
+
+        data[(rb_starts + np.asarray(self._data_positions())).ravel()] = pdcch_data
+        return data
 
     def calculate_indices(self):
         """Calculate indices for both data and DMRS positions"""
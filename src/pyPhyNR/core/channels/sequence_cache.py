@@ -0,0 +1,256 @@
+"""
+Process-wide cache for Gold (pseudo-random) sequences used by DMRS
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+import numpy as np
+from ..definitions import MAX_DMRS_RE, N_SYMBOLS_PER_SLOT
+from .dmrs import generate_gold_sequences, dmrs_c_init
+
+# Largest number of slots per frame (mu=4)
+MAX_SLOTS_PER_FRAME = 160
+
+# File names inside a precomputed table directory
+TABLE_META_FILE = "meta.json"
+TABLE_INDEX_FILE = "c_init.npy"
+TABLE_BITS_FILE = "bits.npy"
+
+class SequenceTable:
+    """
+    Precomputed Gold sequences stored on disk
+
+    The table directory holds the sorted c_init values and the matching
+    bit-packed sequences; both are memory-mapped on load, so opening a
+    table is cheap and only the rows that are looked up are read.
+    """
+
+    def __init__(self, c_inits: np.ndarray, packed_bits: np.ndarray, length: int):
+        self.c_inits = c_inits          # Sorted c_init values
+        self.packed_bits = packed_bits  # (len(c_inits), ceil(length/8)) uint8
+        self.length = length            # Number of bits per sequence
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'SequenceTable':
+        """
+        Load a table written by build_dmrs_table
+
+        Args:
+            path: Table directory
+            mmap: If True, memory-map the arrays instead of reading them
+
+        Returns:
+            SequenceTable
+        """
+        with open(os.path.join(path, TABLE_META_FILE)) as f:
+            meta = json.load(f)
+        mmap_mode = 'r' if mmap else None
+        c_inits = np.load(os.path.join(path, TABLE_INDEX_FILE), mmap_mode=mmap_mode)
+        packed_bits = np.load(os.path.join(path, TABLE_BITS_FILE), mmap_mode=mmap_mode)
+        return cls(c_inits, packed_bits, meta['length'])
+
+    def lookup(self, c_inits: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up sequences in the table
+
+        Args:
+            c_inits: Initialization values
+            length: Number of bits needed per sequence
+
+        Returns:
+            Tuple of (found mask, int8 bits of shape (found.sum(), length))
+        """
+        c_inits = np.asarray(c_inits, dtype=np.int64)
+        if length > self.length or self.c_inits.size == 0:
+            return np.zeros(c_inits.shape, dtype=bool), np.zeros((0, length), dtype=np.int8)
+
+        rows = np.searchsorted(self.c_inits, c_inits)
+        rows = np.minimum(rows, self.c_inits.size - 1)
+        found = self.c_inits[rows] == c_inits
+        bits = np.unpackbits(self.packed_bits[rows[found]], axis=1, count=length)
+        return found, bits.astype(np.int8)
+
+def build_dmrs_table(path: str,
+                     cell_ids: Iterable[int],
+                     length: int = 2 * MAX_DMRS_RE,
+                     n_slots: int = MAX_SLOTS_PER_FRAME,
+                     n_symbols: int = N_SYMBOLS_PER_SLOT,
+                     batch_size: int = 4096) -> SequenceTable:
+    """
+    Precompute DMRS Gold sequences for a set of cell IDs and write them to disk
+
+    Args:
+        path: Output directory (created if missing)
+        cell_ids: Cell IDs to include
+        length: Number of bits per sequence (default: 2 bits per DMRS RE)
+        n_slots: Number of slot indices per cell
+        n_symbols: Number of symbol indices per slot
+        batch_size: Number of sequences generated per batch
+
+    Returns:
+        The written table, memory-mapped
+    """
+    c_inits = np.unique([dmrs_c_init(cell_id, slot_idx, symbol_idx)
+                         for cell_id in cell_ids
+                         for slot_idx in range(n_slots)
+                         for symbol_idx in range(n_symbols)]).astype(np.int64)
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, TABLE_INDEX_FILE), c_inits)
+    packed_bits = np.lib.format.open_memmap(
+        os.path.join(path, TABLE_BITS_FILE), mode='w+',
+        dtype=np.uint8, shape=(c_inits.size, -(-length // 8))
+    )
+    for start in range(0, c_inits.size, batch_size):
+        batch = c_inits[start:start + batch_size]
+        packed_bits[start:start + batch.size] = np.packbits(
+            generate_gold_sequences(batch, length).astype(np.uint8), axis=1
+        )
+    packed_bits.flush()
+    del packed_bits
+
+    with open(os.path.join(path, TABLE_META_FILE), 'w') as f:
+        json.dump({'length': length, 'cell_ids': sorted(int(c) for c in cell_ids),
+                   'n_slots': n_slots, 'n_symbols': n_symbols}, f)
+
+    return SequenceTable.load(path)
+
+class SequenceCache:
+    """
+    LRU cache of Gold sequences keyed by (c_init, length)
+
+    Sequences are copied out of the (read-only) cache entries, so callers
+    can not modify shared entries in place. An optional SequenceTable is
+    consulted before generating missing sequences.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, table: Optional[SequenceTable] = None):
+        """
+        Initialize sequence cache
+
+        Args:
+            max_bytes: Memory bound for cached sequences (0 disables caching)
+            table: Optional precomputed sequence table
+        """
+        self.max_bytes = max_bytes
+        self.table = table
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.table_hits = 0
+
+    def load_table(self, path: str, mmap: bool = True) -> 'SequenceCache':
+        """Attach a precomputed table written by build_dmrs_table"""
+        self.table = SequenceTable.load(path, mmap=mmap)
+        return self
+
+    def set_max_bytes(self, max_bytes: int):
+        """Change the memory bound, evicting entries if needed"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Drop all cached sequences and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.table_hits = 0
+
+    def stats(self) -> dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses + self.table_hits
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'table_hits': self.table_hits,
+            'hit_rate': (self.hits + self.table_hits) / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'nbytes': self._nbytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def get(self, c_init: int, length: int) -> np.ndarray:
+        """
+        Get a single Gold sequence
+
+        Args:
+            c_init: 31-bit initialization value
+            length: Number of bits
+
+        Returns:
+            Binary sequence (0s and 1s)
+        """
+        return self.get_many([c_init], length)[0]
+
+    def get_many(self, c_inits, length: int) -> np.ndarray:
+        """
+        Get Gold sequences for many initialization values
+
+        Missing sequences are generated in a single batch.
+
+        Args:
+            c_inits: Sequence of 31-bit initialization values
+            length: Number of bits per sequence
+
+        Returns:
+            Binary sequences (0s and 1s), shape (len(c_inits), length)
+        """
+        c_inits = np.asarray(c_inits, dtype=np.int64).reshape(-1)
+        result = np.empty((c_inits.size, length), dtype=np.int8)
+        missing = []
+
+        with self._lock:
+            for i, c_init in enumerate(c_inits.tolist()):
+                entry = self._entries.get((c_init, length))
+                if entry is None:
+                    missing.append(i)
+                else:
+                    self._entries.move_to_end((c_init, length))
+                    result[i] = entry
+                    self.hits += 1
+
+        if missing and self.table is not None:
+            missing = np.asarray(missing)
+            found, bits = self.table.lookup(c_inits[missing], length)
+            result[missing[found]] = bits
+            self.table_hits += int(found.sum())
+            missing = missing[~found].tolist()
+
+        if missing:
+            unique_c_inits, inverse = np.unique(c_inits[missing], return_inverse=True)
+            generated = generate_gold_sequences(unique_c_inits, length).astype(np.int8)
+            result[missing] = generated[inverse.reshape(-1)]
+            with self._lock:
+                self.misses += len(missing)
+                for c_init, sequence in zip(unique_c_inits.tolist(), generated):
+                    self._store((c_init, length), sequence)
+
+        return result
+
+    def _store(self, key, sequence: np.ndarray):
+        """Insert an entry and evict least recently used ones (lock held)"""
+        if sequence.nbytes > self.max_bytes or key in self._entries:
+            return
+        sequence = sequence.copy()
+        sequence.flags.writeable = False
+        self._entries[key] = sequence
+        self._nbytes += sequence.nbytes
+        self._evict()
+
+    def _evict(self):
+        """Evict least recently used entries until within the memory bound (lock held)"""
+        while self._nbytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+_sequence_cache = SequenceCache()
+
+def get_sequence_cache() -> SequenceCache:
+    """Get the process-wide Gold sequence cache"""
+    return _sequence_cache
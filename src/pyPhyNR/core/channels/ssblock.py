@@ -3,14 +3,16 @@ SS/PBCH Block (SSBlock) - Container for PSS, SSS, and PBCH
 """
 
 import numpy as np
-from typing import Dict, List
+from typing import Union
 from ..channel_types import ChannelType
 from .base import PhysicalChannel
 from .pss import PSS
 from .sss import SSS
 from .pbch import PBCH
 from ..definitions import N_SC_PER_RB
-from ..re_mapping import REMapping
+
+# SSB symbols holding the two PBCH symbols
+PBCH_SYMBOLS = [1, 3]
 
 class SSBlock(PhysicalChannel):
     """
@@ -25,8 +27,10 @@ class SSBlock(PhysicalChannel):
     """
     
     def __init__(self, cell_id: int, start_rb: int, start_symbol: int, slot_pattern: list[int],
-                 ssb_index: int = 0, half_frame: int = 0, power: float = 0.0, 
-                 rnti: int = 0, payload_pattern: str = "0"):
+                 ssb_index: int = 0, half_frame: int = 0, power: float = 0.0,
+                 rnti: int = 0, payload_pattern: str = "0", l_max: int = 4,
+                 dtype: type = np.complex128,
+                 seed: Union[int, np.random.SeedSequence, np.random.Generator, None] = None):
         # SSBlock has fixed dimensions: 240 subcarriers × 4 symbols
         num_rb = 20  # 240 subcarriers = 20 RBs
         num_symbols = 4  # SSBlock occupies 4 symbols
@@ -40,12 +44,15 @@ class SSBlock(PhysicalChannel):
             slot_pattern=slot_pattern,
             power=power,
             rnti=rnti,
-            payload_pattern=payload_pattern
+            payload_pattern=payload_pattern,
+            dtype=dtype,
+            seed=seed
         )
         
         self.cell_id = cell_id
         self.ssb_index = ssb_index
         self.half_frame = half_frame
+        self.l_max = l_max  # Maximum number of SSBs per half frame (4, 8 or 64, from the band)
         
         # Create internal bitmap for RE placement
         self._create_internal_bitmap()
@@ -109,82 +116,42 @@ class SSBlock(PhysicalChannel):
             start_symbol=self.start_symbol + 1,  # Symbol 1
             slot_pattern=self.slot_pattern,
             ssb_index=self.ssb_index,
-            half_frame=self.half_frame
+            half_frame=self.half_frame,
+            l_max=self.l_max,
+            dtype=self.dtype,
+            seed=self.seed
         )
     
     def _generate_ssb_data(self):
         """Generate combined SSB data from all components"""
         n_sc = self.num_rb * N_SC_PER_RB  # 240 subcarriers
-        self.data = np.zeros((n_sc, self.num_symbols), dtype=complex)
-        
-        # Extract data from components and place according to bitmap
-        for sc in range(n_sc):
-            for sym in range(self.num_symbols):
-                re_type = self.re_bitmap[sc, sym]
-                
-                if re_type == 1:  # PSS
-                    # Map to PSS data (centered in 132 subcarriers)
-                    pss_sc = sc - 56  # PSS starts at subcarrier 56
-                    if 0 <= pss_sc < 127:
-                        self.data[sc, sym] = self.pss.data[pss_sc, 0]
-                
-                elif re_type == 2:  # SSS
-                    # Map to SSS data (centered in 132 subcarriers)
-                    sss_sc = sc - 56  # SSS starts at subcarrier 56
-                    if 0 <= sss_sc < 127:
-                        self.data[sc, sym] = self.sss.data[sss_sc, 0]
-                
-                elif re_type == 0:  # PBCH
-                    # Map to PBCH data
-                    pbch_sym = sym - 1  # PBCH uses symbols 1 and 3
-                    if pbch_sym >= 0 and pbch_sym < 2:
-                        self.data[sc, sym] = self.pbch.data[sc, pbch_sym]
-                
-                elif re_type == 3:  # PBCH DMRS
-                    # Map to PBCH DMRS data
-                    pbch_sym = sym - 1  # PBCH uses symbols 1 and 3
-                    if pbch_sym >= 0 and pbch_sym < 2:
-                        # Find DMRS position within PBCH
-                        rb = sc // 12
-                        pos_in_rb = sc % 12
-                        v = self.cell_id % 4
-                        dmrs_positions = [(i * 4 + v) % 12 for i in range(3)]
-                        
-                        if pos_in_rb in dmrs_positions:
-                            dmrs_idx = dmrs_positions.index(pos_in_rb)
-                            self.data[sc, sym] = self.pbch.reference_signal.generate_symbols(1, 1)[dmrs_idx, 0]
-                            
-    def get_re_mapping(self) -> Dict[int, List[REMapping]]:
-        """
-        Get mapping of Resource Elements for this channel
-        
-        Returns:
-            Dictionary mapping slot number to list of RE mappings
-        """
-        mappings = {}
-        
-        for slot in self.slot_pattern:
-            slot_mappings = []
-            time_indices = self.time_indices[slot]
-            
-            for i in self.freq_indices:
-                for j in time_indices:
-                    local_i = i - min(self.freq_indices)
-                    local_j = j - min(time_indices)
-                    
-                    # Use bitmap to determine channel type
-                    ch_type = self.channel_type
-                    if self.re_bitmap[local_i, local_j] == 3:  # PBCH DMRS
-                        ch_type = ChannelType.DL_DMRS
-                    
-                    mapping = REMapping(
-                        subcarrier=i,
-                        symbol=j,
-                        data=self.data[local_i, local_j],
-                        channel_type=ch_type
-                    )
-                    slot_mappings.append(mapping)
-            
-            mappings[slot] = slot_mappings
-        
-        return mappings
+        self.data = np.zeros((n_sc, self.num_symbols), dtype=self.dtype)
+
+        # PSS and SSS: the 127-symbol sequences, centered in their own allocations
+        pss_start = (self.pss.data.shape[0] - 127) // 2
+        sss_start = (self.sss.data.shape[0] - 127) // 2
+        pss_rows = self.re_bitmap[:, 0] == 1
+        sss_rows = self.re_bitmap[:, 2] == 2
+        self.data[pss_rows, 0] = self.pss.data[pss_start:pss_start + 127, 0]
+        self.data[sss_rows, 2] = self.sss.data[sss_start:sss_start + 127, 0]
+
+        # PBCH and its DMRS (placed by PBCH on the same subcarriers)
+        self.data[:, PBCH_SYMBOLS] = self.pbch.data
+
+        # Seeded PBCH: same PSS/SSS/DMRS in every slot, with each slot's PBCH data
+        self.slot_data = {}
+        for slot, pbch_data in self.pbch.slot_data.items():
+            self.slot_data[slot] = self.data.copy()
+            self._place_pbch(self.slot_data[slot], pbch_data)
+
+    def _place_pbch(self, data: np.ndarray, pbch_data: np.ndarray):
+        """Write PBCH data into the PBCH REs of an SSB data block (in place)"""
+        for pbch_sym, sym in enumerate(PBCH_SYMBOLS):
+            rows = self.re_bitmap[:, sym] == 0
+            data[rows, sym] = pbch_data[rows, pbch_sym]
+
+    def _channel_type_block(self, shape) -> np.ndarray:
+        """Get channel type block, marking PBCH DMRS REs as PBCH_DMRS"""
+        return np.where(self.re_bitmap == 3,  # PBCH DMRS
+                        np.uint8(ChannelType.PBCH_DMRS.value),
+                        np.uint8(self.channel_type.value))
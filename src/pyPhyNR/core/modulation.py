@@ -3,6 +3,7 @@ Modulation schemes for 5G NR
 """
 
 from enum import Enum, auto
+from typing import Optional
 import numpy as np
 
 class ModulationType(Enum):
@@ -12,15 +13,103 @@ class ModulationType(Enum):
     QAM64 = auto()
     QAM256 = auto()
 
+# Number of bits per modulation symbol
+BITS_PER_SYMBOL = {
+    ModulationType.BPSK: 1,
+    ModulationType.QPSK: 2,
+    ModulationType.QAM16: 4,
+    ModulationType.QAM64: 6,
+    ModulationType.QAM256: 8,
+}
+
+_constellations = {}
+
+def _build_constellation(modulation: ModulationType) -> np.ndarray:
+    """
+    Build constellation table indexed by packed bits as per 3GPP TS 38.211 5.1
+
+    The first bit of a symbol (b1 in the formulas below) is the MSB of the index.
+    """
+    n_bits = BITS_PER_SYMBOL[modulation]
+    index = np.arange(2**n_bits)
+    b1, b2, b3, b4, b5, b6, b7, b8 = [(index >> (n_bits - 1 - k)) & 1 if k < n_bits else None
+                                      for k in range(8)]
+
+    if modulation == ModulationType.BPSK:
+        return (1/np.sqrt(2)) * ((1 - 2*b1) + 1j*(1 - 2*b1))
+    elif modulation == ModulationType.QPSK:
+        return (1/np.sqrt(2)) * ((1 - 2*b1) + 1j*(1 - 2*b2))
+    elif modulation == ModulationType.QAM16:
+        return (1/np.sqrt(10)) * (
+            (1 - 2*b1) * (2 - (1-2*b3)) + 1j * (1 - 2*b2) * (2 - (1-2*b4))
+        )
+    elif modulation == ModulationType.QAM64:
+        return (1/np.sqrt(42)) * (
+            (1 - 2*b1) * (4 - (1-2*b3) * (2 - (1-2*b5))) +
+            1j * (1 - 2*b2) * (4 - (1-2*b4) * (2 - (1-2*b6)))
+        )
+    elif modulation == ModulationType.QAM256:
+        return (1/np.sqrt(170)) * (
+            (1 - 2*b1) * (8 - (1-2*b3) * (4 - (1-2*b5) * (2 - (1-2*b7)))) +
+            1j * (1 - 2*b2) * (8 - (1-2*b4) * (4 - (1-2*b6) * (2 - (1-2*b8))))
+        )
+    raise NotImplementedError(f"Modulation {modulation} not yet implemented")
+
+def get_constellation(modulation: ModulationType) -> np.ndarray:
+    """
+    Get constellation table for a modulation scheme
+
+    Args:
+        modulation: Modulation type
+
+    Returns:
+        Complex array of 2**bits_per_symbol points, indexed by packed bits (first bit = MSB)
+    """
+    if modulation not in _constellations:
+        table = _build_constellation(modulation)
+        table.flags.writeable = False
+        _constellations[modulation] = table
+    return _constellations[modulation]
+
+def modulate(bits: np.ndarray, modulation: ModulationType, out: np.ndarray = None) -> np.ndarray:
+    """
+    Map bits to modulation symbols as per 3GPP TS 38.211 5.1
+
+    Args:
+        bits: Array of 0s and 1s, length a multiple of the bits per symbol
+        modulation: Modulation type
+        out: Optional C-contiguous complex output buffer with one element per symbol
+
+    Returns:
+        Complex array of modulated symbols (out, if given)
+    """
+    n_bits = BITS_PER_SYMBOL[modulation]
+    bits = np.asarray(bits)
+    if bits.size % n_bits:
+        raise ValueError(f"Number of bits ({bits.size}) must be a multiple of {n_bits} for {modulation.name}")
+    bits = bits.reshape(-1, n_bits)
+
+    # Pack the bits of each symbol into a table index, first bit as MSB
+    index = np.zeros(bits.shape[0], dtype=np.intp)
+    for k in range(n_bits):
+        index <<= 1
+        index |= bits[:, k]
+
+    table = get_constellation(modulation)
+    if out is None:
+        return table[index]
+
+    if out.size != index.size or not out.flags.c_contiguous:
+        raise ValueError(f"Output buffer must be C-contiguous with {index.size} elements")
+    np.take(table.astype(out.dtype, copy=False), index, out=out.reshape(-1))
+    return out
+
 def map_qam64(bits: np.ndarray) -> np.ndarray:
     """
     Map 6 bits to 64QAM symbol as per 3GPP TS 38.211
     (1-2*b1)*(4-(1-2*b3)*(2-(1-2*b5))) + j*(1-2*b2)*(4-(1-2*b4)*(2-(1-2*b6)))
     """
-    b = bits.reshape(-1, 6)  # Group into 6 bits
-    i = (1 - 2*b[:,0]) * (4 - (1-2*b[:,2]) * (2 - (1-2*b[:,4])))
-    q = (1 - 2*b[:,1]) * (4 - (1-2*b[:,3]) * (2 - (1-2*b[:,5])))
-    return (i + 1j*q) / np.sqrt(42)
+    return modulate(bits, ModulationType.QAM64)
 
 def map_qam256(bits: np.ndarray) -> np.ndarray:
     """
@@ -28,12 +117,11 @@ def map_qam256(bits: np.ndarray) -> np.ndarray:
     (1-2*b1)*(8-(1-2*b3)*(4-(1-2*b5)*(2-(1-2*b7)))) + 
     j*(1-2*b2)*(8-(1-2*b4)*(4-(1-2*b6)*(2-(1-2*b8))))
     """
-    b = bits.reshape(-1, 8)  # Group into 8 bits
-    i = (1 - 2*b[:,0]) * (8 - (1-2*b[:,2]) * (4 - (1-2*b[:,4]) * (2 - (1-2*b[:,6]))))
-    q = (1 - 2*b[:,1]) * (8 - (1-2*b[:,3]) * (4 - (1-2*b[:,5]) * (2 - (1-2*b[:,7]))))
-    return (i + 1j*q) / np.sqrt(170)
+    return modulate(bits, ModulationType.QAM256)
 
-def generate_random_symbols(n_sc: int, n_symbols: int, modulation: ModulationType = ModulationType.QPSK) -> np.ndarray:
+def generate_random_symbols(n_sc: int, n_symbols: int, modulation: ModulationType = ModulationType.QPSK,
+                            dtype: type = np.complex128,
+                            rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate random modulated symbols
     
@@ -41,70 +129,77 @@ def generate_random_symbols(n_sc: int, n_symbols: int, modulation: ModulationTyp
         n_sc: Number of subcarriers
         n_symbols: Number of symbols
         modulation: Modulation type
+        dtype: Complex dtype of the symbols
+        rng: Random generator for the bits (None: global np.random state)
         
     Returns:
         Complex array of modulated symbols
     """
+    if modulation not in BITS_PER_SYMBOL:
+        raise NotImplementedError(f"Modulation {modulation} not yet implemented")
+
     total_symbols = n_sc * n_symbols
-    
-    if modulation == ModulationType.QPSK:
-        # QPSK: Generate random bits and map to QPSK symbols
-        bits = np.random.randint(0, 2, total_symbols * 2)  # 2 bits per symbol
-        symbols = np.zeros(total_symbols, dtype=complex)
-        for i in range(total_symbols):
-            b1 = bits[2*i]     # First bit
-            b0 = bits[2*i + 1] # Second bit
-            symbols[i] = (1/np.sqrt(2)) * ((1 - 2*b1) + 1j*(1 - 2*b0))
-    
-    elif modulation == ModulationType.QAM16:
-        # 16QAM: Generate random bits and map to 16QAM symbols
-        bits = np.random.randint(0, 2, total_symbols * 4)  # 4 bits per symbol
-        symbols = np.zeros(total_symbols, dtype=complex)
-        for i in range(total_symbols):
-            b1 = bits[4*i]     # First bit
-            b2 = bits[4*i + 1] # Second bit
-            b3 = bits[4*i + 2] # Third bit
-            b4 = bits[4*i + 3] # Fourth bit
-            symbols[i] = (1/np.sqrt(10)) * (
-                (1 - 2*b1) * (2 - (1-2*b3)) + 1j * (1 - 2*b2) * (2 - (1-2*b4))
-            )
-    
-    elif modulation == ModulationType.QAM64:
-        # 64QAM: Generate random bits and map to 64QAM symbols
-        bits = np.random.randint(0, 2, total_symbols * 6)  # 6 bits per symbol
-        symbols = np.zeros(total_symbols, dtype=complex)
-        for i in range(total_symbols):
-            b1 = bits[6*i]     # First bit
-            b2 = bits[6*i + 1] # Second bit
-            b3 = bits[6*i + 2] # Third bit
-            b4 = bits[6*i + 3] # Fourth bit
-            b5 = bits[6*i + 4] # Fifth bit
-            b6 = bits[6*i + 5] # Sixth bit
-            symbols[i] = (1/np.sqrt(42)) * (
-                (1 - 2*b1) * (4 - (1-2*b3) * (2 - (1-2*b5))) +
-                1j * (1 - 2*b2) * (4 - (1-2*b4) * (2 - (1-2*b6)))
-            )
-        
-    
-    elif modulation == ModulationType.QAM256:
-        # 256QAM: Generate random bits and map to 256QAM symbols
-        bits = np.random.randint(0, 2, total_symbols * 8)  # 8 bits per symbol
-        symbols = np.zeros(total_symbols, dtype=complex)
-        for i in range(total_symbols):
-            b1 = bits[8*i]     # First bit
-            b2 = bits[8*i + 1] # Second bit
-            b3 = bits[8*i + 2] # Third bit
-            b4 = bits[8*i + 3] # Fourth bit
-            b5 = bits[8*i + 4] # Fifth bit
-            b6 = bits[8*i + 5] # Sixth bit
-            b7 = bits[8*i + 6] # Seventh bit
-            b8 = bits[8*i + 7] # Eighth bit
-            symbols[i] = (1/np.sqrt(170)) * (
-                (1 - 2*b1) * (8 - (1-2*b3) * (4 - (1-2*b5) * (2 - (1-2*b7)))) +
-                1j * (1 - 2*b2) * (8 - (1-2*b4) * (4 - (1-2*b6) * (2 - (1-2*b8))))
-            )
-    
+    n_bits = total_symbols * BITS_PER_SYMBOL[modulation]
+    if rng is None:
+        bits = np.random.randint(0, 2, n_bits)
     else:
-        raise NotImplementedError(f"Modulation {modulation} not yet implemented")
-    
-    return symbols.reshape(n_sc, n_symbols)
\ No newline at end of file
+        bits = rng.integers(0, 2, n_bits, dtype=np.uint8)
+    symbols = modulate(bits, modulation, out=np.empty(total_symbols, dtype=dtype))
+
+    return symbols.reshape(n_sc, n_symbols)
+
+_decision_tables = {}
+
+def _get_decision_table(modulation: ModulationType):
+    """
+    Get per-axis decision levels and the (I level, Q level) -> bits table
+
+    NR QAM constellations are square grids, so the nearest point is found
+    by deciding I and Q separately.
+    """
+    if modulation not in _decision_tables:
+        table = get_constellation(modulation)
+        levels = np.unique(np.round(table.real, 12))
+        step = levels[1] - levels[0]
+        i_level = np.rint((table.real - levels[0]) / step).astype(np.intp)
+        q_level = np.rint((table.imag - levels[0]) / step).astype(np.intp)
+        index = np.zeros((levels.size, levels.size), dtype=np.intp)
+        index[i_level, q_level] = np.arange(table.size)
+        _decision_tables[modulation] = (levels[0], step, index)
+    return _decision_tables[modulation]
+
+def hard_decision(symbols: np.ndarray, modulation: ModulationType) -> np.ndarray:
+    """
+    Decide the nearest constellation point of (equalized) symbols
+
+    Args:
+        symbols: Complex symbols of any shape
+        modulation: Modulation type
+
+    Returns:
+        Packed bits of each decided point (first bit = MSB), same shape as symbols
+    """
+    symbols = np.asarray(symbols)
+    if modulation == ModulationType.BPSK:
+        # The two BPSK points lie on the diagonal
+        return (symbols.real + symbols.imag < 0).astype(np.intp)
+
+    first, step, index = _get_decision_table(modulation)
+    last = index.shape[0] - 1
+    i_level = np.clip(np.rint((symbols.real - first) / step), 0, last).astype(np.intp)
+    q_level = np.clip(np.rint((symbols.imag - first) / step), 0, last).astype(np.intp)
+    return index[i_level, q_level]
+
+def count_bit_errors(decided: np.ndarray, reference: np.ndarray) -> int:
+    """
+    Count differing bits between packed-bit symbol decisions
+
+    Args:
+        decided: Packed bits per symbol (see hard_decision)
+        reference: Packed bits per symbol of the transmitted symbols
+
+    Returns:
+        Number of bit errors
+    """
+    differences = np.bitwise_xor(decided, reference).astype(np.uint8)  # At most 8 bits per symbol
+    return int(np.unpackbits(differences.reshape(-1)).sum())
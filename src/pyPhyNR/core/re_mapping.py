@@ -3,6 +3,8 @@ Resource Element mapping classes
 """
 
 from dataclasses import dataclass
+from typing import List, Union
+import numpy as np
 from .channel_types import ChannelType
 
 @dataclass
@@ -13,3 +15,32 @@ class REMapping:
     data: complex    # Complex data value
     channel_type: ChannelType  # Type of channel occupying this RE
 
+@dataclass
+class SlotMapping:
+    """
+    Block mapping of a channel onto the grid for one slot
+
+    The grid is written as values[subcarriers, symbols] = data, so data and
+    channel_types have shape (n_subcarriers, n_symbols) of the indexed block.
+    """
+    subcarriers: Union[slice, np.ndarray]  # Absolute subcarrier slice or index array
+    symbols: slice                         # Absolute symbol slice
+    data: np.ndarray                       # Complex data block
+    channel_types: np.ndarray              # ChannelType.value block (uint8)
+
+    def to_re_mappings(self) -> List[REMapping]:
+        """Expand the block into per-RE mappings (compatibility, slow)"""
+        sc_indices = np.arange(self.subcarriers.stop)[self.subcarriers] \
+            if isinstance(self.subcarriers, slice) else np.asarray(self.subcarriers)
+        sym_indices = range(self.symbols.start, self.symbols.stop)
+
+        mappings = []
+        for local_i, sc in enumerate(sc_indices):
+            for local_j, sym in enumerate(sym_indices):
+                mappings.append(REMapping(
+                    subcarrier=int(sc),
+                    symbol=sym,
+                    data=self.data[local_i, local_j],
+                    channel_type=ChannelType(int(self.channel_types[local_i, local_j]))
+                ))
+        return mappings
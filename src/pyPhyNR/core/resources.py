@@ -1,7 +1,85 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import numpy as np
 from .channel_types import ChannelType
+from .definitions import N_SYMBOLS_PER_SLOT
+from .shared_arrays import shared_empty
+
+# Channel types that may be written on top of an already occupied RE:
+# new channel type -> set of existing channel types it may overlay
+ALLOWED_OVERLAPS = {
+    ChannelType.PDCCH: {ChannelType.CORESET},  # PDCCH can be added on top of CORESET
+}
+
+def _build_overlap_table() -> np.ndarray:
+    """Build boolean lookup table indexed by [existing.value, new.value]"""
+    size = max(ch.value for ch in ChannelType) + 1
+    table = np.zeros((size, size), dtype=bool)
+    # Anything can be added to an empty RE
+    table[ChannelType.EMPTY.value, :] = True
+    for new_type, existing_types in ALLOWED_OVERLAPS.items():
+        for existing_type in existing_types:
+            table[existing_type.value, new_type.value] = True
+    return table
+
+OVERLAP_TABLE = _build_overlap_table()
+
+def find_conflict(channel_types: np.ndarray, channel_type: ChannelType, subcarriers, symbols):
+    """
+    Find the first RE a channel can not be written to
+
+    Args:
+        channel_types: ChannelType.value plane
+        channel_type: Type of the channel being added
+        subcarriers: Subcarrier indices (array or slice)
+        symbols: Symbol indices (array or slice), broadcast against subcarriers
+
+    Returns:
+        (subcarrier, symbol, occupying ChannelType) of the first conflict, or None
+    """
+    existing = channel_types[subcarriers, symbols]
+    allowed = OVERLAP_TABLE[existing, channel_type.value]
+    if allowed.all():
+        return None
+
+    # Locate the first conflicting RE, indexing coordinate planes the same way
+    first = np.unravel_index(np.argmin(allowed), allowed.shape)
+    n_subcarriers, n_symbols = channel_types.shape
+    sc_plane = np.broadcast_to(np.arange(n_subcarriers)[:, None], channel_types.shape)
+    sym_plane = np.broadcast_to(np.arange(n_symbols)[None, :], channel_types.shape)
+    sc = int(sc_plane[subcarriers, symbols][first])
+    sym = int(sym_plane[subcarriers, symbols][first])
+    return sc, sym, ChannelType(int(channel_types[sc, sym]))
+
+def mapping_slots(mapping) -> range:
+    """Get the slots a SlotMapping's symbols fall in"""
+    return range(mapping.symbols.start // N_SYMBOLS_PER_SLOT,
+                 (mapping.symbols.stop - 1) // N_SYMBOLS_PER_SLOT + 1)
+
+class SlotVersionTracking:
+    """Per-slot modification counters shared by the grid classes"""
+    _slot_versions: np.ndarray
+
+    @property
+    def slot_versions(self) -> np.ndarray:
+        """Per-slot modification counters; a slot changed if its counter changed"""
+        return self._slot_versions.copy()
+
+    def mark_dirty(self, slots=None):
+        """
+        Mark slots as modified
+
+        Call this after writing to the values plane directly.
+
+        Args:
+            slots: Slot indices (None: all slots)
+        """
+        if slots is None:
+            self._slot_versions += 1
+            return
+        slots = np.asarray(list(slots), dtype=int)
+        slots = slots[(slots >= 0) & (slots < self._slot_versions.size)]
+        self._slot_versions[np.unique(slots)] += 1
 
 @dataclass
 class ResourceElement:
@@ -10,58 +88,270 @@ class ResourceElement:
     symbol: int      # Absolute symbol index in grid
     channel_type: ChannelType = ChannelType.EMPTY  # Type of channel occupying this RE
     data: complex = 0+0j  # Complex data value for this RE
-    
+
     def can_add_channel(self, new_channel) -> bool:
         """Check if a new channel can be added to this RE"""
-        if self.channel_type == ChannelType.EMPTY:
-            return True
-        # PDCCH can be added on top of CORESET
-        if new_channel.channel_type == ChannelType.PDCCH and self.channel_type == ChannelType.CORESET:
-            return True
-        return False
+        return bool(OVERLAP_TABLE[self.channel_type.value, new_channel.channel_type.value])
 
 @dataclass
-class ResourceGrid:
-    """2D Resource Grid for 5G NR"""
+class ResourceGrid(SlotVersionTracking):
+    """
+    2D Resource Grid for 5G NR
+
+    The grid is stored as two contiguous planes of shape (n_subcarriers, n_symbols):
+    a complex value plane and a uint8 plane holding ChannelType values.
+    ResourceElement objects are only created on demand.
+    """
     n_subcarriers: int  # Y-axis
     n_symbols: int  # X-axis
-    grid: np.ndarray = field(init=False)  # Array of ResourceElements
+    dtype: type = np.complex128  # Value plane dtype (complex64 or complex128)
+    shared: bool = False  # Allocate the value plane in shared memory (read in place by process workers)
+    _values: np.ndarray = field(init=False, repr=False)  # Complex RE values
+    _channel_types: np.ndarray = field(init=False, repr=False)  # ChannelType.value per RE
+    _slot_versions: np.ndarray = field(init=False, repr=False)  # Modification counter per slot
 
     def __post_init__(self):
-        # Initialize grid with empty REs, each knowing its position
-        self.grid = np.array([[ResourceElement(subcarrier=sc, symbol=sym) 
-                              for sym in range(self.n_symbols)]
-                             for sc in range(self.n_subcarriers)], dtype=object)
+        if self.shared:
+            self._values = shared_empty((self.n_subcarriers, self.n_symbols), self.dtype)
+            self._values[...] = 0
+        else:
+            self._values = np.zeros((self.n_subcarriers, self.n_symbols), dtype=self.dtype)
+        self._channel_types = np.full((self.n_subcarriers, self.n_symbols),
+                                      ChannelType.EMPTY.value, dtype=np.uint8)
+        self._slot_versions = np.zeros(-(-self.n_symbols // N_SYMBOLS_PER_SLOT), dtype=np.int64)
 
     def add_channel(self, channel):
         """Add a physical channel to the grid"""
-        # Get channel's RE mapping
-        re_mapping = channel.get_re_mapping()
-        
+        # Get channel's block mapping (one index block per slot)
+        slot_mappings = channel.get_slot_mappings()
+
         # Check for conflicts first
-        for slot, mappings in re_mapping.items():
-            for mapping in mappings:
-                re = self.grid[mapping.subcarrier, mapping.symbol]
-                if not re.can_add_channel(channel):
-                    raise ValueError(f"Cannot add {channel.channel_type} - resource at RB {mapping.subcarrier//12}, symbol {mapping.symbol} already occupied by {re.channel_type}")
-        
-        
+        for mapping in slot_mappings.values():
+            self._check_conflicts(channel.channel_type, mapping.subcarriers, mapping.symbols)
+
         # Then add channel data
-        for slot, mappings in re_mapping.items():
-            for mapping in mappings:
-                re = self.grid[mapping.subcarrier, mapping.symbol]
-                re.data = mapping.data
-                re.channel_type = mapping.channel_type
+        for mapping in slot_mappings.values():
+            self._values[mapping.subcarriers, mapping.symbols] = mapping.data
+            self._channel_types[mapping.subcarriers, mapping.symbols] = mapping.channel_types
+            self.mark_dirty(mapping_slots(mapping))
+
+    def apply_overlay(self, overlay):
+        """
+        Apply an in-place grid operation (e.g. DMRSInsertion) to the grid
+
+        Args:
+            overlay: Object with apply(values, channel_types, first_symbol) and a slots attribute
+        """
+        overlay.apply(self._values, self._channel_types, 0)
+        self.mark_dirty(overlay.slots)
+
+    def render_slots(self, first_slot: int, n_slots: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the value and channel type planes of consecutive slots
+
+        Args:
+            first_slot: First slot index
+            n_slots: Number of slots
+
+        Returns:
+            Tuple of (values, channel_types) views of shape (n_subcarriers, n_slots * 14)
+        """
+        sym_start = first_slot * N_SYMBOLS_PER_SLOT
+        sym_end = sym_start + n_slots * N_SYMBOLS_PER_SLOT
+        return self._values[:, sym_start:sym_end], self._channel_types[:, sym_start:sym_end]
+
+    def _check_conflicts(self, channel_type: ChannelType, subcarriers, symbols):
+        """
+        Check that a channel can be written to the given REs
+
+        Args:
+            channel_type: Type of the channel being added
+            subcarriers: Subcarrier indices (array or slice)
+            symbols: Symbol indices (array or slice), broadcast against subcarriers
+
+        Raises:
+            ValueError: If any RE is occupied by a channel that cannot be overlaid
+        """
+        conflict = find_conflict(self._channel_types, channel_type, subcarriers, symbols)
+        if conflict is not None:
+            sc, sym, occupied_by = conflict
+            raise ValueError(f"Cannot add {channel_type} - resource at RB {sc//12}, symbol {sym} already occupied by {occupied_by}")
+
+    def get_element(self, subcarrier: int, symbol: int) -> ResourceElement:
+        """
+        Get a ResourceElement snapshot of a single RE
+
+        Args:
+            subcarrier: Absolute subcarrier index
+            symbol: Absolute symbol index
+
+        Returns:
+            ResourceElement holding the current channel type and value
+        """
+        return ResourceElement(
+            subcarrier=subcarrier,
+            symbol=symbol,
+            channel_type=ChannelType(int(self._channel_types[subcarrier, symbol])),
+            data=complex(self._values[subcarrier, symbol])
+        )
+
+    def set_element(self, element: ResourceElement):
+        """Write a ResourceElement back into the grid planes"""
+        self._values[element.subcarrier, element.symbol] = element.data
+        self._channel_types[element.subcarrier, element.symbol] = element.channel_type.value
+        self.mark_dirty([element.symbol // N_SYMBOLS_PER_SLOT])
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        Object array of ResourceElement snapshots (built on demand)
+
+        Kept for compatibility only; this is slow and memory hungry for large
+        carriers. Changes to the returned elements are not written back, use
+        set_element() for that.
+        """
+        return np.array([[self.get_element(sc, sym) for sym in range(self.n_symbols)]
+                         for sc in range(self.n_subcarriers)], dtype=object)
+
+    @property
+    def channel_types(self) -> np.ndarray:
+        """Get array of channel type values (ChannelType.value, uint8) for plotting"""
+        return self._channel_types
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Get array of complex values
+
+        This is the live value plane, not a copy. After writing to it
+        directly, call mark_dirty() for the touched slots, otherwise an
+        incremental WaveformGenerator keeps returning the previous frame.
+        """
+        return self._values
+
+class LazyResourceGrid(SlotVersionTracking):
+    """
+    Resource grid that renders slot content on demand
+
+    Channels and overlays are registered as descriptors; the frequency
+    domain content of a slot is only built when render_slots() is called
+    and is not kept afterwards, so memory scales with the rendered slots
+    instead of the whole frame.
+    """
+
+    def __init__(self, n_subcarriers: int, n_symbols: int, dtype: type = np.complex128):
+        self.n_subcarriers = n_subcarriers
+        self.n_symbols = n_symbols
+        self.dtype = dtype
+        self.n_slots = -(-n_symbols // N_SYMBOLS_PER_SLOT)
+        # Operations touching each slot, in the order they were added
+        self._slot_ops: Dict[int, List[tuple]] = {}
+        self._slot_versions = np.zeros(self.n_slots, dtype=np.int64)
+
+    def add_channel(self, channel):
+        """Register a physical channel on the grid"""
+        slot_mappings = channel.get_slot_mappings()
+
+        # Split each mapping into the slots its symbols fall in
+        slot_ops = {}
+        for mapping in slot_mappings.values():
+            for slot in mapping_slots(mapping):
+                slot_ops.setdefault(slot, []).append(('mapping', mapping))
+
+        # Check for conflicts against the already registered content
+        for slot, ops in slot_ops.items():
+            _, channel_types = self._render_slot(slot)
+            for _, mapping in ops:
+                conflict = find_conflict(channel_types, channel.channel_type,
+                                         mapping.subcarriers, self._local_symbols(mapping, slot))
+                if conflict is not None:
+                    sc, sym, occupied_by = conflict
+                    sym += slot * N_SYMBOLS_PER_SLOT
+                    raise ValueError(f"Cannot add {channel.channel_type} - resource at RB {sc//12}, symbol {sym} already occupied by {occupied_by}")
+
+        for slot, ops in slot_ops.items():
+            self._slot_ops.setdefault(slot, []).extend(ops)
+        self.mark_dirty(slot_ops.keys())
+
+    def apply_overlay(self, overlay):
+        """
+        Register an in-place grid operation (e.g. DMRSInsertion)
+
+        Args:
+            overlay: Object with apply(values, channel_types, first_symbol) and a slots attribute
+        """
+        for slot in overlay.slots:
+            if 0 <= slot < self.n_slots:
+                self._slot_ops.setdefault(slot, []).append(('overlay', overlay))
+        self.mark_dirty(overlay.slots)
+
+    def render_slots(self, first_slot: int, n_slots: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Render the value and channel type planes of consecutive slots
+
+        Args:
+            first_slot: First slot index
+            n_slots: Number of slots
+
+        Returns:
+            Tuple of (values, channel_types) of shape (n_subcarriers, n_slots * 14)
+        """
+        rendered = [self._render_slot(slot) for slot in range(first_slot, first_slot + n_slots)]
+        if n_slots == 1:
+            return rendered[0]
+        return (np.concatenate([values for values, _ in rendered], axis=1),
+                np.concatenate([channel_types for _, channel_types in rendered], axis=1))
+
+    def to_grid(self) -> ResourceGrid:
+        """Render all slots into a regular ResourceGrid"""
+        grid = ResourceGrid(self.n_subcarriers, self.n_symbols, self.dtype)
+        for slot in self._slot_ops:
+            values, channel_types = self._render_slot(slot)
+            sym_start = slot * N_SYMBOLS_PER_SLOT
+            n = min(N_SYMBOLS_PER_SLOT, self.n_symbols - sym_start)
+            grid._values[:, sym_start:sym_start + n] = values[:, :n]
+            grid._channel_types[:, sym_start:sym_start + n] = channel_types[:, :n]
+        return grid
 
     @property
-    def channel_types(self):
-        """Get array of channel types for plotting"""
-        return np.array([[re.channel_type for re in row] for row in self.grid])
+    def channel_types(self) -> np.ndarray:
+        """Get array of channel type values for the whole frame (rendered on each call)"""
+        return self.to_grid().channel_types
 
     @property
-    def values(self):
-        """Get array of complex values"""
-        values_array = np.array([[re.data for re in row] for row in self.grid])
-        
-        
-        return values_array
\ No newline at end of file
+    def values(self) -> np.ndarray:
+        """Get array of complex values for the whole frame (rendered on each call)"""
+        return self.to_grid().values
+
+    def _render_slot(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Render one slot from the registered operations"""
+        values = np.zeros((self.n_subcarriers, N_SYMBOLS_PER_SLOT), dtype=self.dtype)
+        channel_types = np.full((self.n_subcarriers, N_SYMBOLS_PER_SLOT),
+                                ChannelType.EMPTY.value, dtype=np.uint8)
+
+        for kind, op in self._slot_ops.get(slot, []):
+            if kind == 'mapping':
+                local_symbols = self._local_symbols(op, slot)
+                data_columns = self._data_columns(op, slot)
+                values[op.subcarriers, local_symbols] = op.data[:, data_columns]
+                channel_types[op.subcarriers, local_symbols] = op.channel_types[:, data_columns]
+            else:
+                op.apply(values, channel_types, slot * N_SYMBOLS_PER_SLOT)
+
+        return values, channel_types
+
+    @staticmethod
+    def _local_symbols(mapping, slot: int) -> slice:
+        """Symbols of a mapping that fall in a slot, relative to the slot start"""
+        slot_start = slot * N_SYMBOLS_PER_SLOT
+        start = max(mapping.symbols.start, slot_start)
+        stop = min(mapping.symbols.stop, slot_start + N_SYMBOLS_PER_SLOT)
+        return slice(start - slot_start, stop - slot_start)
+
+    @staticmethod
+    def _data_columns(mapping, slot: int) -> slice:
+        """Columns of a mapping's data block that fall in a slot"""
+        slot_start = slot * N_SYMBOLS_PER_SLOT
+        start = max(mapping.symbols.start, slot_start)
+        stop = min(mapping.symbols.stop, slot_start + N_SYMBOLS_PER_SLOT)
+        return slice(start - mapping.symbols.start, stop - mapping.symbols.start)
@@ -0,0 +1,67 @@
+"""
+NumPy arrays backed by shared memory blocks, for zero-copy process pool work
+"""
+
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+# Start address -> SharedMemory of every live shared_empty() array
+_blocks: Dict[int, shared_memory.SharedMemory] = {}
+
+def shared_empty(shape, dtype) -> np.ndarray:
+    """
+    Allocate an array in a new shared memory block
+
+    The block stays alive (and attachable by name from other processes) as
+    long as the array or any view of it is referenced; it is unlinked once
+    the array is garbage collected.
+
+    Args:
+        shape: Array shape
+        dtype: Array dtype
+
+    Returns:
+        ndarray whose buffer is the shared memory block
+    """
+    dtype = np.dtype(dtype)
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    address = array.ctypes.data
+    _blocks[address] = shm
+    weakref.finalize(array, _release_block, address)
+    return array
+
+def _release_block(address: int):
+    """Close and unlink the block of a collected shared_empty() array"""
+    shm = _blocks.pop(address, None)
+    if shm is None:
+        return
+    try:
+        shm.close()
+    except BufferError:
+        pass  # Still exported (interpreter exit); the mapping goes with the process
+    shm.unlink()
+
+def shared_block(array: np.ndarray) -> Optional[Tuple[str, int, int]]:
+    """
+    Find the shared memory block an array lives in
+
+    Args:
+        array: Array, or a view of an array, allocated with shared_empty()
+
+    Returns:
+        Tuple of (block name, element offset of array in the block, number
+        of elements in the block), or None if the array is not a C-contiguous
+        part of a shared_empty() block
+    """
+    root = array
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    shm = _blocks.get(root.ctypes.data)
+    if shm is None or not array.flags.c_contiguous or array.dtype != root.dtype:
+        return None
+    offset = (array.ctypes.data - root.ctypes.data) // array.itemsize
+    return shm.name, offset, root.size
@@ -3,14 +3,58 @@ Signal Builder for 5G NR
 Provides a high-level interface for creating 5G NR signals
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import List, Optional, Dict, Any, Callable, Iterator, Union
 import numpy as np
 from .carrier import CarrierConfig
 from .channels import SSBlock, CORESET, PDCCH, PDSCH
+from .channels.dmrs import DMRSInsertion
 from .modulation import ModulationType
-from .waveform import WaveformGenerator
-from .channel_types import ChannelType
+from .waveform import WaveformGenerator, DEFAULT_SYMBOL_CACHE_BYTES
+from ..io.iq_writer import IQWriter, DEFAULT_BACKOFF_DB
+from ..io.waveform_cache import WaveformCache, DEFAULT_CACHE_BYTES, stable_hash
+
+def _seed_description(seed) -> Any:
+    """Get a JSON description of a channel seed (int or SeedSequence)"""
+    seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    entropy = seq.entropy
+    entropy = [int(e) for e in entropy] if np.ndim(entropy) else int(entropy)
+    return {'entropy': entropy, 'spawn_key': [int(k) for k in seq.spawn_key]}
+
+def _channel_description(channel) -> Optional[Dict[str, Any]]:
+    """
+    Get a JSON description of a channel for config_hash()
+
+    Returns:
+        Description, or None if the channel has a random payload that is not
+        reproducible (no seed, or a Generator)
+    """
+    seed = channel.seed
+    if isinstance(seed, np.random.Generator):
+        return None
+    if seed is None and not (isinstance(channel, CORESET) or getattr(channel, 'deterministic', False)):
+        return None
+
+    description = {
+        'class': type(channel).__name__,
+        'channel_type': channel.channel_type.name,
+        'start_rb': channel.start_rb,
+        'num_rb': channel.num_rb,
+        'start_symbol': channel.start_symbol,
+        'num_symbols': channel.num_symbols,
+        'slot_pattern': [int(slot) for slot in channel.slot_pattern],
+        'power': float(channel.power),
+        'rnti': channel.rnti,
+        'payload_pattern': channel.payload_pattern,
+        'dtype': np.dtype(channel.dtype).name,
+        'seed': None if seed is None else _seed_description(seed),
+    }
+    for name in ('modulation', 'cell_id', 'ssb_index', 'half_frame', 'l_max', 'deterministic'):
+        if hasattr(channel, name):
+            value = getattr(channel, name)
+            description[name] = value.name if isinstance(value, Enum) else value
+    return description
 
 class PDSCHBuilder:
     """Builder for PDSCH with fluent API for adding DMRS"""
@@ -48,10 +92,12 @@ class CarrierParameters:
     fft_size: Optional[int] = None
     num_rb: Optional[int] = None
     cp_type: str = "normal"
+    dtype: type = np.complex128
 
 class NRSignalBuilder:
     """High-level interface for creating 5G NR signals"""
-    def __init__(self, bandwidth_mhz: int, numerology: int, cell_id: int):
+    def __init__(self, bandwidth_mhz: int, numerology: int, cell_id: int,
+                 seed: Union[int, np.random.SeedSequence, np.random.Generator, None] = None):
         """
         Initialize signal builder
         
@@ -59,20 +105,34 @@ class NRSignalBuilder:
             bandwidth_mhz: Carrier bandwidth in MHz
             numerology: Numerology (0=15kHz, 1=30kHz, etc)
             cell_id: Physical cell ID
+            seed: Seed, SeedSequence or Generator for the channel payloads
+                  (None: global np.random state). Every added channel gets its
+                  own child stream, and every slot of a channel its own stream
+                  derived from it.
         """
         self.carrier_params = CarrierParameters(
             bandwidth_mhz=bandwidth_mhz,
             numerology=numerology
         )
         self.cell_id = cell_id
+        if isinstance(seed, np.random.Generator):
+            seed = seed.bit_generator.seed_seq.spawn(1)[0]  # Child of the Generator's seed
+        self.seed = seed
+        self.seed_sequence = self._root_seed_sequence()
         self.carrier_config = None
         self.grid = None
+        self.channels = []  # Channels added to the grid, in order
+        self.overlays = []  # (number of channels added before it, overlay) in order
+        self._grid_versions = None  # Grid slot versions after the last add_* call
+        self.waveform_generator = WaveformGenerator()
+        self.waveform_cache = None
         
     def configure_carrier(self, 
                          sample_rate: Optional[float] = None,
                          fft_size: Optional[int] = None,
                          num_rb: Optional[int] = None,
-                         cp_type: str = "normal") -> 'NRSignalBuilder':
+                         cp_type: str = "normal",
+                         dtype: type = np.complex128) -> 'NRSignalBuilder':
         """
         Configure carrier parameters
         
@@ -81,6 +141,7 @@ class NRSignalBuilder:
             fft_size: FFT size
             num_rb: Number of resource blocks
             cp_type: Cyclic prefix type ('normal' or 'extended')
+            dtype: Sample dtype of channel data, grid and IQ (complex64 or complex128)
             
         Returns:
             Self for method chaining
@@ -89,12 +150,72 @@ class NRSignalBuilder:
         self.carrier_params.fft_size = fft_size
         self.carrier_params.num_rb = num_rb
         self.carrier_params.cp_type = cp_type
+        self.carrier_params.dtype = dtype
         return self
     
-    def initialize_grid(self) -> 'NRSignalBuilder':
+    def configure_waveform(self,
+                           workers: int = 1,
+                           executor: str = 'process',
+                           symbol_cache_bytes: int = DEFAULT_SYMBOL_CACHE_BYTES,
+                           fft_backend: Optional[str] = None,
+                           incremental: bool = False) -> 'NRSignalBuilder':
+        """
+        Configure waveform synthesis
+
+        Args:
+            workers: Number of workers the slots of a frame are split across
+            executor: Worker pool type, 'process' or 'thread'. Process workers
+                      read the grid in place if it was initialized after this
+                      call (initialize_grid() allocates it in shared memory)
+            symbol_cache_bytes: Memory bound of the symbol cache (0 disables it)
+            fft_backend: FFT backend ('numpy', 'scipy', 'pyfftw'; None: global default)
+            incremental: Only regenerate slots whose version changed since the
+                         last frame. Direct writes to grid.values must then be
+                         followed by grid.mark_dirty(), or the old frame is returned
+
+        Returns:
+            Self for method chaining
+        """
+        self.waveform_generator.close()
+        self.waveform_generator = WaveformGenerator(
+            incremental=incremental,
+            symbol_cache_bytes=symbol_cache_bytes,
+            workers=workers,
+            executor=executor,
+            fft_backend=fft_backend
+        )
+        return self
+
+    def configure_cache(self, directory: Optional[str],
+                        max_bytes: int = DEFAULT_CACHE_BYTES) -> 'NRSignalBuilder':
+        """
+        Configure the on-disk waveform cache used by generate_signal()
+
+        Waveforms are stored under config_hash(), so a builder configured the
+        same way (including its seed) gets the stored samples back as a
+        memory map instead of synthesizing them again. Direct writes to
+        grid.values must be followed by grid.mark_dirty(), otherwise the
+        stale cached waveform is served.
+
+        Args:
+            directory: Cache directory (None disables the cache)
+            max_bytes: Size cap of the directory; least recently used waveforms
+                       are evicted beyond it
+
+        Returns:
+            Self for method chaining
+        """
+        self.waveform_cache = None if directory is None else WaveformCache(directory, max_bytes)
+        return self
+
+    def initialize_grid(self, lazy: bool = False) -> 'NRSignalBuilder':
         """
         Initialize resource grid with current configuration
         
+        Args:
+            lazy: If True, use a LazyResourceGrid that renders slot content
+                  only when the waveform generator asks for it
+
         Returns:
             Self for method chaining
         """
@@ -111,10 +232,39 @@ class NRSignalBuilder:
             self.carrier_config.set_fft_size(self.carrier_params.fft_size)
         if self.carrier_params.num_rb:
             self.carrier_config.n_resource_blocks = self.carrier_params.num_rb
+        self.carrier_config.n_cell_id = self.cell_id
+        self.carrier_config.set_dtype(self.carrier_params.dtype)
             
-        # Create grid
-        self.grid = self.carrier_config.get_resource_grid()
+        # Create grid; process workers read a shared value plane in place
+        self.grid = self.carrier_config.get_resource_grid(
+            lazy=lazy, shared=self.waveform_generator.uses_processes)
+        self.channels = []
+        self.overlays = []
+        self._grid_versions = self.grid.slot_versions
+        self.seed_sequence = self._root_seed_sequence()  # Same channel streams on every rebuild
         return self
+
+    def _root_seed_sequence(self) -> Optional[np.random.SeedSequence]:
+        """Get a fresh root SeedSequence for the builder seed (None if unseeded)"""
+        if self.seed is None:
+            return None
+        root = self.seed if isinstance(self.seed, np.random.SeedSequence) else np.random.SeedSequence(self.seed)
+        # Fresh copy, so spawning does not advance the caller's SeedSequence
+        return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key, pool_size=root.pool_size)
+
+    def _channel_seed(self) -> Optional[np.random.SeedSequence]:
+        """
+        Get the seed of the next added channel
+
+        Channels are seeded by the order in which they are added, so the same
+        builder seed and sequence of add_* calls gives the same payloads.
+
+        Returns:
+            Child SeedSequence, or None if the builder is unseeded
+        """
+        if self.seed_sequence is None:
+            return None
+        return self.seed_sequence.spawn(1)[0]
     
     def get_carrier_config(self) -> Dict[str, Any]:
         """Get current carrier configuration"""
@@ -127,7 +277,8 @@ class NRSignalBuilder:
             'sample_rate': self.carrier_config.sample_rate,
             'fft_size': self.carrier_config.fft_size,
             'num_rb': self.carrier_config.n_resource_blocks,
-            'cp_type': self.carrier_params.cp_type
+            'cp_type': self.carrier_params.cp_type,
+            'dtype': np.dtype(self.carrier_config.dtype).name
         }
     
     def add_coreset_pdcch(self,
@@ -167,9 +318,12 @@ class NRSignalBuilder:
             slot_pattern=slot_pattern,
             power=power,
             rnti=rnti,
-            payload_pattern=payload_pattern
+            payload_pattern=payload_pattern,
+            dtype=self.carrier_config.dtype
         )
         self.grid.add_channel(coreset)
+        self.channels.append(coreset)
+        self._grid_versions = self.grid.slot_versions
         
         # Add PDCCH on top of CORESET
         pdcch = PDCCH(
@@ -181,9 +335,13 @@ class NRSignalBuilder:
             cell_id=self.cell_id,
             power=power,
             rnti=rnti,
-            payload_pattern=payload_pattern
+            payload_pattern=payload_pattern,
+            dtype=self.carrier_config.dtype,
+            seed=self._channel_seed()
         )
         self.grid.add_channel(pdcch)
+        self.channels.append(pdcch)
+        self._grid_versions = self.grid.slot_versions
         return self
         
     def add_ssb(self, 
@@ -192,7 +350,8 @@ class NRSignalBuilder:
                 slot_pattern: List[int],
                 power: float = 0.0,
                 ssb_index: int = 0,
-                half_frame: int = 0) -> 'NRSignalBuilder':
+                half_frame: int = 0,
+                l_max: int = 4) -> 'NRSignalBuilder':
         """
         Add SS/PBCH Block
         
@@ -203,6 +362,7 @@ class NRSignalBuilder:
             power: Power scaling in dB
             ssb_index: SSB index
             half_frame: Half frame index
+            l_max: Maximum number of SSBs per half frame (4, 8 or 64, depends on the band)
             
         Returns:
             Self for method chaining
@@ -217,9 +377,14 @@ class NRSignalBuilder:
             slot_pattern=slot_pattern,
             ssb_index=ssb_index,
             half_frame=half_frame,
-            power=power
+            l_max=l_max,
+            power=power,
+            dtype=self.carrier_config.dtype,
+            seed=self._channel_seed()
         )
         self.grid.add_channel(ssb)
+        self.channels.append(ssb)
+        self._grid_versions = self.grid.slot_versions
         return self
     
     def add_pdsch(self,
@@ -265,9 +430,13 @@ class NRSignalBuilder:
             power=power,
             rnti=rnti,
             payload_pattern=payload_pattern,
-            deterministic=deterministic
+            deterministic=deterministic,
+            dtype=self.carrier_config.dtype,
+            seed=self._channel_seed()
         )
         self.grid.add_channel(pdsch)
+        self.channels.append(pdsch)
+        self._grid_versions = self.grid.slot_versions
         return PDSCHBuilder(self, pdsch)
     
     def _add_dmrs_to_pdsch(self, pdsch: PDSCH, dmrs_positions: List[int] = None, 
@@ -294,81 +463,67 @@ class NRSignalBuilder:
         if dmrs_positions is None:
             dmrs_positions = [2, 11]
         
-        # Get the resource grid values
-        resource_grid = self.grid.values
-        
+        # Apply DMRS power offset relative to PDSCH power
+        pdsch_power_linear = 10**(pdsch.power/20) if pdsch.power != 0.0 else 1.0
+        dmrs_power_linear = pdsch_power_linear * 10**(power_offset_db/20)
+
         # Insert DMRS symbols only in slots where PDSCH exists
         # Use the PDSCH's slot pattern instead of all slots
-        pdsch_slots = pdsch.slot_pattern
-        
-        # Pre-generate all DMRS sequences for better performance
-        from .channels.dmrs import generate_gold_sequence, map_to_qpsk
-        NoDMRSRE = 3276 // 2  # Max number of DMRS REs
-        
-        # Cache for DMRS sequences
-        dmrs_cache = {}
-        
-        for slot_idx in pdsch_slots:
-            for dmrs_sym in dmrs_positions:
-                # Calculate absolute symbol index: iSmb = slot_idx * 14 + dmrs_sym
-                absolute_sym_idx = slot_idx * 14 + dmrs_sym
-                
-                if absolute_sym_idx < resource_grid.shape[1]:  # Check bounds
-                    # Calculate c_init
-                    c_init = ((2**17) * (14*slot_idx + dmrs_sym + 1) * 
-                              (2*self.cell_id + 1) + 2*self.cell_id) % (2**31)
-                    
-                    # Use cached sequence if available, otherwise generate
-                    if c_init not in dmrs_cache:
-                        c = generate_gold_sequence(c_init)
-                        dmrs_cache[c_init] = map_to_qpsk(c, NoDMRSRE)
-                    
-                    dmrs_symbols = dmrs_cache[c_init]
-                    
-                    # Apply DMRS power relative to PDSCH power
-                    # Get PDSCH power level
-                    pdsch_power_linear = 10**(pdsch.power/20) if pdsch.power != 0.0 else 1.0
-                    
-                    # Apply DMRS power offset relative to PDSCH
-                    dmrs_power_linear = pdsch_power_linear * 10**(power_offset_db/20)
-                    dmrs_symbols *= dmrs_power_linear
-                    
-                    # Handle subcarrier pattern selection
-                    if subcarrier_pattern == "even":
-                        subcarrier_indices = list(range(0, resource_grid.shape[0], 2))  # [0, 2, 4, 6, ...]
-                    elif subcarrier_pattern == "odd":
-                        subcarrier_indices = list(range(1, resource_grid.shape[0], 2))  # [1, 3, 5, 7, ...]
-                    elif subcarrier_pattern == "all":
-                        subcarrier_indices = list(range(resource_grid.shape[0]))  # [0, 1, 2, 3, ...]
-                    elif isinstance(subcarrier_pattern, list):
-                        subcarrier_indices = [i for i in subcarrier_pattern if 0 <= i < resource_grid.shape[0]]
-                    else:
-                        raise ValueError(f"Invalid subcarrier_pattern: {subcarrier_pattern}. Use 'even', 'odd', 'all', or custom list")
-                    
-                    # 1. Clear symbol if requested
-                    if clear_full_symbol:
-                        resource_grid[:, absolute_sym_idx] = 0
-                    
-                    # 2. Insert DMRS on selected subcarriers
-                    dmrs_length = min(len(dmrs_symbols), len(subcarrier_indices))
-                    for i, sc_idx in enumerate(subcarrier_indices[:dmrs_length]):
-                        resource_grid[sc_idx, absolute_sym_idx] = dmrs_symbols[i]
-                    
-                    # Update channel types and data for selected subcarriers
-                    for sc in range(resource_grid.shape[0]):
-                        if sc in subcarrier_indices[:dmrs_length]:
-                            # This subcarrier gets DMRS
-                            dmrs_idx = subcarrier_indices.index(sc)
-                            if dmrs_idx < len(dmrs_symbols):
-                                self.grid.grid[sc, absolute_sym_idx].channel_type = ChannelType.DL_DMRS
-                                self.grid.grid[sc, absolute_sym_idx].data = dmrs_symbols[dmrs_idx]
-                        elif clear_full_symbol:
-                            # This subcarrier is cleared (0)
-                            self.grid.grid[sc, absolute_sym_idx].channel_type = ChannelType.EMPTY
-                            self.grid.grid[sc, absolute_sym_idx].data = 0
-                        # If not clearing full symbol, other subcarriers keep their original data
-        
+        dmrs = DMRSInsertion(
+            slot_pattern=pdsch.slot_pattern,
+            positions=dmrs_positions,
+            cell_id=self.cell_id,
+            subcarrier_pattern=subcarrier_pattern,
+            clear_full_symbol=clear_full_symbol,
+            amplitude=dmrs_power_linear
+        )
+        self.grid.apply_overlay(dmrs)
+        self.overlays.append((len(self.channels), dmrs))
+        self._grid_versions = self.grid.slot_versions
+
         return self
+
+    def config_hash(self) -> Optional[str]:
+        """
+        Get a stable hash of everything that determines the generated waveform
+
+        Covers the carrier parameters, every added channel (type, allocation,
+        modulation, power, seed) and the DMRS insertions, in order, plus the
+        FFT backend of the waveform generator. Channels with random payloads
+        are only reproducible with a seed, so the hash is None if the builder
+        (or a channel) draws from the global np.random state or from a
+        Generator. It is also None once the grid was changed outside the add_*
+        methods (add_channel, set_element, mark_dirty on the grid itself).
+
+        The grid content is not hashed, so a warm cache hit stays cheap:
+        direct writes to grid.values are only seen through mark_dirty().
+
+        Returns:
+            Hex digest, or None if the waveform is not reproducible
+        """
+        from .. import __version__
+
+        if not self.grid:
+            raise RuntimeError("Grid not initialized. Call initialize_grid() first")
+
+        channels = []
+        for channel in self.channels:
+            description = _channel_description(channel)
+            if description is None:
+                return None
+            channels.append(description)
+
+        if not np.array_equal(self.grid.slot_versions, self._grid_versions):
+            return None
+
+        return stable_hash({
+            'version': __version__,
+            'carrier': dict(self.get_carrier_config(), cell_id=self.cell_id),
+            'channels': channels,
+            'overlays': [dict(asdict(overlay), type=type(overlay).__name__, after_channel=n_channels)
+                         for n_channels, overlay in self.overlays],
+            'fft_backend': self.waveform_generator.fft_backend.name,
+        })
     
     def generate_signal(self, sample_rate: Optional[float] = None, 
                        target_rms: Optional[float] = None) -> 'NRSignalBuilder':
@@ -388,15 +543,147 @@ class NRSignalBuilder:
         if sample_rate:
             self.carrier_config.set_sample_rate(sample_rate)
             
-        waveform_gen = WaveformGenerator()
-        iq_samples = waveform_gen.generate_frame_waveform(self.grid, self.carrier_config)
+        # A configured cache serves reproducible waveforms as a memory map
+        key = None
+        iq_samples = None
+        if self.waveform_cache is not None:
+            key = self.config_hash()
+            if key is not None:
+                iq_samples = self.waveform_cache.get(key)
+
+        if iq_samples is None:
+            # With configure_waveform(incremental=True) (opt-in), only slots
+            # changed since the last call are re-synthesized
+            iq_samples = self.waveform_generator.generate_frame_waveform(self.grid, self.carrier_config)
+            if key is not None:
+                self.waveform_cache.put(key, iq_samples)
         
         # Apply power normalization if target RMS is specified
         if target_rms is not None:
             current_rms = np.sqrt(np.mean(np.abs(iq_samples)**2))
             if current_rms > 0:
                 scale_factor = target_rms / current_rms
-                iq_samples *= scale_factor
+                if isinstance(iq_samples, np.memmap):
+                    iq_samples = iq_samples * scale_factor  # Leave the cache entry untouched
+                else:
+                    iq_samples *= scale_factor
                 print(f"Power normalized: RMS {current_rms:.2f} → {target_rms:.2f} (scale: {scale_factor:.4f})")
         
         return iq_samples
+
+    def write_signal(self,
+                     path: str,
+                     fmt: Optional[str] = None,
+                     n_frames: int = 1,
+                     backoff_db: float = DEFAULT_BACKOFF_DB,
+                     scale: Optional[float] = None,
+                     granularity: str = 'slot',
+                     grid_for_sfn: Optional[Callable[[int], Any]] = None) -> Dict[str, Any]:
+        """
+        Write IQ samples for one or more frames to a raw IQ file
+
+        The file is preallocated and filled chunk by chunk through a memory map,
+        so a multi-second waveform is written with bounded memory.
+
+        Args:
+            path: Output file
+            fmt: 'sc16', 'sc8', 'fc32' or 'cfile' (None: from the file extension)
+            n_frames: Number of 10 ms frames
+            backoff_db: Distance between the signal RMS and full scale in dB
+            scale: Fixed linear scale factor (overrides backoff_db)
+            granularity: Chunk size, one of 'symbol', 'slot', 'subframe', 'frame'
+            grid_for_sfn: Optional callable returning the ResourceGrid for a given SFN
+
+        Returns:
+            Writer statistics (samples, clipped samples, clip rate, peak/RMS dBFS)
+        """
+        if not self.grid:
+            raise RuntimeError("Grid not initialized. Call initialize_grid() first")
+
+        generator = self.waveform_generator
+        frame_length = (generator.get_symbol_offsets(generator._get_ofdm_params(self.carrier_config))[-1]
+                        * 10 * self.carrier_config.numerology.slots_per_subframe)
+        with IQWriter(path, fmt, n_samples=n_frames * frame_length,
+                      backoff_db=backoff_db, scale=scale) as writer:
+            stats = generator.write_waveform(
+                writer,
+                grid_for_sfn if grid_for_sfn is not None else self.grid,
+                self.carrier_config,
+                n_frames=n_frames,
+                granularity=granularity
+            )
+        return stats
+
+    def write_sigmf(self,
+                    path: str,
+                    fmt: str = 'fc32',
+                    n_frames: int = 1,
+                    backoff_db: float = DEFAULT_BACKOFF_DB,
+                    center_frequency: Optional[float] = None,
+                    description: str = "",
+                    annotate: bool = True) -> Dict[str, Any]:
+        """
+        Write IQ samples as a SigMF recording (.sigmf-data + .sigmf-meta)
+
+        The metadata records the carrier configuration, the OFDM parameters and
+        annotations for every slot and channel type. Use pyPhyNR.io.read_sigmf()
+        to open the recording again.
+
+        Args:
+            path: Recording base name
+            fmt: 'sc16', 'sc8' or 'fc32'
+            n_frames: Number of 10 ms frames
+            backoff_db: Distance between the signal RMS and full scale in dB
+            center_frequency: Carrier center frequency in Hz, if any
+            description: Free-text description
+            annotate: If True, add slot and channel type annotations
+
+        Returns:
+            The metadata that was written
+        """
+        if not self.grid:
+            raise RuntimeError("Grid not initialized. Call initialize_grid() first")
+
+        from ..io.sigmf import write_sigmf
+        return write_sigmf(
+            path, self.grid, self.carrier_config,
+            generator=self.waveform_generator,
+            n_frames=n_frames,
+            fmt=fmt,
+            backoff_db=backoff_db,
+            center_frequency=center_frequency,
+            description=description,
+            carrier_info=self.get_carrier_config(),
+            annotate=annotate
+        )
+
+    def stream_signal(self,
+                      n_frames: Optional[int] = None,
+                      granularity: str = 'slot',
+                      grid_for_sfn: Optional[Callable[[int], Any]] = None,
+                      reuse_buffer: bool = False) -> Iterator[np.ndarray]:
+        """
+        Generate IQ samples for many frames as a stream of chunks
+
+        Memory use stays constant regardless of the number of frames.
+
+        Args:
+            n_frames: Number of 10 ms frames (None: stream forever)
+            granularity: Chunk size, one of 'symbol', 'slot', 'subframe', 'frame'
+            grid_for_sfn: Optional callable returning the ResourceGrid for a given
+                          SFN (0-1023); by default every frame uses this builder's grid
+            reuse_buffer: If True, all chunks share one output buffer
+
+        Returns:
+            Iterator over complex IQ sample chunks
+        """
+        if not self.grid:
+            raise RuntimeError("Grid not initialized. Call initialize_grid() first")
+
+        return self.waveform_generator.stream_waveform(
+            grid_for_sfn if grid_for_sfn is not None else self.grid,
+            self.carrier_config,
+            n_frames=n_frames,
+            granularity=granularity,
+            reuse_buffer=reuse_buffer
+        )
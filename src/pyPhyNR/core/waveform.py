@@ -2,22 +2,167 @@
 Waveform generation for 5G NR
 """
 
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 import numpy as np
-from .resources import ResourceGrid
+from .resources import ResourceGrid, LazyResourceGrid
 from .definitions import N_SC_PER_RB, N_SYMBOLS_PER_SLOT
 from .carrier import CarrierConfig
-from ..waveforms.ofdm import OfdmParams, calculate_ofdm_params
+from .shared_arrays import shared_block, shared_empty
+from ..waveforms.ofdm import OfdmParams, calculate_ofdm_params, get_subcarrier_bins, get_symbol_offsets
+from ..waveforms.fft import FFTBackend, get_fft_backend
+
+# Number of frames after which the SFN wraps around
+SFN_PERIOD = 1024
+
+# Chunk sizes supported by WaveformGenerator.stream_waveform
+STREAM_GRANULARITIES = ('symbol', 'slot', 'subframe', 'frame')
+
+# Default memory bound of the per-generator symbol cache
+DEFAULT_SYMBOL_CACHE_BYTES = 64 * 2**20
+
+# Pool types supported for parallel slot synthesis
+PARALLEL_EXECUTORS = ('thread', 'process')
+
+class SymbolCache:
+    """
+    LRU cache of time-domain OFDM symbols keyed by a hash of their content
+
+    Keys combine the FFT size, the number of grid subcarriers and a SHA-1
+    digest of the symbol's frequency-domain data, so identical symbols
+    (empty slots, deterministic PDSCH, repeated CORESETs) are transformed once.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SYMBOL_CACHE_BYTES):
+        """
+        Initialize symbol cache
+
+        Args:
+            max_bytes: Memory bound for cached symbols (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.zero_hits = 0
+
+    @staticmethod
+    def key(symbol_data: np.ndarray, n_fft: int, backend: str = 'numpy') -> tuple:
+        """Get the cache key of one (contiguous) frequency-domain symbol"""
+        digest = hashlib.sha1(symbol_data).digest()
+        return (n_fft, symbol_data.size, symbol_data.dtype.str, backend, digest)
+
+    def get(self, key) -> Optional[np.ndarray]:
+        """Get a cached time-domain symbol, or None"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, symbol: np.ndarray):
+        """Insert a time-domain symbol and evict least recently used ones"""
+        if symbol.nbytes > self.max_bytes or key in self._entries:
+            return
+        symbol = symbol.copy()
+        symbol.flags.writeable = False
+        self._entries[key] = symbol
+        self._nbytes += symbol.nbytes
+        while self._nbytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def clear(self):
+        """Drop all cached symbols and reset counters"""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = self.misses = self.zero_hits = 0
+
+    def stats(self) -> dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses + self.zero_hits
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'zero_hits': self.zero_hits,
+            'hit_rate': (self.hits + self.zero_hits) / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'nbytes': self._nbytes,
+            'max_bytes': self.max_bytes,
+        }
 
 class WaveformGenerator:
     """
     Waveform generator for 5G NR signals using 3GPP-compliant parameters
     """
 
-    def __init__(self):
+    def __init__(self, incremental: bool = False,
+                 symbol_cache_bytes: int = DEFAULT_SYMBOL_CACHE_BYTES,
+                 workers: int = 1,
+                 executor: str = 'process',
+                 fft_backend: Union[str, FFTBackend, None] = None):
         """
         Initialize waveform generator
+
+        Args:
+            incremental: If True, keep the last generated frame and only
+                         re-synthesize the slots whose content changed since
+            symbol_cache_bytes: Memory bound of the content-hash symbol cache
+                                (0 disables it; all-zero symbols are always skipped)
+            workers: Number of workers slots of a frame are split across (1: serial)
+            executor: Worker pool type, 'process' (shared memory) or 'thread'
+            fft_backend: FFT backend name ('numpy', 'scipy', 'pyfftw') or instance
+                         (None: the process-wide default at the time of each call)
         """
-        pass
+        if workers < 1:
+            raise ValueError(f"Number of workers must be >= 1, got {workers}")
+        if executor not in PARALLEL_EXECUTORS:
+            raise ValueError(f"Invalid executor: {executor}. Use one of {PARALLEL_EXECUTORS}")
+
+        self.incremental = incremental
+        self.symbol_cache = SymbolCache(symbol_cache_bytes)
+        self.workers = workers
+        self.executor = executor
+        self._fft_backend = None if fft_backend is None else get_fft_backend(fft_backend)
+        self._pool = None  # Created on first parallel use
+        self._thread_state = threading.local()  # Per-thread generators for the thread pool
+        self._frame_cache = None  # (grid, key, slot versions, waveform) of the last frame
+        self.stats = {'slots_reused': 0, 'slots_regenerated': 0}
+
+    @property
+    def fft_backend(self) -> FFTBackend:
+        """FFT backend used for the IFFTs"""
+        return get_fft_backend(self._fft_backend)
+
+    def close(self):
+        """Shut down the worker pool, if any"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> 'WaveformGenerator':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def reset_stats(self):
+        """Reset the slot reuse counters and the symbol cache counters"""
+        self.stats = {'slots_reused': 0, 'slots_regenerated': 0}
+        self.symbol_cache.hits = self.symbol_cache.misses = self.symbol_cache.zero_hits = 0
+
+    def cache_stats(self) -> dict:
+        """Get slot reuse counters and symbol cache statistics"""
+        return {**self.stats, **{f'symbol_{k}': v for k, v in self.symbol_cache.stats().items()}}
+
+    def invalidate(self):
+        """Drop the cached frame so the next call regenerates every slot"""
+        self._frame_cache = None
 
     def _get_ofdm_params(self, carrier_config: CarrierConfig) -> OfdmParams:
         """Calculate 3GPP OFDM parameters for this carrier.
@@ -66,7 +211,7 @@ class WaveformGenerator:
         # IFFT with ifftshift
         ifft_input = np.fft.ifftshift(FD_symb)
         
-        TD_symb = np.fft.ifft(ifft_input)
+        TD_symb = self.fft_backend.ifft(ifft_input)
         
         
         # Add cyclic prefix: [TD_symb[-cp_length:] TD_symb]
@@ -75,6 +220,132 @@ class WaveformGenerator:
         
         return TD_symb_cpincl
 
+    def get_subcarrier_bins(self, n_subcarriers: int, ofdm_params: OfdmParams) -> np.ndarray:
+        """
+        Get the IFFT bin of each grid subcarrier
+
+        Equivalent to the zero-padding, centering circshift and ifftshift
+        done in generate_ofdm_symbol.
+
+        Args:
+            n_subcarriers: Number of subcarriers in the grid
+            ofdm_params: OFDM parameters
+
+        Returns:
+            Array of IFFT bin indices, one per subcarrier
+        """
+        return get_subcarrier_bins(n_subcarriers, ofdm_params)
+
+    def get_symbol_offsets(self, ofdm_params: OfdmParams) -> np.ndarray:
+        """
+        Get the sample offset of each symbol (start of its CP) within a slot
+
+        Args:
+            ofdm_params: OFDM parameters
+
+        Returns:
+            Array of N_SYMBOLS_PER_SLOT + 1 offsets; the last one is the slot length
+        """
+        return get_symbol_offsets(ofdm_params)
+
+    def modulate_slots(self, slot_data: np.ndarray, ofdm_params: OfdmParams,
+                       out: np.ndarray = None) -> np.ndarray:
+        """
+        OFDM-modulate whole slots of frequency domain data at once
+
+        All symbols are placed into one (n_symbols x N_fft) buffer, transformed
+        with a single batched IFFT and written CP-prefixed into the output.
+        The transform runs in the precision of slot_data (complex64 or complex128).
+
+        Args:
+            slot_data: Frequency domain data (subcarriers x symbols), whole slots
+            ofdm_params: OFDM parameters
+            out: Optional preallocated output for the IQ samples
+
+        Returns:
+            IQ samples for the slots
+        """
+        n_subcarriers, n_symbols = slot_data.shape
+        if n_symbols % N_SYMBOLS_PER_SLOT:
+            raise ValueError(f"Number of symbols ({n_symbols}) must be a multiple of {N_SYMBOLS_PER_SLOT}")
+        n_slots = n_symbols // N_SYMBOLS_PER_SLOT
+        N_fft = ofdm_params.N_fft
+
+        time_domain = self._symbols_to_time_domain(slot_data, ofdm_params)
+
+        # Write CP + symbol for each symbol position of all slots
+        offsets = self.get_symbol_offsets(ofdm_params)
+        slot_length = offsets[-1]
+        if out is None:
+            out = np.empty(n_slots * slot_length, dtype=slot_data.dtype)
+        slots = out.reshape(n_slots, slot_length)
+
+        for sym_idx in range(N_SYMBOLS_PER_SLOT):
+            cp_length = ofdm_params.cp_per_symbol[sym_idx]
+            start = offsets[sym_idx]
+            symbols = time_domain[sym_idx::N_SYMBOLS_PER_SLOT]  # (n_slots, N_fft)
+            slots[:, start:start + cp_length] = symbols[:, N_fft - cp_length:]
+            slots[:, start + cp_length:offsets[sym_idx + 1]] = symbols
+
+        return out
+
+    def _symbols_to_time_domain(self, slot_data: np.ndarray, ofdm_params: OfdmParams) -> np.ndarray:
+        """
+        Transform every symbol (column) of slot_data to time domain
+
+        All-zero symbols are left at zero without an IFFT. Other symbols are
+        looked up in the symbol cache by content; only unseen symbols are
+        transformed, in one batched IFFT.
+
+        Returns:
+            Time domain symbols without CP, shape (n_symbols, N_fft)
+        """
+        n_subcarriers, n_symbols = slot_data.shape
+        N_fft = ofdm_params.N_fft
+        bins = self.get_subcarrier_bins(n_subcarriers, ofdm_params)
+        cache = self.symbol_cache
+        fft_backend = self.fft_backend
+
+        # One contiguous row per symbol, so every transform (and hash) is contiguous
+        symbols = np.ascontiguousarray(slot_data.T)
+        active = np.flatnonzero(symbols.any(axis=1))
+        cache.zero_hits += n_symbols - active.size
+
+        if not cache.max_bytes:
+            time_domain = np.zeros((n_symbols, N_fft), dtype=symbols.dtype)
+            freq_domain = np.zeros((active.size, N_fft), dtype=symbols.dtype)
+            freq_domain[:, bins] = symbols[active]
+            time_domain[active] = fft_backend.ifft(freq_domain, axis=1)
+            cache.misses += active.size
+            return time_domain
+
+        # Resolve symbols from the cache; identical misses are transformed once
+        time_domain = np.zeros((n_symbols, N_fft), dtype=symbols.dtype)
+        pending = {}  # key -> rows with that content
+        for row in active.tolist():
+            key = cache.key(symbols[row], N_fft, fft_backend.name)
+            cached = cache.get(key)
+            if cached is not None:
+                time_domain[row] = cached
+                cache.hits += 1
+            elif key in pending:
+                pending[key].append(row)
+                cache.hits += 1
+            else:
+                pending[key] = [row]
+                cache.misses += 1
+
+        if pending:
+            first_rows = [rows[0] for rows in pending.values()]
+            freq_domain = np.zeros((len(first_rows), N_fft), dtype=symbols.dtype)
+            freq_domain[:, bins] = symbols[first_rows]
+            transformed = fft_backend.ifft(freq_domain, axis=1)
+            for (key, rows), symbol in zip(pending.items(), transformed):
+                time_domain[rows] = symbol
+                cache.put(key, symbol)
+
+        return time_domain
+
     def generate_slot_waveform(self, grid: ResourceGrid, slot_idx: int, ofdm_params: OfdmParams) -> np.ndarray:
         """
         Generate waveform for a single slot
@@ -88,20 +359,9 @@ class WaveformGenerator:
             IQ samples for the slot
         """
         # Get slot data from grid
-        slot_start = slot_idx * N_SYMBOLS_PER_SLOT
-        slot_end = slot_start + N_SYMBOLS_PER_SLOT
-
-        slot_data = grid.values[:, slot_start:slot_end]
-        
-
-        # Generate OFDM symbols for the slot
-        slot_waveform = []
-        for sym_idx in range(N_SYMBOLS_PER_SLOT):
-            symbol_data = slot_data[:, sym_idx]
-            ofdm_symbol = self.generate_ofdm_symbol(symbol_data, ofdm_params, sym_idx)
-            slot_waveform.append(ofdm_symbol)
+        slot_data, _ = grid.render_slots(slot_idx)
 
-        return np.concatenate(slot_waveform)
+        return self.modulate_slots(slot_data, ofdm_params)
 
     def generate_frame_waveform(self, grid: ResourceGrid, carrier_config: CarrierConfig) -> np.ndarray:
         """
@@ -121,18 +381,300 @@ class WaveformGenerator:
         slots_per_subframe = carrier_config.numerology.slots_per_subframe
         total_slots = 10 * slots_per_subframe  # 10 subframes
 
-        frame_waveform = []
+        if self.incremental:
+            return self._generate_frame_incremental(grid, ofdm_params, total_slots)
 
-        # Generate waveform for each slot
-        for slot_idx in range(total_slots):
-            slot_waveform = self.generate_slot_waveform(grid, slot_idx, ofdm_params)
-            frame_waveform.append(slot_waveform)
-        
-        waveform = np.concatenate(frame_waveform)
-        
+        slot_length = self.get_symbol_offsets(ofdm_params)[-1]
+        waveform = self._empty_frame(total_slots * slot_length, grid.dtype)
+        self._modulate_slot_range(grid, ofdm_params, 0, total_slots, waveform)
 
         return waveform
 
+    @property
+    def uses_processes(self) -> bool:
+        """True if slots are synthesized on a process pool"""
+        return self.workers > 1 and self.executor == 'process'
+
+    def _empty_frame(self, n_samples: int, dtype) -> np.ndarray:
+        """
+        Allocate a frame waveform
+
+        With a process pool the frame lives in shared memory, so workers
+        write the final samples in place.
+        """
+        if self.uses_processes:
+            return shared_empty(n_samples, dtype)
+        return np.empty(n_samples, dtype=dtype)
+
+    def _modulate_slot_range(self, grid: ResourceGrid, ofdm_params: OfdmParams,
+                             first_slot: int, stop_slot: int, waveform: np.ndarray):
+        """
+        Re-synthesize slots [first_slot, stop_slot) into a frame waveform
+
+        Eager grids are modulated in one batch, lazy grids slot by slot.
+        With more than one worker the slots are split across the worker pool.
+        """
+        n_slots = stop_slot - first_slot
+        self.stats['slots_regenerated'] += n_slots
+        if self.workers > 1 and n_slots > 1:
+            if self.executor == 'thread':
+                self._modulate_threaded(grid, ofdm_params, first_slot, stop_slot, waveform)
+            else:
+                self._modulate_multiprocess(grid, ofdm_params, first_slot, stop_slot, waveform)
+            return
+
+        slot_length = self.get_symbol_offsets(ofdm_params)[-1]
+        step = 1 if isinstance(grid, LazyResourceGrid) else n_slots
+        for start in range(first_slot, stop_slot, step):
+            slot_data, _ = grid.render_slots(start, step)
+            self.modulate_slots(slot_data, ofdm_params,
+                                out=waveform[start * slot_length:(start + step) * slot_length])
+
+    def _split_slots(self, first_slot: int, stop_slot: int) -> List[Tuple[int, int]]:
+        """Split a slot range into one contiguous [start, stop) chunk per worker"""
+        bounds = np.linspace(first_slot, stop_slot, min(self.workers, stop_slot - first_slot) + 1)
+        bounds = np.round(bounds).astype(int)
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def _get_pool(self):
+        """Get (creating on first use) the worker pool"""
+        if self._pool is None:
+            pool_class = ThreadPoolExecutor if self.executor == 'thread' else ProcessPoolExecutor
+            self._pool = pool_class(max_workers=self.workers)
+        return self._pool
+
+    def _modulate_threaded(self, grid: ResourceGrid, ofdm_params: OfdmParams,
+                           first_slot: int, stop_slot: int, waveform: np.ndarray):
+        """
+        Modulate slot chunks on the thread pool
+
+        Each thread renders its own chunk and writes straight into the frame.
+        Threads use their own generator (and symbol cache), since SymbolCache
+        is not thread-safe.
+        """
+        symbol_cache_bytes = self.symbol_cache.max_bytes
+        fft_backend = self.fft_backend
+
+        def modulate_chunk(start: int, stop: int):
+            generator = getattr(self._thread_state, 'generator', None)
+            if generator is None:
+                generator = WaveformGenerator(symbol_cache_bytes=symbol_cache_bytes,
+                                              fft_backend=fft_backend.clone())
+                self._thread_state.generator = generator
+            generator._modulate_slot_range(grid, ofdm_params, start, stop, waveform)
+
+        futures = [self._get_pool().submit(modulate_chunk, start, stop)
+                   for start, stop in self._split_slots(first_slot, stop_slot)]
+        for future in futures:
+            future.result()
+
+    def _modulate_multiprocess(self, grid: ResourceGrid, ofdm_params: OfdmParams,
+                               first_slot: int, stop_slot: int, waveform: np.ndarray):
+        """
+        Modulate slot chunks on the process pool
+
+        Workers attach to shared memory blocks by name and write their samples
+        at precomputed offsets, so neither the grid nor the result is pickled.
+        Frames from _empty_frame() and shared grids (ResourceGrid(shared=True))
+        are used in place; anything else is staged through a temporary block.
+        """
+        slot_length = self.get_symbol_offsets(ofdm_params)[-1]
+        n_slots = stop_slot - first_slot
+        dtype = np.dtype(grid.dtype)
+
+        # Input: the grid's own value plane if it is shared, else render the slots
+        source = None
+        if isinstance(grid, ResourceGrid) and grid.values.dtype == dtype:
+            source = shared_block(grid.values)
+        if source is not None:
+            in_name, _, _ = source
+            in_shape, in_first_column = grid.values.shape, 0
+            staged_input = None
+        else:
+            in_shape = (grid.n_subcarriers, n_slots * N_SYMBOLS_PER_SLOT)
+            staged_input = shared_empty(in_shape, dtype)
+            step = 1 if isinstance(grid, LazyResourceGrid) else n_slots
+            for start in range(first_slot, stop_slot, step):
+                columns = slice((start - first_slot) * N_SYMBOLS_PER_SLOT,
+                                (start - first_slot + step) * N_SYMBOLS_PER_SLOT)
+                staged_input[:, columns], _ = grid.render_slots(start, step)
+            in_name, _, _ = shared_block(staged_input)
+            in_first_column = -first_slot * N_SYMBOLS_PER_SLOT
+
+        # Output: the frame itself if it is shared, else a temporary block
+        target = shared_block(waveform) if waveform.dtype == dtype else None
+        staged_output = None
+        if target is None:
+            staged_output = shared_empty(n_slots * slot_length, dtype)
+            out_name, _, out_size = shared_block(staged_output)
+            out_first_sample = -first_slot * slot_length
+        else:
+            out_name, out_first_sample, out_size = target
+
+        futures = [
+            self._get_pool().submit(
+                _modulate_shared_slots, in_name, in_shape, in_first_column,
+                out_name, out_size, out_first_sample, dtype.str,
+                start, stop, ofdm_params, self.symbol_cache.max_bytes, self.fft_backend
+            )
+            for start, stop in self._split_slots(first_slot, stop_slot)
+        ]
+        for future in futures:
+            future.result()
+
+        if staged_output is not None:
+            waveform[first_slot * slot_length:stop_slot * slot_length] = staged_output
+        del staged_input, staged_output  # Unlinks the temporary blocks
+
+    def _generate_frame_incremental(self, grid: ResourceGrid, ofdm_params: OfdmParams,
+                                    total_slots: int) -> np.ndarray:
+        """
+        Generate a frame, reusing the cached frame for slots that did not change
+
+        A slot is dirty if its version counter on the grid differs from the one
+        recorded when the cached frame was generated. Contiguous runs of dirty
+        slots are modulated together and spliced into the cached frame.
+
+        Returns:
+            Copy of the cached frame (callers may scale it in place)
+        """
+        key = (grid.n_subcarriers, total_slots, ofdm_params.N_fft, tuple(ofdm_params.cp_per_symbol),
+               repr(self.fft_backend))
+        versions = grid.slot_versions[:total_slots]
+
+        cache = self._frame_cache
+        if cache is None or cache[0] is not grid or cache[1] != key:
+            slot_length = self.get_symbol_offsets(ofdm_params)[-1]
+            waveform = self._empty_frame(total_slots * slot_length, grid.dtype)
+            dirty = np.ones(total_slots, dtype=bool)
+        else:
+            waveform = cache[3]
+            dirty = versions != cache[2]
+
+        # Regenerate each run of consecutive dirty slots
+        edges = np.flatnonzero(np.diff(np.concatenate([[False], dirty, [False]]).astype(np.int8)))
+        for first_slot, stop_slot in zip(edges[::2], edges[1::2]):
+            self._modulate_slot_range(grid, ofdm_params, int(first_slot), int(stop_slot), waveform)
+        self.stats['slots_reused'] += total_slots - int(dirty.sum())
+
+        self._frame_cache = (grid, key, versions, waveform)
+        return waveform.copy()
+
+    def stream_waveform(self,
+                        grid: Union[ResourceGrid, Callable[[int], ResourceGrid]],
+                        carrier_config: CarrierConfig,
+                        n_frames: Optional[int] = None,
+                        granularity: str = 'slot',
+                        reuse_buffer: bool = False) -> Iterator[np.ndarray]:
+        """
+        Generate a multi-frame waveform chunk by chunk
+
+        Only one chunk is held in memory at a time. Chunks are contiguous
+        complex arrays, so they can be passed straight to file.write() or
+        socket.sendall().
+
+        Args:
+            grid: Resource grid (or lazy grid) used for every frame, or a callable returning
+                  the grid for a given SFN (0-1023) for SFN-dependent content
+            carrier_config: Carrier configuration
+            n_frames: Number of frames to generate (None: generate forever)
+            granularity: Chunk size, one of 'symbol', 'slot', 'subframe', 'frame'
+            reuse_buffer: If True, every chunk is written into the same buffer
+                          (consume it before requesting the next chunk)
+
+        Yields:
+            IQ samples of one chunk
+        """
+        if granularity not in STREAM_GRANULARITIES:
+            raise ValueError(f"Invalid granularity: {granularity}. Use one of {STREAM_GRANULARITIES}")
+
+        ofdm_params = self._get_ofdm_params(carrier_config)
+        slots_per_subframe = carrier_config.numerology.slots_per_subframe
+        total_slots = 10 * slots_per_subframe
+        slots_per_chunk = {
+            'symbol': 1,
+            'slot': 1,
+            'subframe': slots_per_subframe,
+            'frame': total_slots,
+        }[granularity]
+
+        offsets = self.get_symbol_offsets(ofdm_params)
+        buffer = np.empty(slots_per_chunk * offsets[-1], dtype=carrier_config.dtype) if reuse_buffer else None
+
+        frames = itertools.count() if n_frames is None else range(n_frames)
+        for frame_idx in frames:
+            frame_grid = grid(frame_idx % SFN_PERIOD) if callable(grid) else grid
+            for first_slot in range(0, total_slots, slots_per_chunk):
+                chunk_data, _ = frame_grid.render_slots(first_slot, slots_per_chunk)
+                chunk = self.modulate_slots(chunk_data, ofdm_params, out=buffer)
+
+                if granularity == 'symbol':
+                    for sym_idx in range(N_SYMBOLS_PER_SLOT):
+                        yield chunk[offsets[sym_idx]:offsets[sym_idx + 1]]
+                else:
+                    yield chunk
+
+    def estimate_rms(self, grid: ResourceGrid, carrier_config: CarrierConfig) -> float:
+        """
+        Get the RMS of the frame waveform from the grid, without any IFFT
+
+        By Parseval, the body of a symbol carries sum(|X|^2) / N_fft of energy;
+        its CP adds the same average power for cp samples.
+
+        Args:
+            grid: Resource grid (or lazy grid)
+            carrier_config: Carrier configuration
+
+        Returns:
+            RMS of the IQ samples of one frame
+        """
+        ofdm_params = self._get_ofdm_params(carrier_config)
+        N_fft = ofdm_params.N_fft
+        total_slots = 10 * carrier_config.numerology.slots_per_subframe
+
+        slot_length = self.get_symbol_offsets(ofdm_params)[-1]
+        symbol_lengths = np.asarray(ofdm_params.cp_per_symbol[:N_SYMBOLS_PER_SLOT]) + N_fft
+        step = 1 if isinstance(grid, LazyResourceGrid) else total_slots
+
+        energy = 0.0
+        for first_slot in range(0, total_slots, step):
+            slot_data, _ = grid.render_slots(first_slot, step)
+            symbol_energy = np.sum(np.abs(slot_data)**2, axis=0).reshape(-1, N_SYMBOLS_PER_SLOT)
+            energy += float(np.sum(symbol_energy * symbol_lengths)) / N_fft**2
+
+        return np.sqrt(energy / (total_slots * slot_length))
+
+    def write_waveform(self, writer,
+                       grid: Union[ResourceGrid, Callable[[int], ResourceGrid]],
+                       carrier_config: CarrierConfig,
+                       n_frames: int = 1,
+                       granularity: str = 'slot') -> dict:
+        """
+        Stream a multi-frame waveform into an IQ writer
+
+        Chunks are generated into a reused buffer and quantized straight into
+        the file, so memory stays bounded by one chunk. Unless the writer
+        already has a scale, it is derived from the RMS of the (first) frame.
+
+        Args:
+            writer: IQWriter (or any object with write() and stats())
+            grid: Resource grid, or a callable returning the grid for a given SFN
+            carrier_config: Carrier configuration
+            n_frames: Number of frames to write
+            granularity: Chunk size, one of 'symbol', 'slot', 'subframe', 'frame'
+
+        Returns:
+            Writer statistics
+        """
+        if getattr(writer, 'scale', 0) is None:
+            writer.set_rms(self.estimate_rms(grid(0) if callable(grid) else grid, carrier_config))
+
+        for chunk in self.stream_waveform(grid, carrier_config, n_frames=n_frames,
+                                          granularity=granularity, reuse_buffer=True):
+            writer.write(chunk)
+
+        return writer.stats()
+
     def get_waveform_parameters(self, carrier_config: CarrierConfig) -> dict:
         """
         Get waveform parameters for the carrier configuration
@@ -170,3 +712,65 @@ class WaveformGenerator:
             'num_rb': carrier_config.n_resource_blocks,
             'numerology': ofdm_params.mu
         }
+
+# Generator of a pool worker process, kept so its symbol cache persists across tasks
+_worker_generator = None
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a shared memory block owned (and unlinked) by the parent process"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        # Pool workers share the parent's resource tracker, which already
+        # holds the block, so registering it again is harmless
+        return shared_memory.SharedMemory(name=name)
+
+def _modulate_shared_slots(in_name: str, in_shape: Tuple[int, int], in_first_column: int,
+                           out_name: str, out_size: int, out_first_sample: int, dtype: str,
+                           first_slot: int, stop_slot: int, ofdm_params: OfdmParams,
+                           symbol_cache_bytes: int, fft_backend: FFTBackend):
+    """
+    Process pool task: modulate slots [first_slot, stop_slot) between shared blocks
+
+    Slot s is read from columns in_first_column + 14 * s of the input block
+    and written from sample out_first_sample + s * slot_length of the output block.
+
+    Args:
+        in_name: Shared memory block with the frequency-domain slots
+        in_shape: Shape (subcarriers x symbols) of the input block
+        in_first_column: Column of slot 0 in the input block
+        out_name: Shared memory block receiving the IQ samples
+        out_size: Number of samples in the output block
+        out_first_sample: Sample index of slot 0 in the output block
+        dtype: Sample dtype of both blocks
+        first_slot: First slot of the chunk
+        stop_slot: End of the chunk (exclusive)
+        ofdm_params: OFDM parameters
+        symbol_cache_bytes: Memory bound of the worker's symbol cache
+        fft_backend: FFT backend
+    """
+    global _worker_generator
+    if (_worker_generator is None
+            or _worker_generator.symbol_cache.max_bytes != symbol_cache_bytes
+            or repr(_worker_generator.fft_backend) != repr(fft_backend)):
+        _worker_generator = WaveformGenerator(symbol_cache_bytes=symbol_cache_bytes,
+                                              fft_backend=fft_backend)
+
+    shm_in = _attach_shared_memory(in_name)
+    shm_out = _attach_shared_memory(out_name)
+    try:
+        slot_data = np.ndarray(in_shape, dtype=dtype, buffer=shm_in.buf)
+        samples = np.ndarray(out_size, dtype=dtype, buffer=shm_out.buf)
+        slot_length = _worker_generator.get_symbol_offsets(ofdm_params)[-1]
+        columns = slice(in_first_column + first_slot * N_SYMBOLS_PER_SLOT,
+                        in_first_column + stop_slot * N_SYMBOLS_PER_SLOT)
+
+        _worker_generator.modulate_slots(
+            slot_data[:, columns],
+            ofdm_params,
+            out=samples[out_first_sample + first_slot * slot_length:out_first_sample + stop_slot * slot_length]
+        )
+        del slot_data, samples  # Release the buffer exports before closing
+    finally:
+        shm_in.close()
+        shm_out.close()
@@ -0,0 +1,41 @@
+"""
+File I/O for generated waveforms
+"""
+
+from .iq_writer import (
+    IQ_FORMATS,
+    DEFAULT_BACKOFF_DB,
+    IQWriter,
+    write_iq,
+    iq_format_from_path,
+)
+from .sigmf import (
+    SIGMF_DATATYPES,
+    SigMFRecording,
+    write_sigmf,
+    read_sigmf,
+    carrier_config_to_dict,
+    carrier_config_from_dict,
+)
+from .waveform_cache import (
+    DEFAULT_CACHE_BYTES,
+    WaveformCache,
+    stable_hash,
+)
+
+__all__ = [
+    'IQ_FORMATS',
+    'DEFAULT_BACKOFF_DB',
+    'IQWriter',
+    'write_iq',
+    'iq_format_from_path',
+    'SIGMF_DATATYPES',
+    'SigMFRecording',
+    'write_sigmf',
+    'read_sigmf',
+    'carrier_config_to_dict',
+    'carrier_config_from_dict',
+    'DEFAULT_CACHE_BYTES',
+    'WaveformCache',
+    'stable_hash',
+]
@@ -0,0 +1,207 @@
+"""
+Streaming IQ file writers
+"""
+
+import os
+from typing import Optional
+import numpy as np
+
+# File formats: component dtype and full-scale value
+IQ_FORMATS = {
+    'sc16': (np.int16, 32767),      # Interleaved int16 I/Q
+    'sc8': (np.int8, 127),          # Interleaved int8 I/Q
+    'fc32': (np.float32, 1.0),      # Interleaved float32 I/Q
+    'cfile': (np.float32, 1.0),     # GNU Radio complex float (same layout as fc32)
+}
+
+# Default distance between the signal RMS and full scale (OFDM PAPR headroom)
+DEFAULT_BACKOFF_DB = 12.0
+
+def iq_format_from_path(path: str) -> str:
+    """Guess the IQ format from a file extension (.sc16, .sc8, .fc32, .cfile)"""
+    fmt = os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in IQ_FORMATS:
+        raise ValueError(f"Cannot infer IQ format from '{path}'. Use one of {tuple(IQ_FORMATS)}")
+    return fmt
+
+class IQWriter:
+    """
+    Write complex samples chunk by chunk as interleaved I/Q
+
+    Samples are scaled so their RMS sits backoff_db below full scale,
+    rounded and saturated for the integer formats. If the total number of
+    samples is known, the file is preallocated and written through a
+    memory map; otherwise chunks are appended. Either way only the current
+    chunk is held in memory.
+
+    The RMS used for scaling is, in order of preference: the rms argument,
+    or the RMS of the first chunk that is not all zeros. Pass scale to use
+    a fixed linear factor instead.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None,
+                 n_samples: Optional[int] = None,
+                 backoff_db: float = DEFAULT_BACKOFF_DB,
+                 rms: Optional[float] = None,
+                 scale: Optional[float] = None):
+        """
+        Initialize writer
+
+        Args:
+            path: Output file
+            fmt: 'sc16', 'sc8', 'fc32' or 'cfile' (None: from the file extension)
+            n_samples: Total number of complex samples, if known (enables memory mapping)
+            backoff_db: Distance between the signal RMS and full scale in dB
+            rms: RMS of the complete signal, if known in advance
+            scale: Fixed linear scale factor (overrides backoff_db and rms)
+        """
+        fmt = iq_format_from_path(path) if fmt is None else fmt
+        if fmt not in IQ_FORMATS:
+            raise ValueError(f"Invalid IQ format: {fmt}. Use one of {tuple(IQ_FORMATS)}")
+
+        self.path = path
+        self.fmt = fmt
+        self.component_dtype, self.full_scale = IQ_FORMATS[fmt]
+        self.n_samples = n_samples
+        self.backoff_db = backoff_db
+        self.scale = scale
+        if scale is None and rms is not None and rms > 0:
+            self.scale = self._scale_for_rms(rms)
+
+        self.samples_written = 0
+        self.clipped_samples = 0  # Samples with I or Q beyond full scale
+        self.peak = 0.0           # Largest |I| or |Q| before saturation (full scale = 1)
+        self._energy = 0.0        # Sum of |x|^2 after scaling (full scale = 1)
+
+        if n_samples:
+            self._file = None
+            self._mmap = np.memmap(path, dtype=self.component_dtype, mode='w+', shape=(2 * n_samples,))
+        else:
+            self._file = open(path, 'wb')
+            self._mmap = None
+
+    def _scale_for_rms(self, rms: float) -> float:
+        """Linear scale placing the given RMS backoff_db below full scale"""
+        return self.full_scale * 10**(-self.backoff_db / 20) / rms
+
+    def set_rms(self, rms: float):
+        """Set the RMS of the complete signal (before the first chunk is written)"""
+        if self.samples_written and self.scale is not None:
+            raise RuntimeError("Scale is already fixed by the samples written")
+        if rms > 0:
+            self.scale = self._scale_for_rms(rms)
+
+    def write(self, samples: np.ndarray):
+        """
+        Quantize and write a chunk of complex samples
+
+        Args:
+            samples: Complex samples (complex64 or complex128)
+        """
+        samples = np.ascontiguousarray(samples)
+        if self._mmap is None and self._file is None:
+            raise RuntimeError("Writer is closed")
+        n = samples.size
+        if self.n_samples is not None and self.samples_written + n > self.n_samples:
+            raise ValueError(f"Writing {n} samples exceeds the declared n_samples={self.n_samples}")
+
+        if self.scale is None:
+            rms = np.sqrt(np.mean(np.abs(samples)**2)) if n else 0.0
+            if rms > 0:
+                self.scale = self._scale_for_rms(rms)
+        scale = self.scale if self.scale is not None else 1.0
+
+        # Interleaved I/Q view of the chunk, scaled to file units
+        components = samples.view(samples.real.dtype) * scale
+        magnitude = np.abs(components)
+        if components.size:
+            self.peak = max(self.peak, float(magnitude.max()) / self.full_scale)
+        over = (magnitude > self.full_scale).reshape(-1, 2).any(axis=1)
+        self.clipped_samples += int(over.sum())
+        self._energy += float(np.dot(components, components)) / self.full_scale**2
+
+        if np.issubdtype(self.component_dtype, np.integer):
+            np.rint(components, out=components)
+            np.clip(components, -self.full_scale, self.full_scale, out=components)
+        quantized = components.astype(self.component_dtype)
+
+        if self._mmap is not None:
+            start = 2 * self.samples_written
+            self._mmap[start:start + quantized.size] = quantized
+        else:
+            self._file.write(quantized.tobytes())
+        self.samples_written += n
+
+    def stats(self) -> dict:
+        """
+        Get quantization and clipping statistics
+
+        Returns:
+            Dictionary with sample count, scale, clipped samples, clip rate,
+            peak and RMS level relative to full scale (dBFS)
+        """
+        n = self.samples_written
+        mean_power = self._energy / n if n else 0.0
+        return {
+            'format': self.fmt,
+            'samples': n,
+            'scale': float(self.scale) if self.scale is not None else None,
+            'clipped_samples': self.clipped_samples,
+            'clip_rate': self.clipped_samples / n if n else 0.0,
+            'peak_dbfs': float(20 * np.log10(self.peak)) if self.peak > 0 else -np.inf,
+            'rms_dbfs': float(10 * np.log10(mean_power)) if mean_power > 0 else -np.inf,
+        }
+
+    def close(self) -> dict:
+        """
+        Flush and close the file
+
+        A preallocated file is truncated to the samples actually written.
+
+        Returns:
+            Statistics, see stats()
+        """
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap = None
+            if self.samples_written < self.n_samples:
+                itemsize = np.dtype(self.component_dtype).itemsize
+                os.truncate(self.path, 2 * self.samples_written * itemsize)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return self.stats()
+
+    def __enter__(self) -> 'IQWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def write_iq(path: str, samples: np.ndarray, fmt: Optional[str] = None,
+             backoff_db: float = DEFAULT_BACKOFF_DB,
+             scale: Optional[float] = None,
+             chunk_size: int = 2**20) -> dict:
+    """
+    Write an in-memory waveform to an IQ file
+
+    The RMS of the whole waveform is used for scaling, and conversion is
+    done chunk_size samples at a time to bound the temporary memory.
+
+    Args:
+        path: Output file
+        samples: Complex samples
+        fmt: 'sc16', 'sc8', 'fc32' or 'cfile' (None: from the file extension)
+        backoff_db: Distance between the signal RMS and full scale in dB
+        scale: Fixed linear scale factor (overrides backoff_db)
+        chunk_size: Number of samples converted at a time
+
+    Returns:
+        Writer statistics
+    """
+    rms = np.sqrt(np.mean(np.abs(samples)**2)) if samples.size else None
+    with IQWriter(path, fmt, n_samples=samples.size, backoff_db=backoff_db,
+                  rms=rms, scale=scale) as writer:
+        for start in range(0, samples.size, chunk_size):
+            writer.write(samples[start:start + chunk_size])
+    return writer.stats()
@@ -0,0 +1,336 @@
+"""
+SigMF recordings of generated waveforms
+
+A recording is a pair of files: <base>.sigmf-data with the raw interleaved
+samples and <base>.sigmf-meta with JSON metadata. Besides the SigMF core
+fields, the metadata carries the carrier configuration, the OFDM parameters
+and annotations for the sample ranges of every slot and channel type under
+the 'pyphynr' extension namespace.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Union
+import numpy as np
+from ..core.carrier import CarrierConfig
+from ..core.channel_types import ChannelType
+from ..core.numerology import get_numerology
+from ..core.resources import ResourceGrid
+from ..core.waveform import WaveformGenerator, SFN_PERIOD
+from .iq_writer import IQWriter, DEFAULT_BACKOFF_DB
+
+SIGMF_VERSION = "1.0.0"
+SIGMF_DATA_EXT = ".sigmf-data"
+SIGMF_META_EXT = ".sigmf-meta"
+
+# IQ file format -> SigMF datatype
+SIGMF_DATATYPES = {
+    'sc16': 'ci16_le',
+    'sc8': 'ci8',
+    'fc32': 'cf32_le',
+    'cfile': 'cf32_le',
+}
+
+# SigMF datatype -> component dtype of the data file
+SIGMF_COMPONENT_DTYPES = {
+    'ci16_le': np.dtype('<i2'),
+    'ci8': np.dtype('i1'),
+    'cf32_le': np.dtype('<f4'),
+    'cf64_le': np.dtype('<f8'),
+}
+
+def sigmf_paths(path: str) -> tuple:
+    """Get the (data, meta) file names for a recording base name or either file"""
+    for ext in (SIGMF_DATA_EXT, SIGMF_META_EXT):
+        if path.endswith(ext):
+            path = path[:-len(ext)]
+    return path + SIGMF_DATA_EXT, path + SIGMF_META_EXT
+
+def carrier_config_to_dict(carrier_config: CarrierConfig) -> Dict[str, Any]:
+    """Get the fields needed to rebuild a CarrierConfig as JSON-serializable values"""
+    return {
+        'numerology': carrier_config.numerology.mu,
+        'num_rb': carrier_config.n_resource_blocks,
+        'cp_type': carrier_config.cyclic_prefix,
+        'cell_id': carrier_config.n_cell_id,
+        'sample_rate': carrier_config.sample_rate,
+        'fft_size': carrier_config.fft_size,
+        'dtype': np.dtype(carrier_config.dtype).name,
+    }
+
+def carrier_config_from_dict(config: Dict[str, Any]) -> CarrierConfig:
+    """Rebuild a CarrierConfig from carrier_config_to_dict() (or get_carrier_config()) output"""
+    return CarrierConfig(
+        numerology=get_numerology(config['numerology']),
+        n_resource_blocks=config['num_rb'],
+        cyclic_prefix=config.get('cp_type', 'normal'),
+        n_cell_id=config.get('cell_id', 0),
+        sample_rate=config['sample_rate'],
+        fft_size=config.get('fft_size'),
+        dtype=np.dtype(config.get('dtype', 'complex128')).type,
+    )
+
+def _runs(mask: np.ndarray) -> List[tuple]:
+    """Get [start, stop) index runs where a boolean mask is True"""
+    edges = np.flatnonzero(np.diff(np.concatenate([[False], mask, [False]]).astype(np.int8)))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+def slot_annotations(grid: ResourceGrid, generator: WaveformGenerator,
+                     carrier_config: CarrierConfig, frame_idx: int = 0,
+                     center_frequency: float = 0.0) -> List[dict]:
+    """
+    Get SigMF annotations for the slots and channel types of one frame
+
+    Each slot gets one annotation. Each channel type gets one annotation per
+    run of consecutive symbols it occupies within a slot, bounded in frequency
+    by the lowest and highest subcarrier it uses there.
+
+    Args:
+        grid: Resource grid of the frame
+        generator: Waveform generator (for the OFDM parameters)
+        carrier_config: Carrier configuration
+        frame_idx: Frame index within the recording
+        center_frequency: Carrier center frequency in Hz (0: baseband)
+
+    Returns:
+        List of SigMF annotation dicts
+    """
+    ofdm_params = generator._get_ofdm_params(carrier_config)
+    offsets = generator.get_symbol_offsets(ofdm_params)
+    slot_length = int(offsets[-1])
+    total_slots = 10 * carrier_config.numerology.slots_per_subframe
+    frame_start = frame_idx * total_slots * slot_length
+    scs_hz = carrier_config.subcarrier_spacing * 1e3
+
+    # Frequency of each grid subcarrier relative to the carrier center
+    n_subcarriers = grid.n_subcarriers
+    shift = round((ofdm_params.N_fft - n_subcarriers) / 2) - ofdm_params.N_fft // 2
+    subcarrier_freqs = center_frequency + (np.arange(n_subcarriers) + shift) * scs_hz
+
+    annotations = []
+    for slot_idx in range(total_slots):
+        slot_start = frame_start + slot_idx * slot_length
+        annotations.append({
+            'core:sample_start': slot_start,
+            'core:sample_count': slot_length,
+            'core:label': f"slot {slot_idx}",
+            'pyphynr:frame': frame_idx,
+            'pyphynr:slot': slot_idx,
+        })
+
+        _, channel_types = grid.render_slots(slot_idx)
+        for value in np.unique(channel_types).tolist():
+            if value == ChannelType.EMPTY.value:
+                continue
+            occupied = channel_types == value
+            for first_sym, stop_sym in _runs(occupied.any(axis=0)):
+                subcarriers = np.flatnonzero(occupied[:, first_sym:stop_sym].any(axis=1))
+                annotations.append({
+                    'core:sample_start': slot_start + int(offsets[first_sym]),
+                    'core:sample_count': int(offsets[stop_sym] - offsets[first_sym]),
+                    'core:freq_lower_edge': float(subcarrier_freqs[subcarriers[0]] - scs_hz / 2),
+                    'core:freq_upper_edge': float(subcarrier_freqs[subcarriers[-1]] + scs_hz / 2),
+                    'core:label': ChannelType(value).name,
+                    'pyphynr:frame': frame_idx,
+                    'pyphynr:slot': slot_idx,
+                    'pyphynr:symbols': [first_sym, stop_sym],
+                })
+
+    # SigMF requires annotations ordered by sample_start
+    annotations.sort(key=lambda annotation: annotation['core:sample_start'])
+    return annotations
+
+def write_sigmf(path: str,
+                grid: Union[ResourceGrid, Callable[[int], ResourceGrid]],
+                carrier_config: CarrierConfig,
+                generator: Optional[WaveformGenerator] = None,
+                n_frames: int = 1,
+                fmt: str = 'fc32',
+                backoff_db: float = DEFAULT_BACKOFF_DB,
+                scale: Optional[float] = None,
+                center_frequency: Optional[float] = None,
+                description: str = "",
+                carrier_info: Optional[Dict[str, Any]] = None,
+                annotate: bool = True) -> Dict[str, Any]:
+    """
+    Generate a waveform straight into a SigMF recording
+
+    Samples are streamed into the memory-mapped data file chunk by chunk.
+
+    Args:
+        path: Recording base name (or .sigmf-data/.sigmf-meta file name)
+        grid: Resource grid, or a callable returning the grid for a given SFN
+        carrier_config: Carrier configuration
+        generator: Waveform generator (default: a new one)
+        n_frames: Number of 10 ms frames
+        fmt: 'sc16', 'sc8' or 'fc32'
+        backoff_db: Distance between the signal RMS and full scale in dB
+        scale: Fixed linear scale factor (overrides backoff_db)
+        center_frequency: Carrier center frequency in Hz, if any
+        description: Free-text description
+        carrier_info: Extra carrier fields to record (e.g. NRSignalBuilder.get_carrier_config())
+        annotate: If True, add slot and channel type annotations for every frame
+
+    Returns:
+        The metadata that was written
+    """
+    if fmt not in SIGMF_DATATYPES:
+        raise ValueError(f"Invalid SigMF format: {fmt}. Use one of {tuple(SIGMF_DATATYPES)}")
+    generator = generator if generator is not None else WaveformGenerator()
+    data_path, meta_path = sigmf_paths(path)
+
+    ofdm_params = generator._get_ofdm_params(carrier_config)
+    total_slots = 10 * carrier_config.numerology.slots_per_subframe
+    slot_length = int(generator.get_symbol_offsets(ofdm_params)[-1])
+    frame_length = slot_length * total_slots
+
+    with IQWriter(data_path, fmt, n_samples=n_frames * frame_length,
+                  backoff_db=backoff_db, scale=scale) as writer:
+        stats = generator.write_waveform(writer, grid, carrier_config, n_frames=n_frames)
+
+    annotations = []
+    if annotate:
+        for frame_idx in range(n_frames):
+            frame_grid = grid(frame_idx % SFN_PERIOD) if callable(grid) else grid
+            annotations += slot_annotations(frame_grid, generator, carrier_config, frame_idx,
+                                            center_frequency or 0.0)
+
+    capture = {'core:sample_start': 0}
+    if center_frequency is not None:
+        capture['core:frequency'] = center_frequency
+
+    metadata = {
+        'global': {
+            'core:datatype': SIGMF_DATATYPES[fmt],
+            'core:sample_rate': carrier_config.sample_rate,
+            'core:version': SIGMF_VERSION,
+            'core:num_channels': 1,
+            'core:description': description,
+            'core:recorder': 'pyPhyNR',
+            'core:extensions': [{'name': 'pyphynr', 'version': '0.1.0', 'optional': True}],
+            'pyphynr:carrier_config': {**(carrier_info or {}), **carrier_config_to_dict(carrier_config)},
+            'pyphynr:waveform_parameters': _json_safe(generator.get_waveform_parameters(carrier_config)),
+            'pyphynr:frames': n_frames,
+            'pyphynr:slots_per_frame': total_slots,
+            'pyphynr:slot_length': slot_length,
+            'pyphynr:scale': stats['scale'],
+            'pyphynr:quantization': _json_safe(stats),
+        },
+        'captures': [capture],
+        'annotations': annotations,
+    }
+    with open(meta_path, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    return metadata
+
+def _json_safe(value):
+    """Convert numpy scalars/arrays (and infinities) to JSON-serializable values"""
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+class SigMFRecording:
+    """
+    Memory-mapped SigMF recording
+
+    Opening a recording only reads the metadata; samples are paged in from
+    the data file as they are accessed.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a recording
+
+        Args:
+            path: Recording base name (or .sigmf-data/.sigmf-meta file name)
+        """
+        self.data_path, self.meta_path = sigmf_paths(path)
+        with open(self.meta_path) as f:
+            self.metadata = json.load(f)
+
+        info = self.metadata['global']
+        datatype = info['core:datatype']
+        if datatype not in SIGMF_COMPONENT_DTYPES:
+            raise ValueError(f"Unsupported SigMF datatype: {datatype}")
+        self.datatype = datatype
+        self.sample_rate = info['core:sample_rate']
+        self.scale = info.get('pyphynr:scale') or 1.0
+
+        components = np.memmap(self.data_path, dtype=SIGMF_COMPONENT_DTYPES[datatype], mode='r')
+        self.raw = components.reshape(-1, 2)  # Interleaved I/Q, one row per sample
+
+    @property
+    def annotations(self) -> List[dict]:
+        return self.metadata.get('annotations', [])
+
+    @property
+    def carrier_config(self) -> CarrierConfig:
+        """Carrier configuration the recording was generated with"""
+        return carrier_config_from_dict(self.metadata['global']['pyphynr:carrier_config'])
+
+    @property
+    def waveform_parameters(self) -> Dict[str, Any]:
+        return self.metadata['global'].get('pyphynr:waveform_parameters', {})
+
+    def __len__(self) -> int:
+        return self.raw.shape[0]
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        Zero-copy complex view of the data file (cf32/cf64 only)
+
+        The samples are in file units; divide by scale for the generated values.
+        """
+        if self.datatype not in ('cf32_le', 'cf64_le'):
+            raise ValueError(f"No complex view for {self.datatype}; use read()")
+        complex_dtype = np.complex64 if self.datatype == 'cf32_le' else np.complex128
+        return self.raw.reshape(-1).view(complex_dtype)
+
+    def read(self, start: int = 0, count: Optional[int] = None,
+             dtype: type = np.complex64) -> np.ndarray:
+        """
+        Read a range of samples, undoing the quantization scale
+
+        Args:
+            start: First sample
+            count: Number of samples (None: to the end)
+            dtype: Complex dtype of the result
+
+        Returns:
+            Complex samples at the generator's original level
+        """
+        stop = len(self) if count is None else start + count
+        raw = self.raw[start:stop]
+        out = np.empty(raw.shape[0], dtype=dtype)
+        out.real = raw[:, 0]
+        out.imag = raw[:, 1]
+        out /= self.scale
+        return out
+
+    def read_slot(self, frame_idx: int, slot_idx: int, dtype: type = np.complex64) -> np.ndarray:
+        """Read the samples of one slot"""
+        info = self.metadata['global']
+        slots_per_frame = info['pyphynr:slots_per_frame']
+        if not 0 <= slot_idx < slots_per_frame or not 0 <= frame_idx < info['pyphynr:frames']:
+            raise ValueError(f"Frame {frame_idx}, slot {slot_idx} is not in the recording")
+        slot_length = info['pyphynr:slot_length']
+        return self.read((frame_idx * slots_per_frame + slot_idx) * slot_length, slot_length, dtype)
+
+def read_sigmf(path: str) -> SigMFRecording:
+    """
+    Open a SigMF recording with a memory-mapped data file
+
+    Args:
+        path: Recording base name (or .sigmf-data/.sigmf-meta file name)
+
+    Returns:
+        SigMFRecording
+    """
+    return SigMFRecording(path)
@@ -0,0 +1,169 @@
+"""
+Content-addressed on-disk cache of generated waveforms
+
+Each waveform is stored as pynr-<key>.npy in the cache directory, where the key
+is a hash of everything that determines its samples (see
+NRSignalBuilder.config_hash). A hit is served as a read-only memory map, so
+it costs an open and an mmap rather than a synthesis or a full read. The
+modification time of an entry is its last use; when the directory grows
+beyond its size cap the least recently used entries are evicted. Only files
+named like entries are ever evicted or cleared, so the cache may share a
+directory with other data.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, List, Optional
+import numpy as np
+
+DEFAULT_CACHE_BYTES = 4 * 2**30  # Size cap of the cache directory
+CACHE_PREFIX = "pynr-"
+CACHE_EXT = ".npy"
+
+def _to_json(value: Any) -> Any:
+    """Convert numpy values for json.dumps"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Cannot hash {type(value).__name__} values")
+
+def stable_hash(obj: Any) -> str:
+    """
+    Get a stable hash of a JSON-serializable description
+
+    Dictionary order does not matter; the hash is the same across processes,
+    platforms and Python versions (unlike hash()).
+
+    Args:
+        obj: Nested dicts, lists, strings, numbers, booleans and None
+             (numpy scalars and arrays are converted to their Python values)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    text = json.dumps(obj, sort_keys=True, separators=(',', ':'), default=_to_json)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def _is_key(text: str) -> bool:
+    """Check if text looks like a stable_hash() key (hex SHA-256 digest)"""
+    return len(text) == 64 and all(c in '0123456789abcdef' for c in text)
+
+class WaveformCache:
+    """
+    Directory of memory-mapped .npy waveforms with LRU eviction
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent processes sharing a directory never see partial files.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Initialize cache
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Size cap of all entries together
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Get the file of a cache entry"""
+        return os.path.join(self.directory, CACHE_PREFIX + key + CACHE_EXT)
+
+    def _entry_names(self) -> List[str]:
+        """Get the file names of all entries (other files in the directory are ignored)"""
+        return [name for name in os.listdir(self.directory)
+                if name.startswith(CACHE_PREFIX) and name.endswith(CACHE_EXT)
+                and _is_key(name[len(CACHE_PREFIX):-len(CACHE_EXT)])]
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up a waveform
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Read-only memory map of the samples, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            samples = np.load(path, mmap_mode='r')
+            os.utime(path)  # Mark as recently used
+        except (FileNotFoundError, ValueError):
+            return None  # Missing, just evicted, or not a valid .npy file
+        return samples
+
+    def put(self, key: str, samples: np.ndarray) -> bool:
+        """
+        Store a waveform and evict least recently used entries beyond the size cap
+
+        Args:
+            key: Cache key
+            samples: Samples to store
+
+        Returns:
+            True if stored, False if the waveform alone exceeds the size cap
+        """
+        samples = np.asarray(samples)
+        if samples.nbytes > self.max_bytes:
+            return False
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=CACHE_PREFIX, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, samples)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict(keep=key)
+        return True
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Remove least recently used entries until the cache fits its size cap
+
+        Args:
+            keep: Key that is never evicted (the entry just written)
+        """
+        entries = []
+        for name in self._entry_names():
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue  # Removed by another process
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and name == os.path.basename(self.path(keep)):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of all entries"""
+        return sum(os.path.getsize(os.path.join(self.directory, name))
+                   for name in self._entry_names())
+
+    def clear(self):
+        """Remove all entries"""
+        for name in self._entry_names():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
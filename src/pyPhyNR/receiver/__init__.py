@@ -0,0 +1,21 @@
+"""
+Receiver-side processing for 5G NR
+"""
+
+from .demodulator import OfdmDemodulator
+from .channel_estimation import (
+    ChannelEstimate,
+    ChannelEstimator,
+    equalize,
+    exponential_pdp_correlation,
+    uniform_pdp_correlation,
+)
+
+__all__ = [
+    'OfdmDemodulator',
+    'ChannelEstimate',
+    'ChannelEstimator',
+    'equalize',
+    'exponential_pdp_correlation',
+    'uniform_pdp_correlation',
+]
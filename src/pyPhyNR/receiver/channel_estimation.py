@@ -0,0 +1,355 @@
+"""
+DMRS-based channel estimation and equalization for 5G NR
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+from ..core.channel_types import ChannelType
+from ..core.definitions import N_SYMBOLS_PER_SLOT
+
+FREQUENCY_INTERPOLATIONS = ('linear', 'mmse')
+EQUALIZERS = ('zf', 'mmse')
+
+def exponential_pdp_correlation(delay_spread: float, subcarrier_spacing: float) -> Callable:
+    """
+    Frequency correlation of a channel with an exponential power delay profile
+
+    Args:
+        delay_spread: RMS delay spread in seconds
+        subcarrier_spacing: Subcarrier spacing in Hz
+
+    Returns:
+        Function of the subcarrier offset returning the complex correlation
+    """
+    def correlation(delta_k: np.ndarray) -> np.ndarray:
+        return 1 / (1 + 2j * np.pi * delta_k * subcarrier_spacing * delay_spread)
+    return correlation
+
+def uniform_pdp_correlation(max_delay: float, subcarrier_spacing: float) -> Callable:
+    """
+    Frequency correlation of a channel with a uniform power delay profile
+
+    Args:
+        max_delay: Maximum excess delay in seconds (e.g. the CP length)
+        subcarrier_spacing: Subcarrier spacing in Hz
+
+    Returns:
+        Function of the subcarrier offset returning the complex correlation
+    """
+    def correlation(delta_k: np.ndarray) -> np.ndarray:
+        x = delta_k * subcarrier_spacing * max_delay
+        return np.sinc(x) * np.exp(-1j * np.pi * x)
+    return correlation
+
+@dataclass
+class ChannelEstimate:
+    """
+    Channel estimate of a (batch of) received grid(s)
+
+    Symbols of slots without DMRS have no estimate: h is zero there and
+    valid_symbols is False.
+    """
+    h: np.ndarray              # (..., subcarriers, symbols) channel coefficients
+    valid_symbols: np.ndarray  # (symbols,) True where h was estimated
+    noise_var: np.ndarray      # (...) noise variance per RE
+
+def _reference_planes(reference) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the (values, channel_types) planes of a ResourceGrid or tuple"""
+    if hasattr(reference, 'values') and hasattr(reference, 'channel_types'):
+        return reference.values, reference.channel_types
+    values, channel_types = reference
+    return np.asarray(values), np.asarray(channel_types)
+
+def _linear_weights(pilots: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linear interpolation from pilot positions to target positions
+
+    Targets outside the pilots hold the nearest pilot value.
+
+    Args:
+        pilots: Sorted pilot positions
+        targets: Target positions
+
+    Returns:
+        Tuple of (left pilot index, weight of the right pilot) per target
+    """
+    if pilots.size == 1:
+        return np.zeros(targets.size, dtype=int), np.zeros(targets.size)
+    left = np.clip(np.searchsorted(pilots, targets, side='right') - 1, 0, pilots.size - 2)
+    weight = (targets - pilots[left]) / (pilots[left + 1] - pilots[left])
+    return left, np.clip(weight, 0.0, 1.0)
+
+def _time_matrix(positions: np.ndarray) -> np.ndarray:
+    """Linear interpolation matrix (14 x DMRS symbols) from the DMRS symbols of a slot"""
+    left, weight = _linear_weights(positions, np.arange(N_SYMBOLS_PER_SLOT))
+    matrix = np.zeros((N_SYMBOLS_PER_SLOT, positions.size))
+    rows = np.arange(N_SYMBOLS_PER_SLOT)
+    matrix[rows, left] = 1 - weight
+    if positions.size > 1:
+        matrix[rows, left + 1] += weight
+    return matrix
+
+class ChannelEstimator:
+    """
+    Least-squares channel estimation on DMRS with frequency and time interpolation
+
+    The pilots are the DMRS REs of the reference grid. LS estimates of all
+    DMRS symbols with the same subcarrier pattern are interpolated over
+    frequency together, then every slot is interpolated linearly in time
+    from its DMRS symbols, again batched over all slots with the same DMRS
+    positions. No Python loop runs per slot or per symbol.
+
+    MMSE frequency interpolation applies a Wiener filter per block of
+    block_size pilots (plus half a block of neighbouring pilots on either
+    side); blocks with the same relative pilot layout share one filter.
+    """
+
+    def __init__(self,
+                 frequency_interpolation: str = 'linear',
+                 correlation: Optional[Callable] = None,
+                 noise_var: Optional[float] = None,
+                 block_size: int = 24):
+        """
+        Initialize channel estimator
+
+        Args:
+            frequency_interpolation: 'linear' or 'mmse'
+            correlation: Frequency correlation model for MMSE, a function of the
+                         subcarrier offset (see exponential_pdp_correlation)
+            noise_var: Noise variance per RE (None: estimated from the DMRS)
+            block_size: Number of pilots per MMSE interpolation block
+        """
+        if frequency_interpolation not in FREQUENCY_INTERPOLATIONS:
+            raise ValueError(f"Invalid frequency_interpolation: {frequency_interpolation}. "
+                             f"Use one of {FREQUENCY_INTERPOLATIONS}")
+        if frequency_interpolation == 'mmse' and correlation is None:
+            raise ValueError("MMSE interpolation requires a correlation model")
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+
+        self.frequency_interpolation = frequency_interpolation
+        self.correlation = correlation
+        self.noise_var = noise_var
+        self.block_size = block_size
+
+    def estimate(self, received: np.ndarray, reference) -> ChannelEstimate:
+        """
+        Estimate the channel of received grids
+
+        Args:
+            received: Received grid (subcarriers x symbols), or a batch of
+                      grids (... x subcarriers x symbols)
+            reference: Reference ResourceGrid (or (values, channel_types)) holding the DMRS
+
+        Returns:
+            ChannelEstimate
+        """
+        ref_values, channel_types = _reference_planes(reference)
+        received = np.asarray(received)
+        if received.shape[-2:] != ref_values.shape:
+            raise ValueError(f"Received grid shape {received.shape} does not match reference {ref_values.shape}")
+        batch_shape = received.shape[:-2]
+        n_subcarriers, n_symbols = ref_values.shape
+        received = received.reshape((-1, n_subcarriers, n_symbols))
+        n_batch = received.shape[0]
+
+        dmrs_mask = channel_types == ChannelType.DL_DMRS.value
+        dmrs_symbols = np.flatnonzero(dmrs_mask.any(axis=0))
+        if dmrs_symbols.size == 0:
+            raise ValueError("Reference grid holds no DMRS")
+
+        # LS estimates on all DMRS REs at once, kept for the DMRS symbols only:
+        # (batch, subcarriers, DMRS symbols)
+        pilot_mask = dmrs_mask[:, dmrs_symbols]
+        pilot_values = ref_values[:, dmrs_symbols]
+        received_dmrs = received[:, :, dmrs_symbols]
+        ls = np.zeros(received_dmrs.shape, dtype=np.result_type(received.dtype, np.complex64))
+        ls[:, pilot_mask] = received_dmrs[:, pilot_mask] / pilot_values[pilot_mask]
+
+        # Group DMRS symbols by subcarrier pattern (usually a single one)
+        if (pilot_mask == pilot_mask[:, :1]).all():
+            patterns = pilot_mask[:, :1].T
+            pattern_of_column = np.zeros(dmrs_symbols.size, dtype=int)
+        else:
+            patterns, pattern_of_column = np.unique(pilot_mask.T, axis=0, return_inverse=True)
+            pattern_of_column = pattern_of_column.reshape(-1)
+
+        noise_var = self._noise_var(ls, pilot_values, patterns, pattern_of_column)
+
+        # Frequency interpolation of all DMRS symbols with the same pattern together
+        h_dmrs = np.zeros_like(ls)
+        targets = np.arange(n_subcarriers)
+        for p, pattern in enumerate(patterns):
+            columns = np.flatnonzero(pattern_of_column == p)
+            pilots = np.flatnonzero(pattern)
+            pilot_ls = ls[:, pilots[:, None], columns]                 # (batch, pilots, columns)
+            if self.frequency_interpolation == 'linear':
+                left, weight = _linear_weights(pilots, targets)
+                right = np.minimum(left + 1, pilots.size - 1)
+                h_dmrs[:, :, columns] = (pilot_ls[:, left] * (1 - weight)[:, None] +
+                                         pilot_ls[:, right] * weight[:, None])
+            else:
+                pilot_energy = np.mean(np.abs(pilot_values[pilots[:, None], columns])**2)
+                h_dmrs[:, :, columns] = self._mmse_interpolate(
+                    pilot_ls, pilots, n_subcarriers, noise_var / pilot_energy)
+
+        # Time interpolation, batched over all slots with the same DMRS positions
+        n_slots = -(-n_symbols // N_SYMBOLS_PER_SLOT)
+        h = np.zeros((n_batch, n_subcarriers, n_slots, N_SYMBOLS_PER_SLOT), dtype=ls.dtype)
+        valid_slots = np.zeros(n_slots, dtype=bool)
+        slots = dmrs_symbols // N_SYMBOLS_PER_SLOT
+        slot_positions: Dict[tuple, list] = {}
+        for slot in np.unique(slots):
+            positions = tuple(dmrs_symbols[slots == slot] % N_SYMBOLS_PER_SLOT)
+            slot_positions.setdefault(positions, []).append(slot)
+
+        for positions, slot_list in slot_positions.items():
+            slot_list = np.array(slot_list)
+            columns = np.searchsorted(dmrs_symbols, slot_list[:, None] * N_SYMBOLS_PER_SLOT + positions)
+            # Complex matrix so the product runs as a single BLAS call
+            time_matrix = _time_matrix(np.array(positions)).T.astype(ls.dtype)  # (DMRS symbols, 14)
+            h[:, :, slot_list] = h_dmrs[:, :, columns] @ time_matrix
+            valid_slots[slot_list] = True
+
+        h = h.reshape(n_batch, n_subcarriers, -1)[:, :, :n_symbols]
+        valid_symbols = np.repeat(valid_slots, N_SYMBOLS_PER_SLOT)[:n_symbols]
+
+        return ChannelEstimate(
+            h=h.reshape(batch_shape + h.shape[1:]),
+            valid_symbols=valid_symbols,
+            noise_var=noise_var.reshape(batch_shape),
+        )
+
+    def _noise_var(self, ls: np.ndarray, pilot_values: np.ndarray,
+                   patterns: np.ndarray, pattern_of_column: np.ndarray) -> np.ndarray:
+        """
+        Get the noise variance per capture
+
+        Unless configured, it is estimated from the second difference of the
+        LS estimates over neighbouring pilots, which cancels a channel that
+        is locally linear in frequency: E|e|^2 = 6 * noise_var / |X|^2.
+        """
+        n_batch = ls.shape[0]
+        if self.noise_var is not None:
+            return np.full(n_batch, float(self.noise_var))
+
+        error_energy = np.zeros(n_batch)
+        n_samples = 0
+        for p, pattern in enumerate(patterns):
+            pilots = np.flatnonzero(pattern)
+            if pilots.size < 3:
+                continue
+            columns = np.flatnonzero(pattern_of_column == p)
+            pilot_ls = ls[:, pilots[:, None], columns]
+            second_diff = pilot_ls[:, :-2] - 2 * pilot_ls[:, 1:-1] + pilot_ls[:, 2:]
+            pilot_energy = np.abs(pilot_values[pilots[1:-1, None], columns])**2
+            error_energy += np.sum(np.abs(second_diff)**2 * pilot_energy, axis=(1, 2))
+            n_samples += second_diff[0].size
+
+        if n_samples == 0:
+            raise ValueError("Noise variance cannot be estimated from fewer than 3 pilots per symbol; "
+                             "set noise_var")
+        return error_energy / (6 * n_samples)
+
+    def _mmse_interpolate(self, pilot_ls: np.ndarray, pilots: np.ndarray,
+                          n_subcarriers: int, ls_noise_var: np.ndarray) -> np.ndarray:
+        """
+        Wiener-filter LS pilot estimates onto all subcarriers
+
+        Args:
+            pilot_ls: LS estimates (batch, pilots, symbols)
+            pilots: Pilot subcarriers
+            n_subcarriers: Number of subcarriers
+            ls_noise_var: Noise variance of the LS estimates per capture
+
+        Returns:
+            Interpolated estimates (batch, subcarriers, symbols)
+        """
+        n_batch, n_pilots, n_cols = pilot_ls.shape
+        block = self.block_size
+        margin = block // 2
+        n_blocks = -(-n_pilots // block)
+
+        # Block b fills the subcarriers from its first pilot up to the next block's
+        # first pilot (the outer blocks extend to the carrier edges)
+        starts = pilots[np.arange(n_blocks) * block]
+        target_starts = np.concatenate([[0], starts[1:]])
+        target_stops = np.concatenate([starts[1:], [n_subcarriers]])
+
+        # Blocks with the same layout relative to their first pilot share a filter
+        groups: Dict[tuple, list] = {}
+        for b in range(n_blocks):
+            window = np.arange(max(b * block - margin, 0), min((b + 1) * block + margin, n_pilots))
+            key = (tuple(pilots[window] - starts[b]),
+                   target_starts[b] - starts[b], target_stops[b] - starts[b])
+            groups.setdefault(key, []).append((b, window[0]))
+
+        output = np.zeros((n_batch, n_subcarriers, n_cols), dtype=pilot_ls.dtype)
+        for (offsets, t_start, t_stop), members in groups.items():
+            offsets = np.array(offsets)
+            rel_targets = np.arange(t_start, t_stop)
+
+            r_pp = self.correlation(offsets[:, None] - offsets[None, :])
+            r_tp = self.correlation(rel_targets[:, None] - offsets[None, :])
+            regularized = r_pp + ls_noise_var[:, None, None] * np.eye(offsets.size)
+            # W = R_tp (R_pp + s2 I)^-1 for every capture: (batch, targets, window)
+            weights = np.linalg.solve(np.swapaxes(regularized, 1, 2),
+                                      np.broadcast_to(r_tp.T, (n_batch,) + r_tp.T.shape))
+            weights = np.swapaxes(weights, 1, 2)
+
+            blocks = np.array([b for b, _ in members])
+            window_index = np.array([first for _, first in members])[:, None] + np.arange(offsets.size)
+            windows = pilot_ls[:, window_index]                      # (batch, blocks, window, symbols)
+            filtered = weights[:, None] @ windows                    # (batch, blocks, targets, symbols)
+            target_index = starts[blocks][:, None] + rel_targets      # (blocks, targets)
+            output[:, target_index] = filtered
+
+        return output
+
+def equalize(received: np.ndarray,
+             estimate: ChannelEstimate,
+             method: str = 'zf',
+             symbol_energy: float = 1.0,
+             antenna_axis: Optional[int] = None) -> np.ndarray:
+    """
+    Per-RE equalization of received grids
+
+    Args:
+        received: Received grid(s), same shape as estimate.h
+        estimate: Channel estimate
+        method: 'zf' (Y / H) or 'mmse' (H* Y / (|H|^2 + noise_var / symbol_energy))
+        symbol_energy: Average energy per data RE (for MMSE)
+        antenna_axis: Axis of received holding receive antennas to combine
+                      (maximum ratio combining); None equalizes every grid separately
+
+    Returns:
+        Equalized grid(s), without antenna_axis if given; symbols without a
+        channel estimate are zero
+    """
+    if method not in EQUALIZERS:
+        raise ValueError(f"Invalid equalizer: {method}. Use one of {EQUALIZERS}")
+
+    received = np.asarray(received)
+    h = estimate.h
+    if received.shape != h.shape:
+        raise ValueError(f"Received grid shape {received.shape} does not match estimate {h.shape}")
+
+    noise = np.asarray(estimate.noise_var) / symbol_energy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if antenna_axis is None:
+            numerator = np.conj(h) * received
+            denominator = np.abs(h)**2
+        else:
+            # Noise is taken as equal on all antennas
+            antenna_axis %= received.ndim
+            numerator = np.sum(np.conj(h) * received, axis=antenna_axis)
+            denominator = np.sum(np.abs(h)**2, axis=antenna_axis)
+            noise = np.mean(noise, axis=antenna_axis)
+
+        if method == 'mmse':
+            denominator = denominator + noise[..., None, None]
+        equalized = numerator / denominator
+    equalized[..., ~estimate.valid_symbols] = 0
+    equalized[~np.isfinite(equalized)] = 0  # Unestimated REs (h == 0)
+    return equalized
@@ -0,0 +1,132 @@
+"""
+OFDM demodulation for 5G NR
+"""
+
+from typing import Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
+from ..core.carrier import CarrierConfig
+from ..core.definitions import N_SC_PER_RB, N_SYMBOLS_PER_SLOT
+from ..waveforms.ofdm import OfdmParams, calculate_ofdm_params, get_subcarrier_bins, get_symbol_offsets
+from ..waveforms.fft import FFTBackend, get_fft_backend
+
+class OfdmDemodulator:
+    """
+    Recover the (subcarriers x symbols) grid from IQ samples
+
+    Inverse of WaveformGenerator.modulate_slots(): the CP of every symbol is
+    dropped with one precomputed gather index, all symbols are transformed
+    with a single batched FFT and the grid subcarriers are read back from
+    the same bins the modulator centered them on.
+    """
+
+    def __init__(self,
+                 carrier_config: Optional[CarrierConfig] = None,
+                 ofdm_params: Optional[OfdmParams] = None,
+                 n_subcarriers: Optional[int] = None,
+                 fft_backend: Union[str, FFTBackend, None] = None):
+        """
+        Initialize demodulator
+
+        Args:
+            carrier_config: Carrier configuration (provides OFDM parameters and grid size)
+            ofdm_params: OFDM parameters (instead of, or overriding, carrier_config)
+            n_subcarriers: Number of grid subcarriers (default: from carrier_config)
+            fft_backend: FFT backend name or instance (None: the process-wide default)
+        """
+        if ofdm_params is None:
+            if carrier_config is None:
+                raise ValueError("Either carrier_config or ofdm_params is required")
+            ofdm_params = calculate_ofdm_params(
+                fs_hz=carrier_config.sample_rate,
+                mu=carrier_config.numerology.mu,
+                cp_type="normal",
+                custom_fft_size=carrier_config.fft_size
+            )
+        if n_subcarriers is None:
+            if carrier_config is None:
+                raise ValueError("n_subcarriers is required without a carrier_config")
+            n_subcarriers = carrier_config.n_resource_blocks * N_SC_PER_RB
+
+        self.ofdm_params = ofdm_params
+        self.n_subcarriers = n_subcarriers
+        self._fft_backend = None if fft_backend is None else get_fft_backend(fft_backend)
+
+        self.bins = get_subcarrier_bins(n_subcarriers, ofdm_params)
+        offsets = get_symbol_offsets(ofdm_params)
+        self.slot_length = int(offsets[-1])
+
+        # Sample index of every useful (post-CP) sample within a slot: (symbols, N_fft)
+        useful_starts = offsets[:-1] + np.asarray(ofdm_params.cp_per_symbol[:N_SYMBOLS_PER_SLOT])
+        self.gather_index = useful_starts[:, None] + np.arange(ofdm_params.N_fft)
+
+    @property
+    def fft_backend(self) -> FFTBackend:
+        """FFT backend used for the FFTs"""
+        return get_fft_backend(self._fft_backend)
+
+    def demodulate(self, samples: np.ndarray, n_slots: Optional[int] = None) -> np.ndarray:
+        """
+        Demodulate whole slots of IQ samples
+
+        Args:
+            samples: IQ samples starting at a slot boundary (any number of frames)
+            n_slots: Number of slots to demodulate (default: all complete slots)
+
+        Returns:
+            Frequency domain grid (subcarriers x symbols), in the precision of samples
+        """
+        samples = np.asarray(samples)
+        available = samples.size // self.slot_length
+        if n_slots is None:
+            n_slots = available
+        elif n_slots > available:
+            raise ValueError(f"{samples.size} samples hold {available} slots, {n_slots} requested")
+
+        # Gather the useful part of every symbol: (slots, symbols, N_fft)
+        slots = samples[:n_slots * self.slot_length].reshape(n_slots, self.slot_length)
+        time_domain = slots[:, self.gather_index].reshape(n_slots * N_SYMBOLS_PER_SLOT, -1)
+
+        freq_domain = self.fft_backend.fft(time_domain, axis=1)
+        return np.ascontiguousarray(freq_domain[:, self.bins].T)
+
+    def stream(self, chunks: Iterable[np.ndarray],
+               slots_per_output: int = 1) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Demodulate a stream of IQ chunks of arbitrary size
+
+        Samples are buffered until slots_per_output complete slots are
+        available; a trailing partial slot at the end of the stream is dropped.
+
+        Args:
+            chunks: Iterable of IQ sample chunks, starting at a slot boundary
+            slots_per_output: Number of slots per yielded grid block
+
+        Yields:
+            Tuple of (index of the first slot in the block, grid block of
+            shape subcarriers x (slots_per_output * 14))
+        """
+        block_length = slots_per_output * self.slot_length
+        pending = []
+        n_pending = 0
+        slot_idx = 0
+
+        for chunk in chunks:
+            pending.append(np.array(chunk, copy=True))  # Chunks may reuse their buffer
+            n_pending += pending[-1].size
+            if n_pending < block_length:
+                continue
+
+            buffer = np.concatenate(pending)
+            n_blocks = buffer.size // block_length
+            for block in range(n_blocks):
+                yield slot_idx, self.demodulate(buffer[block * block_length:(block + 1) * block_length])
+                slot_idx += slots_per_output
+
+            rest = buffer[n_blocks * block_length:]
+            pending = [rest] if rest.size else []
+            n_pending = rest.size
+
+        # Complete slots left over when the stream ends
+        if n_pending >= self.slot_length:
+            buffer = np.concatenate(pending)
+            yield slot_idx, self.demodulate(buffer)
@@ -0,0 +1,19 @@
+"""
+Monte-Carlo simulation tools
+"""
+
+from .sweep import (
+    sweep_points,
+    trial_seed,
+    link_trial,
+    SweepResults,
+    ParameterSweep,
+)
+
+__all__ = [
+    'sweep_points',
+    'trial_seed',
+    'link_trial',
+    'SweepResults',
+    'ParameterSweep',
+]
@@ -0,0 +1,365 @@
+"""
+Parallel Monte-Carlo parameter sweeps with reproducible seeding and resume
+"""
+
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from ..core.channel_types import ChannelType
+from ..core.modulation import BITS_PER_SYMBOL, ModulationType, count_bit_errors, hard_decision
+
+def sweep_points(axes: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    """
+    Get the parameter sets of a sweep (cartesian product of the axes)
+
+    Args:
+        axes: Dictionary of parameter name -> values, e.g. {'snr_db': [0, 5, 10]}
+
+    Returns:
+        List of parameter dictionaries; the last axis varies fastest
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+def trial_seed(root: np.random.SeedSequence, point: int, trial: int) -> np.random.SeedSequence:
+    """
+    Get the seed of one trial
+
+    Derived from the root by spawn key rather than by spawning in order, so
+    a trial gets the same stream no matter which worker runs it, in which
+    order, or whether the sweep was resumed.
+
+    Args:
+        root: Root SeedSequence of the sweep
+        point: Index of the parameter set
+        trial: Trial index within the parameter set
+
+    Returns:
+        SeedSequence of the trial
+    """
+    return np.random.SeedSequence(root.entropy, spawn_key=tuple(root.spawn_key) + (point, trial))
+
+def _run_trial(recipe: Callable, trial: Callable, params: dict,
+               seed: np.random.SeedSequence) -> Dict[str, float]:
+    """Build the signal of one trial and measure it (runs in the workers)"""
+    builder_seed, trial_seed_ = seed.spawn(2)
+    builder = recipe(params, builder_seed)
+    metrics = trial(builder, params, np.random.default_rng(trial_seed_))
+    return {name: float(value) for name, value in metrics.items()}
+
+class SweepResults:
+    """
+    Incremental aggregation of trial metrics per parameter set
+
+    Metrics are averaged over trials, except RMS quantities ('evm_*'),
+    which are combined as the RMS over trials, and bit errors, which give
+    the BER as total bit errors over total bits.
+    """
+
+    def __init__(self, points: List[Dict[str, Any]]):
+        self.points = points
+        self._sums = [{} for _ in points]
+        self._counts = np.zeros(len(points), dtype=int)
+
+    def add(self, point: int, metrics: Dict[str, float]):
+        """Add the metrics of one trial"""
+        sums = self._sums[point]
+        for name, value in metrics.items():
+            if name.startswith('evm_'):
+                value = value**2
+            sums[name] = sums.get(name, 0.0) + value
+        self._counts[point] += 1
+
+    @property
+    def n_trials(self) -> np.ndarray:
+        """Number of completed trials per parameter set"""
+        return self._counts.copy()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Get the aggregated results
+
+        Returns:
+            One dictionary per parameter set with the parameters, 'n_trials'
+            and the aggregated metrics
+        """
+        rows = []
+        for point, params in enumerate(self.points):
+            row = dict(params)
+            count = self._counts[point]
+            row['n_trials'] = int(count)
+            sums = self._sums[point]
+            for name, total in sums.items():
+                if name in ('bit_errors', 'n_bits'):
+                    row[name] = total
+                elif name.startswith('evm_'):
+                    row[name] = float(np.sqrt(total / count))
+                else:
+                    row[name] = total / count
+            if sums.get('n_bits'):
+                row['ber'] = sums.get('bit_errors', 0.0) / sums['n_bits']
+            rows.append(row)
+        return rows
+
+class ParameterSweep:
+    """
+    Monte-Carlo sweep over a grid of parameters
+
+    Every trial rebuilds the signal with recipe(params, seed) and measures
+    it with trial(builder, params, rng). Trials are fanned out over a
+    process pool; each one draws from its own Generator derived from the
+    root SeedSequence (see trial_seed), so results do not depend on the
+    number of workers. Completed trials are appended to a JSON-lines
+    results file as they finish, and a sweep restarted on the same file
+    only runs the missing trials.
+
+    recipe and trial must be picklable (module-level functions) when
+    workers > 1.
+    """
+
+    def __init__(self,
+                 recipe: Callable[[dict, np.random.SeedSequence], Any],
+                 axes: Dict[str, Sequence],
+                 n_trials: int,
+                 trial: Optional[Callable] = None,
+                 seed: Union[int, np.random.SeedSequence, None] = None,
+                 results_path: Optional[str] = None,
+                 workers: int = 1):
+        """
+        Initialize sweep
+
+        Args:
+            recipe: Function (params, seed) -> NRSignalBuilder with its grid built;
+                    the seed should be passed on to NRSignalBuilder(seed=...)
+            axes: Dictionary of parameter name -> values
+            n_trials: Number of trials per parameter set
+            trial: Function (builder, params, rng) -> dict of metrics (default: link_trial)
+            seed: Root seed (None: fresh entropy, or the seed stored in an existing results file)
+            results_path: JSON-lines file for completed trials (None: keep results in memory only)
+            workers: Number of worker processes (1: run in this process)
+        """
+        if n_trials < 1:
+            raise ValueError("n_trials must be positive")
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.recipe = recipe
+        self.trial = trial if trial is not None else link_trial
+        self.axes = {name: list(values) for name, values in axes.items()}
+        self.points = sweep_points(self.axes)
+        self.n_trials = n_trials
+        self.results_path = results_path
+        self.workers = workers
+
+        completed, stored_root = self._load()
+        if isinstance(seed, np.random.SeedSequence):
+            self.root = seed
+        elif seed is None and stored_root is not None:
+            self.root = np.random.SeedSequence(stored_root['entropy'], spawn_key=stored_root['spawn_key'])
+        else:
+            self.root = np.random.SeedSequence(seed)
+        if stored_root is not None and stored_root != self._root_description():
+            raise ValueError(f"Results file {results_path} was written with a different seed")
+
+        self.results = SweepResults(self.points)
+        self._completed = set()
+        for point, trial_idx, metrics in completed:
+            if (point, trial_idx) not in self._completed:
+                self._completed.add((point, trial_idx))
+                self.results.add(point, metrics)
+
+    def _header(self) -> dict:
+        return dict(self._root_description(), axes=self.axes, n_trials=self.n_trials)
+
+    def _root_description(self) -> dict:
+        """Get the entropy and spawn key that identify the root SeedSequence"""
+        return {'entropy': self.root.entropy, 'spawn_key': [int(k) for k in self.root.spawn_key]}
+
+    def _load(self) -> Tuple[List[Tuple[int, int, dict]], Optional[dict]]:
+        """
+        Read completed trials and the root seed from the results file
+
+        A last line cut off by an interruption is truncated away, so records
+        appended by the resumed run start on a line of their own.
+
+        Returns:
+            Tuple of (list of (point, trial, metrics), root description with
+            'entropy' and 'spawn_key', or None for a new file)
+        """
+        if self.results_path is None or not os.path.exists(self.results_path):
+            return [], None
+
+        with open(self.results_path, 'rb') as f:
+            content = f.read()
+        complete = content.rfind(b'\n') + 1
+        if complete < len(content):
+            os.truncate(self.results_path, complete)
+
+        completed = []
+        root = None
+        for line in content[:complete].splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Corrupted line
+            if 'sweep' in record:
+                header = record['sweep']
+                if header['axes'] != json.loads(json.dumps(self.axes)):
+                    raise ValueError(f"Results file {self.results_path} belongs to a different sweep")
+                root = {'entropy': header['entropy'], 'spawn_key': header.get('spawn_key', [])}
+            else:
+                completed.append((record['point'], record['trial'], record['metrics']))
+        return completed, root
+
+    def pending(self) -> List[Tuple[int, int]]:
+        """Get the (point, trial) pairs that still have to run"""
+        return [(point, trial_idx)
+                for trial_idx in range(self.n_trials)
+                for point in range(len(self.points))
+                if (point, trial_idx) not in self._completed]
+
+    def _trials(self, pending: List[Tuple[int, int]]) -> Iterator[Tuple[int, int, dict]]:
+        """Run trials, yielding (point, trial, metrics) as they complete"""
+        if self.workers == 1:
+            for point, trial_idx in pending:
+                seed = trial_seed(self.root, point, trial_idx)
+                yield point, trial_idx, _run_trial(self.recipe, self.trial, self.points[point], seed)
+            return
+
+        # Bounded number of trials in flight, so huge sweeps do not queue everything at once
+        queue = deque(pending)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            running = {}
+            while queue or running:
+                while queue and len(running) < 2 * self.workers:
+                    point, trial_idx = queue.popleft()
+                    future = pool.submit(_run_trial, self.recipe, self.trial, self.points[point],
+                                         trial_seed(self.root, point, trial_idx))
+                    running[future] = (point, trial_idx)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    point, trial_idx = running.pop(future)
+                    yield point, trial_idx, future.result()
+
+    def run(self, progress: Optional[Callable[[int, int], None]] = None) -> SweepResults:
+        """
+        Run all pending trials
+
+        Args:
+            progress: Optional callback (completed trials, total trials)
+
+        Returns:
+            SweepResults including trials of earlier (interrupted) runs
+        """
+        pending = self.pending()
+        total = len(self.points) * self.n_trials
+
+        results_file = None
+        if self.results_path is not None:
+            new_file = not os.path.exists(self.results_path)
+            results_file = open(self.results_path, 'a')
+            if new_file:
+                results_file.write(json.dumps({'sweep': self._header()}) + '\n')
+                results_file.flush()
+
+        try:
+            for point, trial_idx, metrics in self._trials(pending):
+                self._completed.add((point, trial_idx))
+                self.results.add(point, metrics)
+                if results_file is not None:
+                    record = {'point': point, 'trial': trial_idx, 'metrics': metrics}
+                    results_file.write(json.dumps(record) + '\n')
+                    results_file.flush()
+                if progress is not None:
+                    progress(len(self._completed), total)
+        finally:
+            if results_file is not None:
+                results_file.close()
+
+        return self.results
+
+def link_trial(builder, params: dict, rng: np.random.Generator) -> Dict[str, float]:
+    """
+    Frequency-domain link trial: fading, noise, DMRS channel estimation and equalization
+
+    Parameters used (besides those of the recipe):
+        snr_db: SNR per RE in dB (required)
+        profile: TDL profile name, or None for AWGN only (default None)
+        delay_spread: RMS delay spread in seconds (default 100 ns)
+        max_doppler: Maximum Doppler shift in Hz (default 0)
+        n_rx: Number of receive antennas with fading, combined by MRC (default 1)
+        perfect_csi: Equalize with the true channel instead of the DMRS estimate (default False)
+        frequency_interpolation: 'linear' or 'mmse' (default 'linear'; MMSE assumes
+                                 an exponential PDP with the trial's delay spread)
+        equalizer: 'zf' or 'mmse' (default 'mmse')
+
+    Args:
+        builder: NRSignalBuilder with the transmitted grid
+        params: Trial parameters
+        rng: Random generator of the trial
+
+    Returns:
+        Metrics: 'evm_<group>' per measurement group, 'bit_errors' and 'n_bits' of the PDSCH
+    """
+    from ..analysis import measure_evm, modulation_plane
+    from ..channel_models import FrequencyDomainChannel, TDLChannel
+    from ..receiver import ChannelEstimate, ChannelEstimator, equalize, exponential_pdp_correlation
+
+    grid = builder.grid
+    carrier_config = builder.carrier_config
+    delay_spread = params.get('delay_spread', 100e-9)
+    n_rx = params.get('n_rx', 1)
+
+    fading = None
+    if params.get('profile') is not None:
+        fading = TDLChannel(params['profile'], delay_spread, params.get('max_doppler', 0.0),
+                            carrier_config.sample_rate, n_rx=n_rx, seed=rng)
+    channel = FrequencyDomainChannel(fading, carrier_config, snr_db=params['snr_db'], seed=rng)
+    received, response = channel.process(grid, return_response=True)
+
+    if params.get('perfect_csi', False):
+        estimate = ChannelEstimate(h=response, valid_symbols=np.ones(grid.values.shape[1], dtype=bool),
+                                   noise_var=np.full(received.shape[0], channel.noise_var))
+    else:
+        interpolation = params.get('frequency_interpolation', 'linear')
+        correlation = None
+        if interpolation == 'mmse':
+            correlation = exponential_pdp_correlation(delay_spread, channel.ofdm_params.scs_hz)
+        estimate = ChannelEstimator(interpolation, correlation).estimate(received, grid)
+    # noise_var is in absolute received units, so MMSE needs the transmitted RE energy
+    occupied = grid.channel_types != ChannelType.EMPTY.value
+    symbol_energy = float(np.mean(np.abs(grid.values[occupied])**2)) if occupied.any() else 1.0
+    equalized = equalize(received, estimate, params.get('equalizer', 'mmse'),
+                         symbol_energy=symbol_energy, antenna_axis=0)
+
+    modulations = modulation_plane(builder.channels, grid.values.shape)
+    report = measure_evm(equalized, grid, modulations=modulations)
+    metrics = {f"evm_{name.lower()}": value for name, value in zip(report.groups, report.rms_evm)}
+
+    # Hard decisions on the PDSCH REs, after removing each channel's power scaling
+    amplitude = np.ones(grid.values.shape)
+    for ch in builder.channels:
+        if ch.channel_type == ChannelType.PDSCH and ch.power != 0.0:
+            subcarriers, _ = ch._subcarrier_index()
+            for symbols in ch.time_indices.values():
+                amplitude[subcarriers, symbols.start:symbols.stop] = 10**(ch.power / 20)
+
+    pdsch = grid.channel_types == ChannelType.PDSCH.value
+    bit_errors = 0
+    n_bits = 0
+    for value in np.unique(modulations[pdsch]):
+        if value == 0:
+            continue
+        modulation = ModulationType(int(value))
+        mask = pdsch & (modulations == value)
+        decided = hard_decision(equalized[mask] / amplitude[mask], modulation)
+        reference = hard_decision(grid.values[mask] / amplitude[mask], modulation)
+        bit_errors += count_bit_errors(decided, reference)
+        n_bits += int(mask.sum()) * BITS_PER_SYMBOL[modulation]
+    metrics['bit_errors'] = bit_errors
+    metrics['n_bits'] = n_bits
+    return metrics
@@ -6,3 +6,4 @@ from .plotting import (
     plot_frequency_domain,
 )
 
+from .benchmark import benchmark_workers, benchmark_channel
@@ -0,0 +1,92 @@
+"""
+Benchmarks for waveform synthesis and channel models
+"""
+
+import os
+import time
+import numpy as np
+from typing import List, Optional, Sequence
+from ..core.carrier import CarrierConfig
+from ..core.resources import ResourceGrid
+from ..core.waveform import WaveformGenerator
+
+def benchmark_workers(grid: ResourceGrid,
+                      carrier_config: CarrierConfig,
+                      worker_counts: Optional[Sequence[int]] = None,
+                      executor: str = 'process',
+                      repeat: int = 3) -> List[dict]:
+    """
+    Measure frame synthesis time for different worker counts
+
+    The symbol cache is disabled so every run does the full IFFT work, and
+    the pool is warmed up before timing, so start-up cost is not included.
+
+    Args:
+        grid: Resource grid to synthesize
+        carrier_config: Carrier configuration
+        worker_counts: Worker counts to try (default: powers of two up to the CPU count)
+        executor: Worker pool type, 'process' or 'thread'
+        repeat: Number of timed runs per worker count (best run is kept)
+
+    Returns:
+        List of {'workers', 'seconds', 'speedup'} dicts, speedup relative to the first entry
+    """
+    if worker_counts is None:
+        n_cpus = os.cpu_count() or 1
+        worker_counts = [2**i for i in range(n_cpus.bit_length()) if 2**i <= n_cpus]
+        if worker_counts[-1] != n_cpus:
+            worker_counts.append(n_cpus)
+
+    results = []
+    for workers in worker_counts:
+        with WaveformGenerator(symbol_cache_bytes=0, workers=workers, executor=executor) as generator:
+            generator.generate_frame_waveform(grid, carrier_config)  # Warm-up
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                generator.generate_frame_waveform(grid, carrier_config)
+                timings.append(time.perf_counter() - start)
+        results.append({'workers': workers, 'seconds': min(timings)})
+
+    for result in results:
+        result['speedup'] = results[0]['seconds'] / result['seconds']
+
+    return results
+
+def benchmark_channel(channel,
+                      n_samples: Optional[int] = None,
+                      chunk_size: Optional[int] = None,
+                      repeat: int = 3) -> dict:
+    """
+    Measure the throughput of a channel model
+
+    Args:
+        channel: Channel with process() (e.g. TDLChannel)
+        n_samples: Number of input samples (default: one 10 ms frame at the channel's
+                   sample rate, 122.88 MHz (100 MHz carrier) if it has none)
+        chunk_size: Process the input in chunks of this size (default: one call)
+        repeat: Number of timed runs (best run is kept)
+
+    Returns:
+        Dict with 'seconds' and 'msamples_per_s' (input samples per second, in millions)
+    """
+    if n_samples is None:
+        n_samples = int(round(getattr(channel, 'sample_rate', 122.88e6) * 10e-3))
+    if chunk_size is None:
+        chunk_size = n_samples
+
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(n_samples) + 1j * rng.standard_normal(n_samples)) / np.sqrt(2)
+
+    reset = getattr(channel, 'reset', lambda: None)  # Stateless channels have no reset()
+    timings = []
+    for _ in range(repeat):
+        reset()
+        start = time.perf_counter()
+        for offset in range(0, n_samples, chunk_size):
+            channel.process(samples[offset:offset + chunk_size])
+        timings.append(time.perf_counter() - start)
+    reset()
+
+    seconds = min(timings)
+    return {'seconds': seconds, 'msamples_per_s': n_samples / seconds / 1e6}
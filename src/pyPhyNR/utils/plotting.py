@@ -25,6 +25,7 @@ DL_CHANNEL_COLORS = {
     ChannelType.SSS: 'pink',
     # Reference Signals
     ChannelType.DL_DMRS: 'yellow',
+    ChannelType.PBCH_DMRS: 'gold',
     ChannelType.DL_PTRS: 'purple',
     ChannelType.CSI_RS: 'brown'
 }
@@ -68,9 +69,8 @@ def _plot_frame(carrier: CarrierConfig, grid: ResourceGrid, channel_colors: dict
 
     fig, ax = plt.subplots(figsize=(22, 10))
 
-    # Get channel types array from ResourceGrid
-    grid_values = np.array([[ch_type.value for ch_type in row] 
-                           for row in grid.channel_types])
+    # Get channel types array (ChannelType values) from ResourceGrid
+    grid_values = grid.channel_types
 
     ax.imshow(grid_values, aspect='auto', interpolation='nearest', 
               cmap=custom_cmap, origin='lower', vmin=0, vmax=len(colors)-1)
@@ -0,0 +1,11 @@
+from .fft import (
+    FFTBackend,
+    NumpyFFTBackend,
+    ScipyFFTBackend,
+    PyFFTWBackend,
+    get_fft_backend,
+    set_default_fft_backend,
+    get_default_fft_backend,
+    benchmark_fft_backends,
+    select_fastest_fft_backend,
+)
@@ -0,0 +1,264 @@
+"""
+FFT backends for OFDM modulation and demodulation
+"""
+
+import os
+import time
+import warnings
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+
+class FFTBackend(ABC):
+    """
+    Base class of FFT backends
+
+    Backends transform along one axis of a complex array. numpy's
+    normalization is used throughout: ifft scales by 1/N, fft does not.
+    """
+    name = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check if the library behind the backend can be imported"""
+        return True
+
+    @abstractmethod
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        """Forward FFT along axis"""
+
+    @abstractmethod
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        """Inverse FFT along axis"""
+
+    def clone(self) -> 'FFTBackend':
+        """Get an instance that can be used concurrently with this one"""
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+class NumpyFFTBackend(FFTBackend):
+    """numpy.fft (pocketfft, single-threaded)"""
+    name = 'numpy'
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.fft.fft(x, axis=axis)
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.fft.ifft(x, axis=axis)
+
+class ScipyFFTBackend(FFTBackend):
+    """scipy.fft with multithreading over the batch dimension"""
+    name = 'scipy'
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Number of threads (None: all CPUs)
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import scipy.fft  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        import scipy.fft
+        return scipy.fft.fft(x, axis=axis, workers=self.workers)
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        import scipy.fft
+        return scipy.fft.ifft(x, axis=axis, workers=self.workers)
+
+    def __repr__(self) -> str:
+        return f"ScipyFFTBackend(workers={self.workers})"
+
+class PyFFTWBackend(FFTBackend):
+    """
+    pyFFTW (FFTW) with plans cached per array shape
+
+    Planning with FFTW_MEASURE is slow the first time a shape is seen but
+    gives the fastest transforms, especially for non-power-of-two sizes.
+    Accumulated wisdom can be exported and re-imported across sessions.
+    """
+    name = 'pyfftw'
+
+    def __init__(self, threads: Optional[int] = None, planner_effort: str = 'FFTW_MEASURE'):
+        """
+        Args:
+            threads: Number of threads (None: all CPUs)
+            planner_effort: FFTW planner flag
+        """
+        self.threads = threads if threads is not None else (os.cpu_count() or 1)
+        self.planner_effort = planner_effort
+        self._plans = {}
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pyfftw  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _plan(self, x: np.ndarray, axis: int, inverse: bool):
+        """Get (creating on first use) the FFTW plan for x's shape"""
+        key = (x.shape, x.dtype.str, axis % x.ndim, inverse)
+        plan = self._plans.get(key)
+        if plan is None:
+            import pyfftw.builders
+            builder = pyfftw.builders.ifft if inverse else pyfftw.builders.fft
+            plan = builder(np.empty(x.shape, dtype=x.dtype), axis=axis,
+                           threads=self.threads, planner_effort=self.planner_effort,
+                           overwrite_input=False, avoid_copy=False)
+            self._plans[key] = plan
+        return plan
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._plan(x, axis, inverse=False)(x).copy()
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._plan(x, axis, inverse=True)(x).copy()
+
+    def clone(self) -> 'PyFFTWBackend':
+        # FFTW plans own their buffers, so concurrent users need their own plans
+        return PyFFTWBackend(self.threads, self.planner_effort)
+
+    @staticmethod
+    def export_wisdom() -> Tuple[bytes, ...]:
+        """Get the FFTW wisdom accumulated by planning"""
+        import pyfftw
+        return pyfftw.export_wisdom()
+
+    @staticmethod
+    def import_wisdom(wisdom: Tuple[bytes, ...]):
+        """Load previously exported FFTW wisdom"""
+        import pyfftw
+        pyfftw.import_wisdom(wisdom)
+
+    def __getstate__(self) -> dict:
+        # Plans hold FFTW pointers; workers re-plan (cheap with wisdom)
+        state = self.__dict__.copy()
+        state['_plans'] = {}
+        return state
+
+    def __repr__(self) -> str:
+        return f"PyFFTWBackend(threads={self.threads}, planner_effort='{self.planner_effort}')"
+
+FFT_BACKENDS = {
+    'numpy': NumpyFFTBackend,
+    'scipy': ScipyFFTBackend,
+    'pyfftw': PyFFTWBackend,
+}
+
+# Order in which unavailable backends fall back
+FALLBACK_ORDER = ('pyfftw', 'scipy', 'numpy')
+
+_default_backend = NumpyFFTBackend()
+
+def get_fft_backend(backend: Union[str, FFTBackend, None] = None, **kwargs) -> FFTBackend:
+    """
+    Resolve an FFT backend
+
+    If the requested library is not installed, a warning is issued and the
+    next available backend in FALLBACK_ORDER is used instead.
+
+    Args:
+        backend: Backend name ('numpy', 'scipy', 'pyfftw'), instance, or None for the default
+        **kwargs: Constructor arguments of the backend (e.g. workers, threads)
+
+    Returns:
+        FFTBackend instance
+    """
+    if backend is None:
+        return _default_backend
+    if isinstance(backend, FFTBackend):
+        return backend
+    if backend not in FFT_BACKENDS:
+        raise ValueError(f"Invalid FFT backend: {backend}. Use one of {tuple(FFT_BACKENDS)}")
+
+    if not FFT_BACKENDS[backend].is_available():
+        fallback = next(name for name in FALLBACK_ORDER[FALLBACK_ORDER.index(backend) + 1:]
+                        if FFT_BACKENDS[name].is_available())
+        warnings.warn(f"FFT backend '{backend}' is not available, falling back to '{fallback}'")
+        backend, kwargs = fallback, {}
+
+    return FFT_BACKENDS[backend](**kwargs)
+
+def set_default_fft_backend(backend: Union[str, FFTBackend], **kwargs) -> FFTBackend:
+    """
+    Set the backend used by generators that were not given one
+
+    Args:
+        backend: Backend name or instance
+        **kwargs: Constructor arguments of the backend
+
+    Returns:
+        The new default backend
+    """
+    global _default_backend
+    _default_backend = get_fft_backend(backend, **kwargs)
+    return _default_backend
+
+def get_default_fft_backend() -> FFTBackend:
+    """Get the process-wide default FFT backend"""
+    return _default_backend
+
+def benchmark_fft_backends(n_fft: int,
+                           batch: int = 14,
+                           backends: Optional[Sequence[Union[str, FFTBackend]]] = None,
+                           repeat: int = 20) -> Dict[str, float]:
+    """
+    Time a batched IFFT of size n_fft with each available backend
+
+    Args:
+        n_fft: FFT size
+        batch: Number of transforms per call (14: one slot)
+        backends: Backends to try (default: all installed ones)
+        repeat: Number of timed calls per backend (best call is kept)
+
+    Returns:
+        Dictionary of backend name -> seconds per call
+    """
+    if backends is None:
+        backends = [name for name in FFT_BACKENDS if FFT_BACKENDS[name].is_available()]
+
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((batch, n_fft)) + 1j * rng.standard_normal((batch, n_fft))
+
+    timings = {}
+    for backend in backends:
+        backend = get_fft_backend(backend)
+        backend.ifft(x, axis=1)  # Warm-up (planning)
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            backend.ifft(x, axis=1)
+            best = min(best, time.perf_counter() - start)
+        timings[backend.name] = best
+
+    return timings
+
+def select_fastest_fft_backend(n_fft: int, batch: int = 14,
+                               set_default: bool = False) -> FFTBackend:
+    """
+    Pick the fastest installed backend for a given FFT size
+
+    Args:
+        n_fft: FFT size
+        batch: Number of transforms per call
+        set_default: If True, also make it the process-wide default
+
+    Returns:
+        Fastest FFTBackend
+    """
+    timings = benchmark_fft_backends(n_fft, batch)
+    fastest = get_fft_backend(min(timings, key=timings.get))
+    if set_default:
+        set_default_fft_backend(fastest)
+    return fastest
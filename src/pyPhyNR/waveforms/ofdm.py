@@ -4,7 +4,8 @@ OFDM parameter calculation for 5G NR
 
 from dataclasses import dataclass
 from typing import List, Literal
-from ..core.definitions import BASE_SCS, BASE_FFT, TC_SCALE, K_SCALE
+import numpy as np
+from ..core.definitions import BASE_SCS, BASE_FFT, TC_SCALE, K_SCALE, N_SYMBOLS_PER_SLOT
 
 @dataclass
 class OfdmParams:
@@ -95,6 +96,37 @@ def calculate_ofdm_params(fs_hz: float, mu: int, cp_type: Literal["normal","exte
     return OfdmParams(fs_hz, mu, scs_hz, N_useful, N_fft, cp_short, cp_long,
                       symbols_per_slot, 1e-3/(2**mu), cp_per_symbol)
 
+def get_subcarrier_bins(n_subcarriers: int, ofdm_params: OfdmParams) -> np.ndarray:
+    """
+    Get the FFT bin of each grid subcarrier
+
+    Equivalent to the zero-padding, centering circshift and ifftshift done
+    when a symbol is modulated; the demodulator reads the same bins back.
+
+    Args:
+        n_subcarriers: Number of subcarriers in the grid
+        ofdm_params: OFDM parameters
+
+    Returns:
+        Array of FFT bin indices, one per subcarrier
+    """
+    N_fft = ofdm_params.N_fft
+    shift_amount = round((N_fft - n_subcarriers) / 2)
+    return (np.arange(n_subcarriers) + shift_amount - N_fft // 2) % N_fft
+
+def get_symbol_offsets(ofdm_params: OfdmParams) -> np.ndarray:
+    """
+    Get the sample offset of each symbol (start of its CP) within a slot
+
+    Args:
+        ofdm_params: OFDM parameters
+
+    Returns:
+        Array of N_SYMBOLS_PER_SLOT + 1 offsets; the last one is the slot length
+    """
+    samples_per_symbol = np.asarray(ofdm_params.cp_per_symbol[:N_SYMBOLS_PER_SLOT]) + ofdm_params.N_fft
+    return np.concatenate([[0], np.cumsum(samples_per_symbol)])
+
 
 if __name__ == "__main__":
     # Test with standard FFT size
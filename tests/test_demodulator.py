@@ -0,0 +1,71 @@
+"""
+Round-trip tests of OfdmDemodulator against the transmitted resource grid
+"""
+
+import numpy as np
+import pytest
+from pyPhyNR.core.signal_builder import NRSignalBuilder
+from pyPhyNR.receiver import OfdmDemodulator
+
+TOLERANCE = {np.complex128: 1e-9, np.complex64: 1e-4}
+
+def build(dtype=np.complex128) -> NRSignalBuilder:
+    """20 MHz, 30 kHz carrier with a PDCCH and a PDSCH with DMRS"""
+    builder = NRSignalBuilder(bandwidth_mhz=20, numerology=1, cell_id=1, seed=42)
+    builder.configure_carrier(dtype=dtype).initialize_grid()
+    builder.add_coreset_pdcch(start_rb=0, num_rb=24, start_symbol=0, num_symbols=2,
+                              slot_pattern=list(range(20)))
+    builder.add_pdsch(start_rb=24, num_rb=27, start_symbol=2, num_symbols=12,
+                      slot_pattern=[0, 1, 5, 19], modulation="QAM64").add_dmrs()
+    return builder
+
+@pytest.mark.parametrize("dtype", [np.complex128, np.complex64])
+def test_demodulate_frame(dtype):
+    builder = build(dtype)
+    grid = OfdmDemodulator(builder.carrier_config).demodulate(builder.generate_signal())
+
+    assert grid.dtype == dtype
+    np.testing.assert_allclose(grid, builder.grid.values, rtol=0, atol=TOLERANCE[dtype])
+
+@pytest.mark.parametrize("dtype", [np.complex128, np.complex64])
+def test_demodulate_multiple_frames(dtype):
+    builder = build(dtype)
+    samples = np.concatenate(list(builder.stream_signal(n_frames=3, granularity='frame')))
+    grid = OfdmDemodulator(builder.carrier_config).demodulate(samples)
+
+    np.testing.assert_allclose(grid, np.tile(builder.grid.values, (1, 3)),
+                               rtol=0, atol=TOLERANCE[dtype])
+
+def test_demodulate_n_slots():
+    builder = build()
+    demodulator = OfdmDemodulator(builder.carrier_config)
+    grid = demodulator.demodulate(builder.generate_signal(), n_slots=3)
+
+    np.testing.assert_allclose(grid, builder.grid.values[:, :3 * 14], rtol=0, atol=1e-9)
+    with pytest.raises(ValueError):
+        demodulator.demodulate(builder.generate_signal()[:demodulator.slot_length], n_slots=2)
+
+@pytest.mark.parametrize("chunk_size,slots_per_output", [(1000, 1), (7919, 3), (123457, 4)])
+def test_stream_odd_chunks(chunk_size, slots_per_output):
+    builder = build()
+    demodulator = OfdmDemodulator(builder.carrier_config)
+    samples = builder.generate_signal()
+    # A trailing partial slot is dropped
+    samples = np.concatenate([samples, samples[:demodulator.slot_length // 2]])
+    chunks = (samples[start:start + chunk_size] for start in range(0, samples.size, chunk_size))
+
+    blocks = list(demodulator.stream(chunks, slots_per_output))
+
+    n_slots = builder.grid.values.shape[1] // 14
+    assert [slot for slot, _ in blocks] == list(range(0, n_slots, slots_per_output))
+    grid = np.concatenate([block for _, block in blocks], axis=1)
+    np.testing.assert_allclose(grid, builder.grid.values, rtol=0, atol=1e-9)
+
+def test_stream_reused_buffer():
+    builder = build()
+    demodulator = OfdmDemodulator(builder.carrier_config)
+    chunks = builder.stream_signal(n_frames=2, granularity='symbol', reuse_buffer=True)
+
+    grid = np.concatenate([block for _, block in demodulator.stream(chunks, slots_per_output=2)], axis=1)
+
+    np.testing.assert_allclose(grid, np.tile(builder.grid.values, (1, 2)), rtol=0, atol=1e-9)